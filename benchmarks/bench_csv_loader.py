@@ -0,0 +1,162 @@
+"""benchmarks/bench_csv_loader.py
+
+Compares CsvLoader's row mode against the previous df.iterrows()
+rendering on a synthetic CSV export, and reports the peak traced
+memory of streaming with lazy_load(chunksize=...). With --markdown,
+compares tabulate tables against the native Markdown renderer. With
+--lazy, compares eager row Documents against LazyTableDocuments on a
+wide table where only a few rows are read afterwards.
+
+Usage:
+    python benchmarks/bench_csv_loader.py --rows 1000000
+"""
+
+import argparse
+import random
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import pandas as pd
+
+from pydocstruct.loaders.csv_loader import CsvLoader
+
+
+def write_csv(path: Path, rows: int, seed: int = 0) -> None:
+    rng = random.Random(seed)
+    with open(path, "w", encoding="utf-8") as file:
+        file.write("id,name,category,price,quantity,updated_at\n")
+        for i in range(rows):
+            file.write(
+                f"{i},item {i},cat{rng.randrange(20)},{rng.random() * 100:.2f},"
+                f"{rng.randrange(1000)},2024-01-{rng.randrange(1, 29):02d}\n"
+            )
+
+
+def write_wide_csv(
+    path: Path, rows: int, columns: int = 40, seed: int = 0
+) -> None:
+    rng = random.Random(seed)
+    with open(path, "w", encoding="utf-8") as file:
+        file.write(",".join(f"attribute_{c}" for c in range(columns)) + "\n")
+        for _ in range(rows):
+            file.write(
+                ",".join(str(rng.randrange(100_000)) for _ in range(columns))
+                + "\n"
+            )
+
+
+def bench_lazy(label: str, path: Path, **options) -> None:
+    def run() -> int:
+        docs = CsvLoader(path, **options).load()
+        # Downstream filter: read the content of every 100th Document only
+        return sum(len(doc.content) for doc in docs[::100])
+
+    start = time.perf_counter()
+    run()
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<28} {elapsed:8.2f} s  peak {peak / (1024 * 1024):7.1f} MB")
+
+
+def legacy_rows(path: Path) -> list[str]:
+    df = pd.read_csv(path)
+    return [
+        "\n".join([f"{col}: {val}" for col, val in row.items()])
+        for _, row in df.iterrows()
+    ]
+
+
+def bench(label: str, fn) -> None:
+    start = time.perf_counter()
+    count = len(fn())
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28} {elapsed:8.2f} s  {count} documents")
+
+
+def bench_stream(label: str, path: Path, **options) -> None:
+    start = time.perf_counter()
+    count = sum(1 for _ in CsvLoader(path, **options).lazy_load())
+    elapsed = time.perf_counter() - start
+
+    # Memory is measured in a separate run, as tracing slows allocation down
+    tracemalloc.start()
+    for _ in CsvLoader(path, **options).lazy_load():
+        pass
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"{label:<28} {elapsed:8.2f} s  {count} documents  peak {peak / (1024 * 1024):7.1f} MB"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--chunksize", type=int, default=50_000)
+    parser.add_argument("--skip-legacy", action="store_true")
+    parser.add_argument("--markdown", action="store_true")
+    parser.add_argument("--lazy", action="store_true")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "export.csv"
+        write_csv(path, args.rows)
+
+        if args.lazy:
+            wide = Path(tmp) / "wide.csv"
+            write_wide_csv(wide, args.rows)
+            bench_lazy("wide, eager", wide)
+            bench_lazy("wide, lazy", wide, lazy=True)
+            return
+
+        if args.markdown:
+            bench(
+                "markdown, tabulate",
+                lambda: CsvLoader(path, output_format="markdown").load(),
+            )
+            bench(
+                "markdown, native",
+                lambda: CsvLoader(
+                    path, output_format="markdown", markdown_renderer="native"
+                ).load(),
+            )
+            bench_stream(
+                "markdown, native 50 rows",
+                path,
+                output_format="markdown",
+                max_table_rows=50,
+                chunksize=args.chunksize,
+            )
+            return
+
+        if not args.skip_legacy:
+            bench("iterrows (legacy)", lambda: legacy_rows(path))
+        bench("row mode", lambda: CsvLoader(path).load())
+        bench(
+            "row mode, 100 rows/doc",
+            lambda: CsvLoader(path, rows_per_document=100).load(),
+        )
+        bench_stream("lazy_load, whole file", path, rows_per_document=100)
+        bench_stream(
+            "lazy_load, chunksize",
+            path,
+            rows_per_document=100,
+            chunksize=args.chunksize,
+        )
+        bench_stream(
+            "lazy_load, chunksize+usecols",
+            path,
+            rows_per_document=100,
+            chunksize=args.chunksize,
+            usecols=["id", "name", "price"],
+        )
+
+
+if __name__ == "__main__":
+    main()
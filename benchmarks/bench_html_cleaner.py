@@ -0,0 +1,145 @@
+"""benchmarks/bench_html_cleaner.py
+
+Compares the single-traversal HtmlNoiseCleaner with the previous
+multi-pass implementation (one find_all walk per noise tag, semantic tag,
+class and id), with both parser backends.
+
+Pages are read from a directory of crawled .html files when --corpus is
+given, otherwise a synthetic corpus of article-like pages is generated.
+
+Usage:
+    python benchmarks/bench_html_cleaner.py --pages 200
+    python benchmarks/bench_html_cleaner.py --corpus path/to/crawl
+"""
+
+import argparse
+import random
+import re
+import time
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+from pydocstruct.processors.html_cleaner import HtmlNoiseCleaner
+
+
+def make_page(rng: random.Random) -> str:
+    words = [
+        "lorem",
+        "ipsum",
+        "dolor",
+        "sit",
+        "amet",
+        "document",
+        "vector",
+        "chunk",
+    ]
+
+    def sentence(n: int) -> str:
+        return " ".join(rng.choice(words) for _ in range(n))
+
+    nav = "".join(
+        f"<li><a href='/p{i}'>{sentence(2)}</a></li>" for i in range(30)
+    )
+    sections = []
+    for i in range(rng.randint(10, 30)):
+        paragraphs = "".join(
+            f"<p class='text'>{sentence(40)} <a href='#'>{sentence(2)}</a> "
+            f"<em>{sentence(3)}</em></p>"
+            for _ in range(rng.randint(2, 6))
+        )
+        ad = (
+            f"<div class='ad-slot'><iframe src='/ad{i}'></iframe></div>"
+            if i % 4 == 0
+            else ""
+        )
+        sections.append(
+            f"<section id='s{i}'><h2>{sentence(4)}</h2>"
+            f"<div class='body'>{paragraphs}</div>{ad}</section>"
+        )
+
+    return (
+        "<html><head><title>Page</title><style>body{}</style>"
+        "<script>var x = 1;</script></head><body>"
+        f"<header class='site-header'><nav><ul>{nav}</ul></nav></header>"
+        f"<main><article>{''.join(sections)}</article></main>"
+        f"<aside class='sidebar'><ul>{nav}</ul></aside>"
+        "<div id='cookie-consent'><p>We use cookies</p></div>"
+        f"<footer><p>{sentence(20)}</p></footer>"
+        "</body></html>"
+    )
+
+
+def legacy_clean(html_content: str) -> str:
+    soup = BeautifulSoup(html_content, "html.parser")
+    for tag in HtmlNoiseCleaner.NOISE_TAGS:
+        for element in soup.find_all(tag):
+            element.decompose()
+    for tag in ["header", "footer", "nav", "aside"]:
+        for element in soup.find_all(tag):
+            element.decompose()
+    for element in soup.find_all(attrs={"class": True}):
+        classes = element.get("class")
+        if isinstance(classes, list):
+            classes = " ".join(classes)
+        if any(
+            noise in classes.lower()
+            for noise in HtmlNoiseCleaner.NOISE_CLASSES
+        ):
+            element.decompose()
+    for element in soup.find_all(attrs={"id": True}):
+        id_val = element.get("id")
+        if not isinstance(id_val, str):
+            continue
+        if any(
+            noise in id_val.lower() for noise in HtmlNoiseCleaner.NOISE_CLASSES
+        ):
+            element.decompose()
+    text = soup.get_text(separator="\n", strip=True)
+    return re.sub(r"\n{3,}", "\n\n", text)
+
+
+def bench(label: str, func, pages: list[str], repeat: int) -> None:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for page in pages:
+            func(page)
+        best = min(best, time.perf_counter() - start)
+    mb = sum(len(page) for page in pages) / (1024 * 1024)
+    print(
+        f"{label:<28} {best * 1000:9.1f} ms  "
+        f"{len(pages) / best:8.1f} pages/s  {mb / best:6.2f} MB/s"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--corpus", type=Path, help="Directory of crawled .html files"
+    )
+    parser.add_argument("--pages", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    if args.corpus:
+        pages = [
+            path.read_text(encoding="utf-8", errors="replace")
+            for path in sorted(args.corpus.rglob("*.htm*"))[: args.pages]
+        ]
+    else:
+        rng = random.Random(0)
+        pages = [make_page(rng) for _ in range(args.pages)]
+
+    bench("multi-pass (html.parser)", legacy_clean, pages, args.repeat)
+    bench("one-pass (html.parser)", HtmlNoiseCleaner.clean, pages, args.repeat)
+    bench(
+        "one-pass (lxml)",
+        lambda page: HtmlNoiseCleaner.clean(page, parser="lxml"),
+        pages,
+        args.repeat,
+    )
+
+
+if __name__ == "__main__":
+    main()
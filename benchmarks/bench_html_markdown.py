@@ -0,0 +1,73 @@
+"""benchmarks/bench_html_markdown.py
+
+Compares HtmlLoader(preserve_structure=True) with the markdownify
+renderer against the native streaming renderer on one large page,
+reporting time and peak traced memory.
+
+Usage:
+    python benchmarks/bench_html_markdown.py --size-mb 10
+"""
+
+import argparse
+import random
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from bench_html_cleaner import make_page
+
+from pydocstruct.loaders.html_loader import HtmlLoader
+
+
+def make_large_page(size_mb: float, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    bodies = []
+    size = 0
+    while size < size_mb * 1024 * 1024:
+        page = make_page(rng)
+        body = page.split("<body>", 1)[1].rsplit("</body>", 1)[0]
+        bodies.append(body)
+        size += len(body)
+    return f"<html><head><title>Large</title></head><body>{''.join(bodies)}</body></html>"
+
+
+def bench(label: str, path: Path, **options) -> None:
+    start = time.perf_counter()
+    [doc] = HtmlLoader(path, preserve_structure=True, **options).load()
+    elapsed = time.perf_counter() - start
+
+    # Memory is measured in a separate run, as tracing slows allocation down
+    tracemalloc.start()
+    HtmlLoader(path, preserve_structure=True, **options).load()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    mb = path.stat().st_size / (1024 * 1024)
+    print(
+        f"{label:<24} {elapsed * 1000:9.1f} ms  {mb / elapsed:6.2f} MB/s  "
+        f"peak {peak / (1024 * 1024):7.1f} MB  output {len(doc.content) / (1024 * 1024):5.2f} MB"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size-mb", type=float, default=10.0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "large.html"
+        path.write_text(make_large_page(args.size_mb), encoding="utf-8")
+
+        bench("markdownify", path)
+        bench("native", path, markdown_renderer="native")
+        bench(
+            "native + remove_noise",
+            path,
+            markdown_renderer="native",
+            remove_noise=True,
+        )
+
+
+if __name__ == "__main__":
+    main()
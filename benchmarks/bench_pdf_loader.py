@@ -0,0 +1,81 @@
+"""benchmarks/bench_pdf_loader.py
+
+Measures PDFLoader text extraction on a synthetic text-layer PDF,
+sequentially and with page ranges spread over worker processes, and
+the cost of previewing the first pages with max_pages.
+
+Usage:
+    python benchmarks/bench_pdf_loader.py --pages 500 --workers 4
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import pypdf
+from pypdf.generic import DecodedStreamObject, DictionaryObject, NameObject
+
+from pydocstruct.loaders.pdf_loader import PDFLoader
+
+
+def write_pdf(path: Path, pages: int, lines: int = 40) -> None:
+    writer = pypdf.PdfWriter()
+    font = writer._add_object(
+        DictionaryObject(
+            {
+                NameObject("/Type"): NameObject("/Font"),
+                NameObject("/Subtype"): NameObject("/Type1"),
+                NameObject("/BaseFont"): NameObject("/Helvetica"),
+            }
+        )
+    )
+    for p in range(pages):
+        ops = ["BT /F1 10 Tf 12 TL 72 750 Td"]
+        for line in range(lines):
+            ops.append(
+                f"(Section {p}.{line}: the reporting entity shall disclose the following items) '"
+            )
+        ops.append("ET")
+
+        page = writer.add_blank_page(612, 792)
+        stream = DecodedStreamObject()
+        stream.set_data("\n".join(ops).encode())
+        page[NameObject("/Contents")] = writer._add_object(stream)
+        page[NameObject("/Resources")] = DictionaryObject(
+            {
+                NameObject("/Font"): DictionaryObject(
+                    {NameObject("/F1"): font}
+                ),
+            }
+        )
+    writer.add_metadata({"/Title": "Synthetic filing"})
+    writer.write(path)
+
+
+def bench(label: str, path: Path, **options) -> None:
+    start = time.perf_counter()
+    docs = PDFLoader(path, **options).load()
+    elapsed = time.perf_counter() - start
+    print(
+        f"{label:<24} {elapsed:8.2f} s  {len(docs)} pages  {len(docs) / elapsed:8.1f} pages/s"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pages", type=int, default=500)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "filing.pdf"
+        write_pdf(path, args.pages)
+
+        bench("preview, max_pages=5", path, max_pages=5)
+        bench("sequential", path)
+        bench(f"{args.workers} workers", path, num_workers=args.workers)
+
+
+if __name__ == "__main__":
+    main()
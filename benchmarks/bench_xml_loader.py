@@ -0,0 +1,59 @@
+"""benchmarks/bench_xml_loader.py
+
+Measures the throughput of XmlLoader's streaming record mode on a
+synthetic MediaWiki-style export.
+
+Usage:
+    python benchmarks/bench_xml_loader.py --records 100000
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from pydocstruct.loaders.xml_loader import XmlLoader
+
+
+def write_dump(path: Path, records: int) -> None:
+    text = "lorem ipsum dolor sit amet " * 40
+    with open(path, "w", encoding="utf-8") as file:
+        file.write(
+            '<mediawiki xmlns="http://www.mediawiki.org/xml/export-0.10/">'
+        )
+        for i in range(records):
+            file.write(
+                f"<page><title>Page {i}</title><id>{i}</id><revision>"
+                f"<timestamp>2024-01-01T00:00:00Z</timestamp><text>{text}</text>"
+                "</revision></page>"
+            )
+        file.write("</mediawiki>")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, default=100_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "dump.xml"
+        write_dump(path, args.records)
+
+        loader = XmlLoader(
+            path,
+            record_tag="mediawiki/page",
+            content_fields=["revision/text"],
+            metadata_fields=["title", "id", "revision/timestamp"],
+        )
+        start = time.perf_counter()
+        count = sum(1 for _ in loader.lazy_load())
+        elapsed = time.perf_counter() - start
+
+        mb = path.stat().st_size / (1024 * 1024)
+        print(
+            f"{count} records  {mb:.1f} MB  {elapsed:.2f} s  {mb / elapsed:.1f} MB/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
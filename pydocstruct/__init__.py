@@ -1,4 +1,5 @@
 """pydocstruct"""
+
 from pathlib import Path
 from typing import Any
 
@@ -6,7 +7,16 @@ from pydocstruct.__version__ import __version__
 from pydocstruct.core import (
     BaseChunker,
     BaseLoader,
+    ChunkDiff,
+    ChunkRecord,
+    ColumnarTable,
+    ContentDefinedChunker,
     Document,
+    EmbeddingBatch,
+    EmbeddingBatcher,
+    IncrementalChunker,
+    LazyTableDocument,
+    MarkdownChunker,
     RecursiveCharacterChunker,
     TextChunker,
     TokenChunker,
@@ -23,12 +33,19 @@ from pydocstruct.loaders import (
     XmlLoader,
 )
 from pydocstruct.processors import (
+    CleanerPipeline,
+    HtmlMarkdownRenderer,
     HtmlNoiseCleaner,
     MetadataExtractor,
+    PiiRedactionEngine,
     PiiRedactor,
     TextCleaner,
 )
-from pydocstruct.utils import get_file_extension, get_mime_type, is_supported_format
+from pydocstruct.utils import (
+    get_file_extension,
+    get_mime_type,
+    is_supported_format,
+)
 
 __all__ = [
     "load",
@@ -39,6 +56,15 @@ __all__ = [
     "TextChunker",
     "RecursiveCharacterChunker",
     "TokenChunker",
+    "ContentDefinedChunker",
+    "MarkdownChunker",
+    "EmbeddingBatch",
+    "EmbeddingBatcher",
+    "IncrementalChunker",
+    "ChunkDiff",
+    "ChunkRecord",
+    "ColumnarTable",
+    "LazyTableDocument",
     "BaseLoader",
     # Loaders
     "CsvLoader",
@@ -52,9 +78,12 @@ __all__ = [
     "XmlLoader",
     # Processors
     "TextCleaner",
+    "CleanerPipeline",
     "MetadataExtractor",
     "PiiRedactor",
+    "PiiRedactionEngine",
     "HtmlNoiseCleaner",
+    "HtmlMarkdownRenderer",
     # Utils
     "get_file_extension",
     "get_mime_type",
@@ -92,6 +121,8 @@ def load(file_path: str | Path, **kwargs: Any) -> list[Document]:
         "txt": TextLoader,
         "text": TextLoader,
         "json": JsonLoader,
+        "jsonl": JsonLoader,
+        "ndjson": JsonLoader,
         "csv": CsvLoader,
         "xls": ExcelLoader,
         "xlsx": ExcelLoader,
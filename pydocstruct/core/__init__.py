@@ -1,18 +1,37 @@
 """Core modules for pydocstruct"""
+
+from pydocstruct.core.batcher import EmbeddingBatch, EmbeddingBatcher
 from pydocstruct.core.chunker import (
     BaseChunker,
+    ContentDefinedChunker,
+    MarkdownChunker,
     RecursiveCharacterChunker,
     TextChunker,
     TokenChunker,
 )
 from pydocstruct.core.document import Document
+from pydocstruct.core.incremental import (
+    ChunkDiff,
+    ChunkRecord,
+    IncrementalChunker,
+)
 from pydocstruct.core.loader import BaseLoader
+from pydocstruct.core.table import ColumnarTable, LazyTableDocument
 
 __all__ = [
     "BaseChunker",
     "TextChunker",
     "RecursiveCharacterChunker",
     "TokenChunker",
+    "ContentDefinedChunker",
+    "MarkdownChunker",
+    "EmbeddingBatch",
+    "EmbeddingBatcher",
+    "IncrementalChunker",
+    "ChunkDiff",
+    "ChunkRecord",
     "Document",
+    "ColumnarTable",
+    "LazyTableDocument",
     "BaseLoader",
 ]
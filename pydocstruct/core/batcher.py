@@ -0,0 +1,230 @@
+"""pydocstruct/core/batcher.py"""
+
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Any
+
+from pydocstruct.core.chunker import TokenChunker
+from pydocstruct.core.document import Document
+
+
+@dataclass
+class EmbeddingBatch:
+    """A group of chunk Documents sent to an embedder in one call
+
+    Attributes:
+        documents (list[Document]): Documents in the batch
+        token_counts (list[int]): Token count of each document (same order)
+    """
+
+    documents: list[Document] = field(default_factory=list)
+    token_counts: list[int] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    @property
+    def texts(self) -> list[str]:
+        """Contents of the documents, ready to pass to an embedder"""
+        return [doc.content for doc in self.documents]
+
+    @property
+    def total_tokens(self) -> int:
+        """Sum of the token counts in the batch"""
+        return sum(self.token_counts)
+
+    @property
+    def padded_tokens(self) -> int:
+        """Tokens processed when every item is padded to the longest one"""
+        return max(self.token_counts, default=0) * len(self.token_counts)
+
+
+class EmbeddingBatcher:
+    """Packs chunk Documents into batches for embedding
+
+    Batches are bounded by the number of items and by the total number of
+    tokens. Token counts come from a `TokenChunker` encoding unless a
+    custom length function is given.
+
+    Strategies:
+        "first_fit_decreasing": Bin packing over items sorted by length.
+            Produces the fewest batches (fewest API requests).
+        "sorted": Length-sorted items cut into consecutive batches.
+            Items of similar length share a batch, minimizing padding
+            for local models.
+        "sequential": Input order is preserved.
+
+    Attributes:
+        max_batch_size (int): Maximum number of documents per batch
+        max_batch_tokens (int): Maximum total tokens per batch
+        strategy (str): Packing strategy
+        window_size (int | None): Number of documents planned together
+            when consuming a stream (None plans the whole input at once)
+    """
+
+    STRATEGIES = ("first_fit_decreasing", "sorted", "sequential")
+
+    def __init__(
+        self,
+        max_batch_size: int = 64,
+        max_batch_tokens: int = 8192,
+        strategy: str = "first_fit_decreasing",
+        window_size: int | None = None,
+        length_function: Callable[[str], int] | None = None,
+        model_name: str = "gpt-3.5-turbo",
+        encoding_name: str = "cl100k_base",
+    ) -> None:
+        if strategy not in self.STRATEGIES:
+            raise ValueError(
+                f"Unknown strategy: {strategy}. "
+                f"Expected one of {', '.join(self.STRATEGIES)}"
+            )
+        if max_batch_size < 1 or max_batch_tokens < 1:
+            raise ValueError(
+                "max_batch_size and max_batch_tokens must be positive"
+            )
+        if window_size is not None and window_size < 1:
+            raise ValueError(
+                f"window_size must be positive, got {window_size}"
+            )
+
+        self.max_batch_size = max_batch_size
+        self.max_batch_tokens = max_batch_tokens
+        self.strategy = strategy
+        self.window_size = window_size
+
+        if length_function is None:
+            chunker = TokenChunker(
+                model_name=model_name, encoding_name=encoding_name
+            )
+            length_function = chunker.count_tokens
+        self.length_function = length_function
+
+    @classmethod
+    def from_token_chunker(
+        cls,
+        chunker: TokenChunker,
+        **kwargs: Any,
+    ) -> "EmbeddingBatcher":
+        """Create a batcher that counts tokens with the chunker's encoding
+
+        Args:
+            chunker (TokenChunker): Chunker used to split the documents
+            **kwargs: Other EmbeddingBatcher options
+
+        Returns:
+            EmbeddingBatcher: Batcher sharing the chunker's encoding
+        """
+        return cls(length_function=chunker.count_tokens, **kwargs)
+
+    def plan(self, documents: Iterable[Document]) -> list[EmbeddingBatch]:
+        """Pack documents into batches
+
+        Args:
+            documents (Iterable[Document]): Chunked documents
+
+        Returns:
+            list[EmbeddingBatch]: Planned batches
+        """
+        return list(self.iter_batches(documents))
+
+    def iter_batches(
+        self, documents: Iterable[Document]
+    ) -> Iterator[EmbeddingBatch]:
+        """Pack a stream of documents into batches
+
+        With window_size set, at most window_size documents are held in
+        memory and packed together before their batches are yielded.
+
+        Args:
+            documents (Iterable[Document]): Chunked documents
+
+        Yields:
+            EmbeddingBatch: Planned batches
+        """
+        iterator = iter(documents)
+
+        while True:
+            window = list(islice(iterator, self.window_size))
+            if not window:
+                return
+
+            items = [
+                (doc, self.length_function(doc.content)) for doc in window
+            ]
+            yield from self._pack(items)
+
+            if self.window_size is None:
+                return
+
+    def _pack(self, items: list[tuple[Document, int]]) -> list[EmbeddingBatch]:
+        if self.strategy == "first_fit_decreasing":
+            return self._first_fit(
+                sorted(items, key=lambda item: item[1], reverse=True)
+            )
+        if self.strategy == "sorted":
+            return self._next_fit(sorted(items, key=lambda item: item[1]))
+        return self._next_fit(items)
+
+    def _first_fit(
+        self, items: list[tuple[Document, int]]
+    ) -> list[EmbeddingBatch]:
+        batches: list[EmbeddingBatch] = []
+        # Running totals avoid re-summing token counts for every candidate
+        totals: list[int] = []
+        # Indices of batches that still accept items
+        open_batches: list[int] = []
+
+        for doc, tokens in items:
+            target = None
+            for position, batch_index in enumerate(open_batches):
+                if totals[batch_index] + tokens <= self.max_batch_tokens:
+                    target = batch_index
+                    break
+
+            if target is None:
+                # Oversized items still get a batch of their own
+                batches.append(EmbeddingBatch())
+                totals.append(0)
+                target = len(batches) - 1
+                open_batches.append(target)
+                position = len(open_batches) - 1
+
+            batch = batches[target]
+            batch.documents.append(doc)
+            batch.token_counts.append(tokens)
+            totals[target] += tokens
+
+            if (
+                len(batch) >= self.max_batch_size
+                or totals[target] >= self.max_batch_tokens
+            ):
+                open_batches.pop(position)
+
+        return batches
+
+    def _next_fit(
+        self, items: list[tuple[Document, int]]
+    ) -> list[EmbeddingBatch]:
+        batches: list[EmbeddingBatch] = []
+        current = EmbeddingBatch()
+        total = 0
+
+        for doc, tokens in items:
+            if current.documents and (
+                len(current) >= self.max_batch_size
+                or total + tokens > self.max_batch_tokens
+            ):
+                batches.append(current)
+                current = EmbeddingBatch()
+                total = 0
+
+            current.documents.append(doc)
+            current.token_counts.append(tokens)
+            total += tokens
+
+        if current.documents:
+            batches.append(current)
+
+        return batches
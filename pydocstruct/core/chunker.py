@@ -1,6 +1,14 @@
 """pydocstruct/core/chunker.py"""
+
+import hashlib
+import math
+import random
 import re
 from abc import ABC, abstractmethod
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterator
+from dataclasses import dataclass, field
 from typing import Any
 
 try:
@@ -10,6 +18,8 @@ except ImportError:
 
 from pydocstruct.core.document import Document
 
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
 
 class BaseChunker(ABC):
     """Base class for chunkers"""
@@ -24,14 +34,14 @@ class BaseChunker(ABC):
             list[Document]: List of chunked documents
         """
         chunked_documents = []
-        
+
         for doc in documents:
             chunks = self.split_text(doc.content)
-            
+
             for idx, chunk in enumerate(chunks):
                 chunk_metadata = doc.metadata.copy()
                 chunk_metadata["chunk_total"] = len(chunks)
-                
+
                 chunked_doc = Document(
                     content=chunk,
                     metadata=chunk_metadata,
@@ -40,19 +50,34 @@ class BaseChunker(ABC):
                     page_number=doc.page_number,
                     chunk_index=idx,
                 )
-                
+
                 chunked_documents.append(chunked_doc)
-        
+
         return chunked_documents
 
     @abstractmethod
-    def split_text(self, text: str) -> list[str]:
-        ...
+    def split_text(self, text: str) -> list[str]: ...
+
+
+# Chunk ends: before a space, or right after sentence/clause punctuation.
+# CJK punctuation is included because CJK text has no spaces to split on.
+_BOUNDARY_PATTERN = re.compile(r"(?= )|(?<=[、。，．！？；：…」』）])")
 
 
 class TextChunker(BaseChunker):
-    """Simple character-count based chunker"""
-    
+    """Simple character-count based chunker
+
+    Whitespace is normalized to single spaces, then chunk ends are looked
+    up by bisection in a precomputed index of word and sentence
+    boundaries, so splitting runs in linear time even for very large
+    inputs or text without spaces. A chunk is cut hard at chunk_size only
+    when its window contains no boundary.
+
+    Normalization and indexing are two C-level regex scans (re.sub, then
+    finditer over the normalized copy) rather than one scan: a combined
+    scan needs Python code per match and is slower in CPython.
+    """
+
     def __init__(
         self,
         chunk_size: int = 1000,
@@ -62,47 +87,59 @@ class TextChunker(BaseChunker):
         self.chunk_size = chunk_size
         self.chunk_overlap = chunk_overlap
         self.separator = separator
-    
+
     def split_text(self, text: str) -> list[str]:
-        text = re.sub(r'\s+', ' ', text).strip()
-        
+        text = _WHITESPACE_PATTERN.sub(" ", text).strip()
+
         if len(text) <= self.chunk_size:
             return [text]
-        
+
+        boundaries = array(
+            "q", (m.start() for m in _BOUNDARY_PATTERN.finditer(text))
+        )
+
         chunks = []
+        length = len(text)
         start_index = 0
-        
-        while start_index < len(text):
+
+        while start_index < length:
             end_index = start_index + self.chunk_size
-            
-            if end_index >= len(text):
-                chunks.append(text[start_index:])
+
+            if end_index >= length:
+                chunk = text[start_index:].strip()
+                if chunk:
+                    chunks.append(chunk)
                 break
-            
-            chunk_text = text[start_index:end_index]
-            last_space = chunk_text.rfind(' ')
 
-            # last_space > 0 to avoid end_index == start_index, which causes regression
-            if last_space > 0:
-                end_index = start_index + last_space
+            # Last boundary within the window
+            i = bisect_right(boundaries, end_index) - 1
+            if i >= 0 and boundaries[i] > start_index:
+                end_index = boundaries[i]
 
             chunk = text[start_index:end_index].strip()
             if chunk:
                 chunks.append(chunk)
 
             next_start = end_index - self.chunk_overlap
-            # Guarantee forward progress to prevent infinite regression
-            start_index = max(next_start, start_index + 1)
-        
+            if next_start <= start_index:
+                next_start = end_index
+            else:
+                # Begin the overlap at a boundary rather than mid-word
+                j = bisect_left(boundaries, next_start)
+                if j < len(boundaries) and boundaries[j] < end_index:
+                    next_start = boundaries[j]
+            start_index = next_start
+
         return chunks
 
 
 class RecursiveCharacterChunker(BaseChunker):
     """Recursive character-based chunker
-    
-    Attempts to split text by largest separators first to preserve meaningful chunks.
+
+    Attempts to split text by largest separators first to preserve
+    meaningful chunks.
     """
-    
+
     def __init__(
         self,
         chunk_size: int = 1000,
@@ -112,7 +149,7 @@ class RecursiveCharacterChunker(BaseChunker):
         self.chunk_size = chunk_size
         self.chunk_overlap = chunk_overlap
         self.separators = separators or ["\n\n", "\n", " ", ""]
-        
+
     def split_text(self, text: str) -> list[str]:
         return self._split_text(text, self.separators)
 
@@ -120,26 +157,26 @@ class RecursiveCharacterChunker(BaseChunker):
         # Determine separator to use
         separator = separators[-1]
         new_separators = []
-        
+
         for i, sep in enumerate(separators):
             if sep == "":
                 separator = sep
                 break
             if sep in text:
                 separator = sep
-                new_separators = separators[i + 1:]
+                new_separators = separators[i + 1 :]
                 break
-                
+
         # Split by separator
         if separator:
             splits = text.split(separator)
         else:
-            splits = list(text) # Character level
-            
+            splits = list(text)  # Character level
+
         # Recombine and verify
         good_splits = []
         _separator = separator if separator else ""
-        
+
         for split in splits:
             if not split:
                 continue
@@ -149,46 +186,56 @@ class RecursiveCharacterChunker(BaseChunker):
                 if new_separators:
                     good_splits.extend(self._split_text(split, new_separators))
                 else:
-                    # No separators remain; fall back to character-level splitting
+                    # No separators remain; fall back to splitting characters
                     good_splits.extend(self._split_text(split, [""]))
-                    
+
         return self._merge_splits(good_splits, _separator)
 
     def _merge_splits(self, splits: list[str], separator: str) -> list[str]:
         chunks = []
         current_doc = []
         total_len = 0
-        
+
         for split in splits:
             _len = len(split)
-            if total_len + _len + (len(separator) if current_doc else 0) > self.chunk_size:
+            if (
+                total_len + _len + (len(separator) if current_doc else 0)
+                > self.chunk_size
+            ):
                 if current_doc:
                     doc = separator.join(current_doc)
                     if doc.strip():
                         chunks.append(doc)
-                    
+
                     while total_len > self.chunk_overlap and current_doc:
-                        total_len -= len(current_doc[0]) + (len(separator) if len(current_doc) > 1 else 0)
+                        total_len -= len(current_doc[0]) + (
+                            len(separator) if len(current_doc) > 1 else 0
+                        )
                         current_doc.pop(0)
 
-                # Append new split to overlap-retained items (fixes: overlap was discarded)
+                # Append new split to overlap-retained items
+                # (fixes: overlap was discarded)
                 current_doc.append(split)
-                total_len += (len(separator) if len(current_doc) > 1 else 0) + len(split)
+                total_len += (
+                    len(separator) if len(current_doc) > 1 else 0
+                ) + len(split)
             else:
                 current_doc.append(split)
-                total_len += _len + (len(separator) if len(current_doc) > 1 else 0)
-                
+                total_len += _len + (
+                    len(separator) if len(current_doc) > 1 else 0
+                )
+
         if current_doc:
             doc = separator.join(current_doc)
             if doc.strip():
                 chunks.append(doc)
-                
+
         return chunks
 
 
 class TokenChunker(BaseChunker):
     """Token-count based chunker (uses tiktoken)"""
-    
+
     def __init__(
         self,
         chunk_size: int = 500,
@@ -199,35 +246,540 @@ class TokenChunker(BaseChunker):
         self.chunk_size = chunk_size
         self.chunk_overlap = chunk_overlap
         self.model_name = model_name
-        
+
         if tiktoken is None:
-            raise ImportError("tiktoken is not installed. Please install it with `pip install tiktoken`.")
-            
+            raise ImportError(
+                "tiktoken is not installed. "
+                "Please install it with `pip install tiktoken`."
+            )
+
         try:
             self.encoding = tiktoken.encoding_for_model(model_name)
         except KeyError:
             self.encoding = tiktoken.get_encoding(encoding_name)
 
+    def count_tokens(self, text: str) -> int:
+        """Return the number of tokens in text under this chunker's encoding"""
+        return len(self.encoding.encode(text))
+
     def split_text(self, text: str) -> list[str]:
         tokens = self.encoding.encode(text)
-        
+
         if len(tokens) <= self.chunk_size:
             return [text]
-            
+
         chunks = []
         start_index = 0
-        
+
         while start_index < len(tokens):
             end_index = start_index + self.chunk_size
-            
+
             chunk_tokens = tokens[start_index:end_index]
             chunk_text = self.encoding.decode(chunk_tokens)
             chunks.append(chunk_text)
-            
+
             if end_index >= len(tokens):
                 break
-                
+
             start_index = end_index - self.chunk_overlap
-            
+
         return chunks
 
+
+def _build_gear_table() -> tuple[int, ...]:
+    # Fixed seed: boundaries must not change between runs or releases
+    rng = random.Random(0x5EED_CDC)
+    return tuple(rng.getrandbits(64) for _ in range(256))
+
+
+_GEAR_TABLE = _build_gear_table()
+_HASH_MASK = (1 << 64) - 1
+_GEAR_WINDOW = 64
+
+
+class ContentDefinedChunker(BaseChunker):
+    """Content-defined chunker (FastCDC-style rolling gear hash)
+
+    Boundaries are chosen where a rolling hash of the last 64 characters
+    matches a mask, then snapped to the end of the following whitespace
+    run. Since a boundary depends only on nearby content, an edit only
+    changes the chunks around it; the rest keep identical text and ids.
+
+    Chunks are exact slices of the input. Spans made only of whitespace
+    are skipped, so joining the chunks reproduces the original text
+    except for such spans (e.g. trailing blank lines after the last cut).
+
+    Attributes:
+        min_size (int): Minimum chunk size in characters
+        avg_size (int): Target average chunk size in characters
+        max_size (int): Maximum chunk size in characters
+    """
+
+    def __init__(
+        self,
+        min_size: int = 256,
+        avg_size: int = 1024,
+        max_size: int = 4096,
+    ) -> None:
+        if not 0 < min_size <= avg_size <= max_size:
+            raise ValueError(
+                "Sizes must satisfy 0 < min_size <= avg_size <= max_size"
+            )
+
+        self.min_size = min_size
+        self.avg_size = avg_size
+        self.max_size = max_size
+
+        # A cut is expected every 2**bits characters after min_size. The
+        # mask uses the high bits, which depend on the widest window of
+        # characters (the last 64).
+        bits = min(
+            max(int(round(math.log2(max(avg_size - min_size, 2)))), 1), 63
+        )
+        self._mask = ((1 << bits) - 1) << (64 - bits)
+
+    def split_text(self, text: str) -> list[str]:
+        return [text[start:end] for start, end in self.iter_spans(text)]
+
+    def split_documents(self, documents: list[Document]) -> list[Document]:
+        """Split Documents into content-addressed chunks
+
+        In addition to the usual chunk fields, each chunk's metadata holds
+        `chunk_hash` (hash of the chunk text), `chunk_id` (stable id built
+        from the parent doc_id/source and the hash) and the
+        `start_index`/`end_index` character offsets in the parent content.
+
+        Args:
+            documents (list[Document]): List of documents to split
+
+        Returns:
+            list[Document]: List of chunked documents
+        """
+        chunked_documents = []
+
+        for doc in documents:
+            spans = list(self.iter_spans(doc.content))
+
+            for idx, (start, end) in enumerate(spans):
+                chunk = doc.content[start:end]
+                chunk_hash = self.hash_text(chunk)
+
+                chunk_metadata = doc.metadata.copy()
+                chunk_metadata["chunk_total"] = len(spans)
+                chunk_metadata["chunk_hash"] = chunk_hash
+                chunk_metadata["chunk_id"] = self.make_chunk_id(
+                    doc, chunk_hash
+                )
+                chunk_metadata["start_index"] = start
+                chunk_metadata["end_index"] = end
+
+                chunked_documents.append(
+                    Document(
+                        content=chunk,
+                        metadata=chunk_metadata,
+                        doc_id=doc.doc_id,
+                        source=doc.source,
+                        page_number=doc.page_number,
+                        chunk_index=idx,
+                    )
+                )
+
+        return chunked_documents
+
+    @staticmethod
+    def hash_text(text: str) -> str:
+        """Return the content hash used for chunk ids"""
+        return hashlib.blake2b(
+            text.encode("utf-8"), digest_size=16
+        ).hexdigest()
+
+    @staticmethod
+    def make_chunk_id(document: Document, chunk_hash: str) -> str:
+        """Build a chunk id from the parent document and the chunk hash
+
+        Identical chunks within one document share an id.
+        """
+        key = document.doc_id or document.source
+        return f"{key}:{chunk_hash}" if key else chunk_hash
+
+    def iter_spans(
+        self, text: str, start: int = 0
+    ) -> Iterator[tuple[int, int]]:
+        """Yield (start, end) offsets of the chunks from start onwards"""
+        length = len(text)
+        position = start
+
+        while position < length:
+            end = self._find_boundary(text, position, length)
+            if text[position:end].strip():
+                yield position, end
+            position = end
+
+    def _find_boundary(self, text: str, start: int, length: int) -> int:
+        if length - start <= self.min_size:
+            return length
+
+        limit = min(start + self.max_size, length)
+        gear = _GEAR_TABLE
+        hash_mask = _HASH_MASK
+        mask = self._mask
+        h = 0
+        index = start + self.min_size
+
+        # Cut points are only tested after min_size, but the hash is warmed
+        # up on the preceding window so that it depends only on content,
+        # not on where the current chunk started
+        for char in text[max(start, index - _GEAR_WINDOW) : index]:
+            h = ((h << 1) + gear[ord(char) & 0xFF]) & hash_mask
+
+        for char in text[index:limit]:
+            h = ((h << 1) + gear[ord(char) & 0xFF]) & hash_mask
+            index += 1
+            if not h & mask:
+                return self._snap_to_whitespace(text, index, limit)
+
+        return limit
+
+    def is_stable_cut(self, text: str, start: int, end: int) -> bool:
+        """Return whether a cut made before the end of the text still holds
+
+        `end` must be a cut this chunker made for a chunk starting at
+        `start`, with text[start:end] unchanged since. The check inspects
+        only the hash at `end` and the text that follows it, so the chunk
+        itself is not rescanned. It may reject a cut that would in fact
+        be reproduced, but never accepts one that would not.
+
+        Args:
+            text (str): Current text
+            start (int): Start offset of the chunk
+            end (int): End offset of the chunk (less than len(text))
+
+        Returns:
+            bool: True if iter_spans(text, start) would cut at end again
+        """
+        if end - start == self.max_size:
+            # Forced cut: depends only on the chunk's own characters
+            return True
+        if end - start <= self.min_size:
+            return False
+
+        limit = min(start + self.max_size, len(text))
+        if not text[end - 1].isspace() or self._is_hash_cut(text, start, end):
+            # The hash matched at end itself and no whitespace followed
+            # before the limit; text appended after end may now hold some
+            return _WHITESPACE_PATTERN.search(text, end, limit) is None
+        # Snapped to the end of a whitespace run, which still ends here
+        return not text[end].isspace()
+
+    def _is_hash_cut(self, text: str, start: int, end: int) -> bool:
+        # Only the last 64 characters remain in the hash, and the hash of
+        # a chunk starts from its warm-up window
+        gear = _GEAR_TABLE
+        h = 0
+        for char in text[
+            max(
+                start, start + self.min_size - _GEAR_WINDOW, end - _GEAR_WINDOW
+            ) : end
+        ]:
+            h = ((h << 1) + gear[ord(char) & 0xFF]) & _HASH_MASK
+        return not h & self._mask
+
+    @staticmethod
+    def _snap_to_whitespace(text: str, cut: int, limit: int) -> int:
+        # Move the cut to the end of the next whitespace run so words and
+        # sentences are not split; the boundary stays content-defined
+        match = _WHITESPACE_PATTERN.search(text, cut, limit)
+        if match is None:
+            return cut
+        return match.end()
+
+
+_MD_FENCE = re.compile(r"^ {0,3}(`{3,}|~{3,})")
+_MD_HEADING = re.compile(r"^ {0,3}(#{1,6})[ \t]+(.+?)(?:[ \t]+#+)?[ \t]*$")
+_MD_TABLE_ROW = re.compile(r"^ {0,3}\|")
+_MD_LIST_ITEM = re.compile(r"^[ \t]*(?:[-*+]|\d{1,9}[.)])[ \t]+")
+
+# Blocks that are never split, even when larger than chunk_size
+_ATOMIC_BLOCKS = frozenset({"code", "table"})
+
+
+@dataclass
+class _MarkdownSection:
+    level: int
+    title: str | None = None
+    heading: str | None = None
+    blocks: list[tuple[str, str]] = field(default_factory=list)
+    children: list["_MarkdownSection"] = field(default_factory=list)
+    own_text: str = ""
+    size: int = 0
+
+
+class MarkdownChunker(BaseChunker):
+    """Structure-aware chunker for Markdown
+
+    Parses headings, code fences, tables and lists once into a section
+    tree, then packs sibling sections together up to chunk_size. Code
+    fences and tables are never split. Each chunk's metadata holds the
+    `header_path` ("h1 > h2 > h3") of the section it belongs to.
+
+    Attributes:
+        chunk_size (int): Maximum chunk size in characters
+        header_separator (str): Separator used to join the header path
+    """
+
+    def __init__(
+        self,
+        chunk_size: int = 1000,
+        header_separator: str = " > ",
+    ) -> None:
+        self.chunk_size = chunk_size
+        self.header_separator = header_separator
+        # Fallback for paragraphs and lists that exceed chunk_size on their own
+        self._fallback = RecursiveCharacterChunker(
+            chunk_size=chunk_size, chunk_overlap=0
+        )
+
+    def split_text(self, text: str) -> list[str]:
+        return [chunk for chunk, _ in self.split_text_with_headers(text)]
+
+    def split_text_with_headers(self, text: str) -> list[tuple[str, str]]:
+        """Split Markdown into chunks paired with their header path
+
+        Args:
+            text (str): Markdown text
+
+        Returns:
+            list[tuple[str, str]]: (chunk, header_path) pairs
+        """
+        root = self._parse(text)
+        return [
+            (chunk, self.header_separator.join(path))
+            for chunk, path in self._pack_section(root, [])
+            if chunk.strip()
+        ]
+
+    def split_documents(self, documents: list[Document]) -> list[Document]:
+        """Split Markdown Documents into chunks with header path metadata
+
+        Args:
+            documents (list[Document]): List of documents to split
+
+        Returns:
+            list[Document]: List of chunked documents
+        """
+        chunked_documents = []
+
+        for doc in documents:
+            chunks = self.split_text_with_headers(doc.content)
+
+            for idx, (chunk, header_path) in enumerate(chunks):
+                chunk_metadata = doc.metadata.copy()
+                chunk_metadata["chunk_total"] = len(chunks)
+                chunk_metadata["header_path"] = header_path
+
+                chunked_documents.append(
+                    Document(
+                        content=chunk,
+                        metadata=chunk_metadata,
+                        doc_id=doc.doc_id,
+                        source=doc.source,
+                        page_number=doc.page_number,
+                        chunk_index=idx,
+                    )
+                )
+
+        return chunked_documents
+
+    def _parse(self, text: str) -> _MarkdownSection:
+        root = _MarkdownSection(level=0)
+        stack = [root]
+        block_kind = ""
+        block_lines: list[str] = []
+        fence = ""
+        previous_blank = False
+
+        def flush() -> None:
+            nonlocal block_kind, block_lines
+            block = "\n".join(block_lines).strip("\n")
+            if block.strip():
+                stack[-1].blocks.append((block_kind, block))
+            block_kind = ""
+            block_lines = []
+
+        for line in text.split("\n"):
+            if fence:
+                block_lines.append(line)
+                stripped = line.strip()
+                if stripped.startswith(fence) and not stripped.strip(fence[0]):
+                    flush()
+                    fence = ""
+                continue
+
+            match = _MD_FENCE.match(line)
+            if match:
+                flush()
+                fence = match.group(1)
+                block_kind = "code"
+                block_lines = [line]
+                continue
+
+            match = _MD_HEADING.match(line)
+            if match:
+                flush()
+                level = len(match.group(1))
+                while stack[-1].level >= level:
+                    stack.pop()
+                section = _MarkdownSection(
+                    level=level, title=match.group(2), heading=line.strip()
+                )
+                stack[-1].children.append(section)
+                stack.append(section)
+                previous_blank = False
+                continue
+
+            if not line.strip():
+                if block_kind == "list":
+                    # A blank line does not necessarily end a list
+                    block_lines.append(line)
+                else:
+                    flush()
+                previous_blank = True
+                continue
+
+            if _MD_TABLE_ROW.match(line):
+                kind = "table"
+            elif _MD_LIST_ITEM.match(line):
+                kind = "list"
+            elif block_kind == "list" and (
+                line[0] in " \t" or not previous_blank
+            ):
+                # Indented or lazy continuation of a list item
+                kind = "list"
+            else:
+                kind = "paragraph"
+
+            if kind != block_kind:
+                flush()
+                block_kind = kind
+            block_lines.append(line)
+            previous_blank = False
+
+        flush()
+        self._measure(root)
+        return root
+
+    def _measure(self, section: _MarkdownSection) -> int:
+        parts = [section.heading] if section.heading else []
+        parts.extend(block for _, block in section.blocks)
+        section.own_text = "\n\n".join(parts)
+
+        sizes = [len(section.own_text)] if section.own_text else []
+        sizes.extend(self._measure(child) for child in section.children)
+        section.size = sum(sizes) + 2 * max(len(sizes) - 1, 0)
+        return section.size
+
+    def _render(self, section: _MarkdownSection) -> str:
+        parts = [section.own_text] if section.own_text else []
+        parts.extend(self._render(child) for child in section.children)
+        return "\n\n".join(parts)
+
+    def _pack_section(
+        self,
+        section: _MarkdownSection,
+        path: list[str],
+    ) -> list[tuple[str, list[str]]]:
+        if section.title is not None:
+            path = path + [section.title]
+
+        if section.size <= self.chunk_size:
+            return [(self._render(section), path)]
+
+        results: list[tuple[str, list[str]]] = []
+        # Pending group of small pieces: (text, header path)
+        group: list[tuple[str, list[str]]] = []
+        group_size = 0
+
+        def flush() -> None:
+            nonlocal group, group_size
+            if len(group) == 1:
+                results.append(group[0])
+            elif group:
+                results.append(("\n\n".join(text for text, _ in group), path))
+            group = []
+            group_size = 0
+
+        def add(text: str, piece_path: list[str]) -> None:
+            nonlocal group_size
+            if group and group_size + 2 + len(text) > self.chunk_size:
+                flush()
+            group_size += len(text) + (2 if group else 0)
+            group.append((text, piece_path))
+
+        if section.blocks or (section.own_text and not section.children):
+            # A bare heading followed by subsections is carried by the
+            # header path of the subsection chunks instead
+            if len(section.own_text) <= self.chunk_size:
+                add(section.own_text, path)
+            else:
+                blocks = list(section.blocks)
+                if section.heading:
+                    blocks.insert(0, ("heading", section.heading))
+                results.extend(
+                    (text, path) for text in self._pack_blocks(blocks)
+                )
+
+        for child in section.children:
+            if child.size <= self.chunk_size:
+                add(self._render(child), path + [child.title])
+            else:
+                flush()
+                results.extend(self._pack_section(child, path))
+
+        flush()
+        return results
+
+    def _pack_blocks(self, blocks: list[tuple[str, str]]) -> list[str]:
+        chunks: list[str] = []
+        current: list[str] = []
+        current_size = 0
+
+        for kind, block in blocks:
+            if len(block) > self.chunk_size and kind not in _ATOMIC_BLOCKS:
+                room = self.chunk_size - current_size - 2
+                if current and room >= self.chunk_size // 4:
+                    # Fill the rest of the current chunk (e.g. after a heading)
+                    # with the start of the block so headings stay attached
+                    head = RecursiveCharacterChunker(
+                        chunk_size=room, chunk_overlap=0
+                    ).split_text(block)[0]
+                    position = block.find(head)
+                    if position >= 0:
+                        current.append(head)
+                        block = block[position + len(head) :].strip()
+                if current:
+                    chunks.append("\n\n".join(current))
+                    current = []
+                    current_size = 0
+                if block:
+                    chunks.extend(self._fallback.split_text(block))
+                continue
+
+            if len(block) > self.chunk_size:
+                if current:
+                    chunks.append("\n\n".join(current))
+                    current = []
+                    current_size = 0
+                chunks.append(block)
+                continue
+
+            if current and current_size + 2 + len(block) > self.chunk_size:
+                chunks.append("\n\n".join(current))
+                current = []
+                current_size = 0
+            current_size += len(block) + (2 if current else 0)
+            current.append(block)
+
+        if current:
+            chunks.append("\n\n".join(current))
+
+        return chunks
@@ -0,0 +1,245 @@
+"""pydocstruct/core/incremental.py"""
+
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+
+from pydocstruct.core.chunker import ContentDefinedChunker
+from pydocstruct.core.document import Document
+
+
+@dataclass(frozen=True)
+class ChunkRecord:
+    """Stored fingerprint of one chunk of a previously indexed document
+
+    Attributes:
+        chunk_id (str): Chunk id (vector store key)
+        chunk_hash (str): Hash of the chunk text
+        start (int): Start offset of the chunk in the document content
+        end (int): End offset of the chunk in the document content
+    """
+
+    chunk_id: str
+    chunk_hash: str
+    start: int
+    end: int
+
+    @classmethod
+    def from_document(cls, document: Document) -> "ChunkRecord":
+        """Create a record from a chunk produced by ContentDefinedChunker
+
+        Args:
+            document (Document): Chunk Document
+
+        Returns:
+            ChunkRecord: Record of the chunk
+        """
+        metadata = document.metadata
+        return cls(
+            chunk_id=metadata["chunk_id"],
+            chunk_hash=metadata["chunk_hash"],
+            start=metadata["start_index"],
+            end=metadata["end_index"],
+        )
+
+
+@dataclass
+class ChunkDiff:
+    """Changes between the previous and the current chunk set of a document
+
+    Attributes:
+        added (list[Document]): New chunks to embed and upsert
+        unchanged (list[str]): Ids of chunks that can be kept as they are
+        removed (list[str]): Ids of chunks to delete
+        records (list[ChunkRecord]): Records of the current chunk set, in
+            document order, to pass as `previous` on the next update
+    """
+
+    added: list[Document] = field(default_factory=list)
+    unchanged: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    records: list[ChunkRecord] = field(default_factory=list)
+
+
+class IncrementalChunker:
+    """Re-chunks an edited document and reports a minimal chunk diff
+
+    Chunks at the start and end of the document that still match the
+    previous records are reused without running the chunker over them.
+    Only the edited region in between is re-chunked, which is enough
+    because content-defined boundaries resynchronize after an edit.
+
+    Attributes:
+        chunker (ContentDefinedChunker): Chunker that produced the records
+    """
+
+    def __init__(self, chunker: ContentDefinedChunker | None = None) -> None:
+        self.chunker = chunker or ContentDefinedChunker()
+
+    def diff(
+        self,
+        previous: Sequence[ChunkRecord | Document],
+        document: Document,
+    ) -> ChunkDiff:
+        """Compute the chunk diff for a new version of a document
+
+        Args:
+            previous (Sequence[ChunkRecord | Document]): Records (or chunk
+                Documents) of the previous version, in document order
+            document (Document): New version of the document
+
+        Returns:
+            ChunkDiff: Added, unchanged and removed chunks
+        """
+        old = [
+            (
+                item
+                if isinstance(item, ChunkRecord)
+                else ChunkRecord.from_document(item)
+            )
+            for item in previous
+        ]
+        text = document.content
+
+        prefix = self._match_prefix(old, text)
+        prefix_end = prefix[-1].end if prefix else 0
+        suffix = self._match_suffix(old[len(prefix) :], text, prefix_end)
+        suffix_starts = {record.start: i for i, record in enumerate(suffix)}
+
+        middle: list[tuple[int, int, str]] = []
+        resume_at = len(suffix)
+        for start, end in self.chunker.iter_spans(text, prefix_end):
+            if start in suffix_starts:
+                resume_at = suffix_starts[start]
+                break
+            chunk_hash = self.chunker.hash_text(text[start:end])
+            middle.append((start, end, chunk_hash))
+        suffix = suffix[resume_at:]
+
+        return self._build_diff(old, prefix, middle, suffix, document)
+
+    def _match_prefix(
+        self, old: list[ChunkRecord], text: str
+    ) -> list[ChunkRecord]:
+        length = len(text)
+        position = 0
+        matched = []
+
+        for i, record in enumerate(old):
+            if record.start != position or record.end > length:
+                break
+            if (
+                self.chunker.hash_text(text[record.start : record.end])
+                != record.chunk_hash
+            ):
+                break
+            if not self._boundary_reproducible(
+                text, record, i == len(old) - 1
+            ):
+                break
+            matched.append(record)
+            position = record.end
+
+        return matched
+
+    def _boundary_reproducible(
+        self, text: str, record: ChunkRecord, is_last: bool
+    ) -> bool:
+        # The chunker would end this chunk at the same offset only if the
+        # cut is content-defined and the text after it leads to the same
+        # decision as before
+        end = record.end
+        if end == len(text):
+            return True
+        if is_last:
+            # The previous text ended here, so the cut may not be a real one
+            return False
+        return self.chunker.is_stable_cut(text, record.start, end)
+
+    def _match_suffix(
+        self,
+        old: list[ChunkRecord],
+        text: str,
+        lower_bound: int,
+    ) -> list[ChunkRecord]:
+        end = len(text)
+        matched: list[ChunkRecord] = []
+        next_start = None
+
+        for record in reversed(old):
+            if next_start is not None and record.end != next_start:
+                break
+            start = end - (record.end - record.start)
+            if start < lower_bound:
+                break
+            if self.chunker.hash_text(text[start:end]) != record.chunk_hash:
+                break
+            matched.append(
+                ChunkRecord(record.chunk_id, record.chunk_hash, start, end)
+            )
+            next_start = record.start
+            end = start
+
+        matched.reverse()
+        return matched
+
+    def _build_diff(
+        self,
+        old: list[ChunkRecord],
+        prefix: list[ChunkRecord],
+        middle: list[tuple[int, int, str]],
+        suffix: list[ChunkRecord],
+        document: Document,
+    ) -> ChunkDiff:
+        old_ids = {record.chunk_id for record in old}
+        diff = ChunkDiff()
+        seen: set[str] = set()
+        total = len(prefix) + len(middle) + len(suffix)
+
+        def keep(record: ChunkRecord) -> None:
+            diff.records.append(record)
+            if record.chunk_id not in seen:
+                seen.add(record.chunk_id)
+                diff.unchanged.append(record.chunk_id)
+
+        for record in prefix:
+            keep(record)
+
+        for offset, (start, end, chunk_hash) in enumerate(middle):
+            chunk_id = self.chunker.make_chunk_id(document, chunk_hash)
+            record = ChunkRecord(chunk_id, chunk_hash, start, end)
+            if chunk_id in old_ids:
+                keep(record)
+                continue
+
+            diff.records.append(record)
+            if chunk_id in seen:
+                continue
+            seen.add(chunk_id)
+
+            metadata = document.metadata.copy()
+            metadata["chunk_total"] = total
+            metadata["chunk_hash"] = chunk_hash
+            metadata["chunk_id"] = chunk_id
+            metadata["start_index"] = start
+            metadata["end_index"] = end
+
+            diff.added.append(
+                Document(
+                    content=document.content[start:end],
+                    metadata=metadata,
+                    doc_id=document.doc_id,
+                    source=document.source,
+                    page_number=document.page_number,
+                    chunk_index=len(prefix) + offset,
+                )
+            )
+
+        for record in suffix:
+            keep(record)
+
+        diff.removed = [
+            chunk_id
+            for chunk_id in dict.fromkeys(r.chunk_id for r in old)
+            if chunk_id not in seen
+        ]
+        return diff
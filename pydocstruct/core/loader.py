@@ -1,5 +1,7 @@
 """pydocstruct/core/loader.py"""
+
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
@@ -8,15 +10,15 @@ from pydocstruct.core.document import Document
 
 class BaseLoader(ABC):
     """Base class for file loaders
-    
+
     Loaders for each file format should inherit from this class.
-    
+
     Attributes:
         file_path (Path): Path to the file to load
         encoding (str): File encoding
         metadata (dict[str, Any]): Additional metadata
     """
-    
+
     def __init__(
         self,
         file_path: str | Path,
@@ -24,7 +26,7 @@ class BaseLoader(ABC):
         **kwargs: Any,
     ) -> None:
         """Initialize BaseLoader
-        
+
         Args:
             file_path (str | Path): Path to the file to load
             encoding (str, optional): Encoding. Defaults to "utf-8".
@@ -34,33 +36,46 @@ class BaseLoader(ABC):
         self.file_path = Path(file_path)
         self.encoding = encoding
         self.metadata = kwargs
-        
+
         # Check if file exists and is a regular file
         if not self.file_path.exists():
             raise FileNotFoundError(f"File not found: {self.file_path}")
         if not self.file_path.is_file():
-            raise IsADirectoryError(f"Path is a directory, not a file: {self.file_path}")
-    
+            raise IsADirectoryError(
+                f"Path is a directory, not a file: {self.file_path}"
+            )
+
     @abstractmethod
     def load(self) -> list[Document]:
         """Load file and convert to list of Documents
-        
+
         Abstract method that must be implemented by subclasses.
-        
+
         Returns:
             list[Document]: List of loaded documents
         """
         pass
-    
+
+    def lazy_load(self) -> Iterator[Document]:
+        """Load file and yield Documents one at a time
+
+        Loaders that can stream their input override this method.
+        The default implementation falls back to load().
+
+        Yields:
+            Document: Loaded documents
+        """
+        yield from self.load()
+
     def _create_base_metadata(self) -> dict[str, Any]:
         """Generate base metadata
-        
+
         Returns:
             dict[str, Any]: Base metadata including file info
         """
         # Get file info
         stat = self.file_path.stat()
-        
+
         return {
             "source": str(self.file_path),
             "filename": self.file_path.name,
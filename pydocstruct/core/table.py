@@ -0,0 +1,263 @@
+"""pydocstruct/core/table.py"""
+
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+from pydocstruct.core.document import Document
+from pydocstruct.utils.table_utils import row_template
+
+# dtype.kind of columns kept as NumPy arrays (bool, int, unsigned, float)
+_NUMPY_KINDS = frozenset("biuf")
+
+
+class ColumnarTable:
+    """Column-major table shared by the LazyTableDocuments rendered from it
+
+    Values are stored once per cell, column by column. Rows are rendered
+    to "column: value" text only when a Document's content is read, so a
+    pipeline that filters rows or keeps only some columns never builds
+    the text of the discarded ones.
+
+    Attributes:
+        columns (list[str]): Column names
+        data (list[Sequence[Any]]): One sequence of values per column
+        row_index (list[int]): Source row number of each row
+        schema (dict[str, Any]): Description of the table (columns,
+            dtypes, row_count). The same dict is referenced from the
+            metadata of every Document rendered from the table.
+    """
+
+    def __init__(
+        self,
+        columns: Sequence[Any],
+        data: list[Sequence[Any]],
+        row_index: list[int],
+        dtypes: Sequence[str] | None = None,
+    ) -> None:
+        if len(data) != len(columns):
+            raise ValueError(
+                f"Expected {len(columns)} columns of data, got {len(data)}"
+            )
+        self.columns = [str(column) for column in columns]
+        self.data = data
+        self.row_index = row_index
+        self.schema = {
+            "columns": self.columns,
+            "dtypes": list(dtypes) if dtypes is not None else None,
+            "row_count": len(row_index),
+        }
+        self._templates: dict[tuple[int, ...], str] = {}
+
+    @classmethod
+    def from_dataframe(cls, df: Any) -> "ColumnarTable":
+        """Create a table from a pandas DataFrame
+
+        Numeric and boolean columns keep their NumPy arrays (8 bytes per
+        cell instead of a Python object); NumPy scalars format the same
+        way as the Python values. Other columns are converted with tolist().
+
+        Args:
+            df (pd.DataFrame): Source frame; its index becomes row_index
+
+        Returns:
+            ColumnarTable: Table holding the frame's values
+        """
+        data = []
+        for i in range(df.shape[1]):
+            column = df.iloc[:, i]
+            if column.dtype.kind in _NUMPY_KINDS:
+                data.append(column.to_numpy())
+            else:
+                data.append(column.tolist())
+        return cls(
+            df.columns.tolist(),
+            data,
+            df.index.tolist(),
+            dtypes=[str(dtype) for dtype in df.dtypes],
+        )
+
+    @classmethod
+    def from_rows(
+        cls,
+        columns: Sequence[Any],
+        rows: Iterable[tuple[int, Sequence[Any]]],
+    ) -> "ColumnarTable":
+        """Create a table from (row_index, values) pairs
+
+        Args:
+            columns (Sequence[Any]): Column names
+            rows (Iterable[tuple[int, Sequence[Any]]]): Rows in order
+
+        Returns:
+            ColumnarTable: Table holding the rows column by column
+        """
+        data: list[list[Any]] = [[] for _ in columns]
+        appends = [column.append for column in data]
+        row_index = []
+        for index, values in rows:
+            row_index.append(index)
+            for append, value in zip(appends, values):
+                append(value)
+        return cls(columns, data, row_index)
+
+    def __len__(self) -> int:
+        return len(self.row_index)
+
+    def positions(
+        self, columns: Sequence[str] | None = None
+    ) -> tuple[int, ...]:
+        """Return the positions of the given columns, in table order
+
+        Args:
+            columns (Sequence[str] | None): Column names (None selects all)
+
+        Returns:
+            tuple[int, ...]: Column positions
+        """
+        if columns is None:
+            return tuple(range(len(self.columns)))
+        missing = set(columns).difference(self.columns)
+        if missing:
+            raise KeyError(f"Unknown columns: {sorted(missing)}")
+        wanted = set(columns)
+        return tuple(
+            i for i, name in enumerate(self.columns) if name in wanted
+        )
+
+    def render(
+        self, start: int, stop: int, columns: Sequence[str] | None = None
+    ) -> str:
+        """Render rows [start, stop) as "column: value" lines
+
+        Rows are separated by a blank line and missing values (None) are
+        rendered as empty strings, as in the loaders' eager row mode.
+
+        Args:
+            start (int): First row position
+            stop (int): Row position after the last row
+            columns (Sequence[str] | None): Columns to include (None for all)
+
+        Returns:
+            str: Rendered rows
+        """
+        positions = self.positions(columns)
+        template = self._templates.get(positions)
+        if template is None:
+            template = row_template([self.columns[i] for i in positions])
+            self._templates[positions] = template
+
+        selected = [self.data[i] for i in positions]
+        return "\n\n".join(
+            template.format(
+                *(
+                    "" if column[row] is None else column[row]
+                    for column in selected
+                )
+            )
+            for row in range(start, stop)
+        )
+
+
+class LazyTableDocument(Document):
+    """Document whose content is rendered from a shared ColumnarTable
+
+    The Document refers to rows [row_start, row_stop) of the table and an
+    optional column subset. Its content is rendered on first access and
+    cached; assigning content replaces it like on a plain Document.
+
+    The dataclass helpers see the rendered content: asdict(), repr() and
+    == (also against a plain Document) behave as for the eager Document
+    with the same content, and dataclasses.replace() returns a plain
+    Document holding the rendered content.
+
+    Attributes:
+        table (ColumnarTable): Shared source table
+        row_start (int): First row position in the table
+        row_stop (int): Row position after the last row
+        columns (list[str] | None): Rendered columns (None for all)
+    """
+
+    def __new__(cls, *args: Any, **kwargs: Any) -> Document:
+        if "content" in kwargs:
+            # dataclasses.replace() passes the Document fields only
+            return Document(**kwargs)
+        return super().__new__(cls)
+
+    def __init__(
+        self,
+        table: ColumnarTable,
+        row_start: int,
+        row_stop: int,
+        columns: Sequence[str] | None = None,
+        metadata: dict[str, Any] | None = None,
+        doc_id: str | None = None,
+        source: str | None = None,
+        page_number: int | None = None,
+        chunk_index: int | None = None,
+    ) -> None:
+        self.table = table
+        self.row_start = row_start
+        self.row_stop = row_stop
+        self.columns = list(columns) if columns is not None else None
+        if self.columns is not None:
+            # Fail here rather than on first access to content
+            table.positions(self.columns)
+        super().__init__(
+            content=None,
+            metadata=metadata if metadata is not None else {},
+            doc_id=doc_id,
+            source=source,
+            page_number=page_number,
+            chunk_index=chunk_index,
+        )
+
+    @property
+    def content(self) -> str:
+        if self._content is None:
+            self._content = self.table.render(
+                self.row_start, self.row_stop, self.columns
+            )
+        return self._content
+
+    @content.setter
+    def content(self, value: str | None) -> None:
+        self._content = value
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Document):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    @property
+    def is_rendered(self) -> bool:
+        """Whether content has been rendered (or assigned) yet"""
+        return self._content is not None
+
+    def select_columns(self, columns: Sequence[str]) -> "LazyTableDocument":
+        """Return a Document over the same rows restricted to some columns
+
+        The new Document shares the table and is rendered independently.
+        Columns are rendered in table order, which metadata["columns"]
+        records whatever order they are given in.
+
+        Args:
+            columns (Sequence[str]): Column names to keep
+
+        Returns:
+            LazyTableDocument: Unrendered Document over the column subset
+        """
+        metadata = self.metadata.copy()
+        metadata["columns"] = [
+            self.table.columns[i] for i in self.table.positions(columns)
+        ]
+        return LazyTableDocument(
+            self.table,
+            self.row_start,
+            self.row_stop,
+            columns=columns,
+            metadata=metadata,
+            doc_id=self.doc_id,
+            source=self.source,
+            page_number=self.page_number,
+            chunk_index=self.chunk_index,
+        )
@@ -1,4 +1,8 @@
 """pydocstruct/loaders/csv_loader.py"""
+
+import csv
+from collections.abc import Callable, Iterator, Sequence
+from itertools import islice
 from pathlib import Path
 from typing import Any
 
@@ -7,24 +11,145 @@ try:
 except ImportError:
     pd = None
 
+from pydocstruct.core.chunker import TokenChunker
 from pydocstruct.core.document import Document
 from pydocstruct.core.loader import BaseLoader
+from pydocstruct.core.table import ColumnarTable, LazyTableDocument
+from pydocstruct.utils.table_utils import (
+    dataframe_rows,
+    iter_markdown_tables,
+    row_template,
+)
 
 
 class CsvLoader(BaseLoader):
-    """Loader for CSV files"""
+    """Loader for CSV files
+
+    In row mode each row is rendered as "column: value" lines. Rows are
+    rendered column-wise in one pass rather than through df.iterrows(),
+    and rows_per_document groups consecutive rows into one Document.
+
+    With chunksize set, the file is read with pd.read_csv(chunksize=...)
+    and lazy_load() yields Documents chunk by chunk, so memory stays
+    bounded by the chunk size rather than the file size. When pandas is
+    not installed, row mode falls back to the stdlib csv module, which
+    always streams; cells are then rendered as their raw text (empty
+    cells stay empty instead of becoming "nan").
+
+    Unless dtype is given, row mode, native Markdown and lazy mode read
+    every cell as text (dtype=str), so a value renders as written in the
+    file whatever the chunk size. pandas infers types per chunk, so "4"
+    would otherwise become "4.0" only in chunks where its column also has
+    a missing value. Pass dtype to parse columns instead; lazy tables then
+    keep numeric columns as NumPy arrays.
+
+    Markdown output is rendered by tabulate (df.to_markdown) by default.
+    markdown_renderer="native" writes rows straight to Markdown without
+    measuring column widths, and max_table_rows / max_table_tokens split
+    the table into bounded Documents that each repeat the header row, so
+    no chunk starts mid-table without its column names. The native
+    renderer streams like row mode and does not need pandas.
+
+    With lazy=True, row mode yields LazyTableDocuments instead: each chunk
+    of the file is kept once as a ColumnarTable, and a Document's text is
+    rendered from it only when its content is first read. The metadata
+    key "table_schema" references the table's shared schema. chunksize
+    is rounded up to a multiple of rows_per_document so that row groups
+    never span two tables.
+
+    Example:
+        loader = CsvLoader(
+            "export.csv",
+            chunksize=100_000,
+            usecols=["id", "title", "body"],
+            rows_per_document=50,
+        )
+        for doc in loader.lazy_load():
+            ...
+
+        tables = CsvLoader(
+            "export.csv", output_format="markdown", max_table_tokens=512
+        )
+    """
+
+    MARKDOWN_RENDERERS = ("tabulate", "native")
 
     def __init__(
         self,
         file_path: str | Path,
         encoding: str = "utf-8",
         output_format: str = "row",  # "row" or "markdown"
+        rows_per_document: int = 1,
+        chunksize: int | None = None,
+        usecols: Sequence[str | int] | Callable[[str], bool] | None = None,
+        dtype: Any = None,
+        markdown_renderer: str = "tabulate",
+        max_table_rows: int | None = None,
+        max_table_tokens: int | None = None,
+        length_function: Callable[[str], int] | None = None,
+        lazy: bool = False,
         **kwargs: Any,
     ) -> None:
+        """
+        Args:
+            file_path: Path to the CSV file
+            encoding: File encoding
+            output_format: "row" for one Document per row (group),
+                "markdown" for a single Markdown table
+            rows_per_document: Number of rows per Document in row mode.
+                Rows in a group are separated by a blank line.
+            chunksize: Number of rows read per pandas chunk in row mode
+                and native Markdown mode (None reads the whole file at once)
+            usecols: Columns to read, as names, positions or a predicate
+                on the column name. Other columns are never parsed.
+            dtype: Passed to pd.read_csv. Defaults to text (str) except for
+                the tabulate renderer, which infers types. The stdlib
+                backend keeps every value as text.
+            markdown_renderer: "tabulate" (df.to_markdown) or "native".
+                Setting max_table_rows or max_table_tokens selects "native".
+            max_table_rows: Maximum data rows per Markdown table Document
+            max_table_tokens: Maximum tokens per Markdown table Document,
+                header included
+            length_function: Counts the tokens of a row for
+                max_table_tokens (defaults to TokenChunker's tiktoken count)
+            lazy: In row mode, yield LazyTableDocuments rendered on demand
+                from a shared ColumnarTable
+        """
         super().__init__(file_path, encoding, **kwargs)
+        if rows_per_document < 1:
+            raise ValueError(
+                f"rows_per_document must be positive, got {rows_per_document}"
+            )
+        if chunksize is not None and chunksize < 1:
+            raise ValueError(f"chunksize must be positive, got {chunksize}")
+        if markdown_renderer not in self.MARKDOWN_RENDERERS:
+            raise ValueError(
+                f"Unknown markdown_renderer: {markdown_renderer}. "
+                f"Expected one of {', '.join(self.MARKDOWN_RENDERERS)}"
+            )
         self.output_format = output_format
-        
-        if pd is None:
+        self.rows_per_document = rows_per_document
+        self.chunksize = chunksize
+        self.usecols = usecols
+        self.dtype = dtype
+        self.max_table_rows = max_table_rows
+        self.max_table_tokens = max_table_tokens
+        # Bounded tables can only be produced by the native renderer
+        if max_table_rows is not None or max_table_tokens is not None:
+            markdown_renderer = "native"
+        self.markdown_renderer = markdown_renderer
+
+        if max_table_tokens is not None and length_function is None:
+            length_function = TokenChunker().count_tokens
+        self.length_function = length_function
+        self.lazy = lazy
+
+        # Row mode and native Markdown can run on the stdlib csv module
+        if (
+            pd is None
+            and output_format == "markdown"
+            and markdown_renderer == "tabulate"
+        ):
             raise ImportError(
                 "pandasがインストールされていません。"
                 "pip install pandas でインストールしてください。"
@@ -32,35 +157,182 @@ class CsvLoader(BaseLoader):
 
     def load(self) -> list[Document]:
         """Load CSV file"""
-        df = pd.read_csv(self.file_path, encoding=self.encoding)
+        return list(self.lazy_load())
+
+    def lazy_load(self) -> Iterator[Document]:
+        """Load CSV file and yield Documents one at a time
+
+        Yields:
+            Document: One Document per row group or Markdown table
+        """
         base_metadata = self._create_base_metadata()
-        
+
+        if (
+            self.output_format == "markdown"
+            and self.markdown_renderer == "tabulate"
+        ):
+            df = self._read_csv()
+            yield Document(
+                content=df.to_markdown(index=False),
+                metadata=base_metadata,
+                source=str(self.file_path),
+            )
+            return
+
+        if self.lazy and self.output_format != "markdown":
+            yield from self._load_lazy(base_metadata)
+            return
+
+        records = self._iter_records()
+        columns = next(records, None)
+        if columns is None:
+            return
+
         if self.output_format == "markdown":
-            return [
-                Document(
-                    content=df.to_markdown(index=False),
-                    metadata=base_metadata,
+            tables = iter_markdown_tables(
+                columns,
+                records,
+                max_rows=self.max_table_rows,
+                max_length=self.max_table_tokens,
+                length_function=self.length_function or len,
+            )
+            for row_index, row_count, table in tables:
+                metadata = base_metadata.copy()
+                metadata["row_index"] = row_index
+                metadata["row_count"] = row_count
+                yield Document(
+                    content=table,
+                    metadata=metadata,
                     source=str(self.file_path),
                 )
-            ]
-            
-        documents = []
-        
-        # Create Document for each row
-        for index, row in df.iterrows():
-            # Convert row content to text (key: value format)
-            content = "\n".join([f"{col}: {val}" for col, val in row.items()])
-            
+            return
+
+        template = row_template(columns)
+        rows = ((index, template.format(*values)) for index, values in records)
+        while group := list(islice(rows, self.rows_per_document)):
             metadata = base_metadata.copy()
-            metadata["row_index"] = index
-            
-            documents.append(
-                Document(
-                    content=content,
+            metadata["row_index"] = group[0][0]
+            metadata["row_count"] = len(group)
+
+            yield Document(
+                content="\n\n".join(text for _, text in group),
+                metadata=metadata,
+                source=str(self.file_path),
+            )
+
+    def _load_lazy(self, base_metadata: dict[str, Any]) -> Iterator[Document]:
+        """Yield LazyTableDocuments over one shared table per chunk"""
+        for table in self._iter_tables():
+            for start in range(0, len(table), self.rows_per_document):
+                stop = min(start + self.rows_per_document, len(table))
+
+                metadata = base_metadata.copy()
+                metadata["row_index"] = table.row_index[start]
+                metadata["row_count"] = stop - start
+                metadata["table_schema"] = table.schema
+
+                yield LazyTableDocument(
+                    table,
+                    start,
+                    stop,
                     metadata=metadata,
                     source=str(self.file_path),
                 )
-            )
-            
-        return documents
 
+    def _iter_tables(self) -> Iterator[ColumnarTable]:
+        """Read the file as ColumnarTables of whole row groups"""
+        size = self.chunksize
+        if size is not None:
+            size = -(-size // self.rows_per_document) * self.rows_per_document
+
+        if pd is None:
+            records = self._iter_records_stdlib()
+            columns = next(records, None)
+            if columns is None:
+                return
+            while batch := list(islice(records, size)):
+                yield ColumnarTable.from_rows(columns, batch)
+            return
+
+        for df in self._read_chunks(size):
+            yield ColumnarTable.from_dataframe(df)
+
+    def _read_csv(self, **options: Any) -> Any:
+        options.setdefault("dtype", self.dtype)
+        return pd.read_csv(
+            self.file_path,
+            encoding=self.encoding,
+            usecols=self.usecols,
+            **options,
+        )
+
+    def _read_chunks(self, chunksize: int | None) -> Iterator[Any]:
+        """Read DataFrames whose values do not depend on the chunk size"""
+        # Types inferred per chunk would render differently from chunk to chunk
+        dtype = str if self.dtype is None else self.dtype
+        if chunksize is None:
+            return iter([self._read_csv(dtype=dtype)])
+        return iter(self._read_csv(dtype=dtype, chunksize=chunksize))
+
+    def _iter_records(self) -> Iterator[Any]:
+        """Yield the column names, then (row_index, values) for each row"""
+        if pd is None:
+            yield from self._iter_records_stdlib()
+            return
+
+        chunks = self._read_chunks(self.chunksize)
+        df = next(chunks)
+        yield df.columns.tolist()
+        while df is not None:
+            # Values are converted column-wise for the whole chunk
+            yield from zip(df.index.tolist(), dataframe_rows(df))
+            df = next(chunks, None)
+
+    def _iter_records_stdlib(self) -> Iterator[Any]:
+        """Stream rows with the csv module (used when pandas is unavailable)"""
+        with open(
+            self.file_path, "r", encoding=self.encoding, newline=""
+        ) as file:
+            reader = csv.reader(file)
+            header = next(reader, None)
+            if header is None:
+                return
+
+            positions = self._select_columns(header)
+            yield [header[i] for i in positions]
+            width = len(header)
+
+            index = 0
+            for row in reader:
+                # Skip blank lines, as pandas does
+                if not row:
+                    continue
+                if len(row) < width:
+                    row += [""] * (width - len(row))
+                yield index, [row[i] for i in positions]
+                index += 1
+
+    def _select_columns(self, header: list[str]) -> list[int]:
+        """Resolve usecols to column positions in file order"""
+        if self.usecols is None:
+            return list(range(len(header)))
+        if callable(self.usecols):
+            return [i for i, name in enumerate(header) if self.usecols(name)]
+
+        wanted = set(self.usecols)
+        missing = [
+            col
+            for col in wanted
+            if not (
+                col in header
+                if isinstance(col, str)
+                else 0 <= col < len(header)
+            )
+        ]
+        if missing:
+            raise ValueError(
+                f"usecols not found in {self.file_path.name}: {missing}"
+            )
+        return [
+            i for i, name in enumerate(header) if i in wanted or name in wanted
+        ]
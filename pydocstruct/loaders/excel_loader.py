@@ -1,4 +1,9 @@
 """pydocstruct/loaders/excel_loader.py"""
+
+import copy
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
 from pathlib import Path
 from typing import Any
 
@@ -7,23 +12,138 @@ try:
 except ImportError:
     pd = None
 
+try:
+    import openpyxl
+except ImportError:
+    openpyxl = None
+
+from pydocstruct.core.chunker import TokenChunker
 from pydocstruct.core.document import Document
 from pydocstruct.core.loader import BaseLoader
+from pydocstruct.core.table import ColumnarTable, LazyTableDocument
+from pydocstruct.utils.table_utils import (
+    dataframe_rows,
+    iter_markdown_tables,
+    row_template,
+)
 
 
 class ExcelLoader(BaseLoader):
-    """Excelファイルを読み込むローダー"""
+    """Excelファイルを読み込むローダー
+
+    シートは lazy_load() で1つずつ読み込み、sheet_names で指定したシート
+    だけを処理します。stream=True の場合は openpyxl の read_only モードで
+    行を先頭から順に読み込み、DataFrame を作らずにDocumentを返すため、
+    数十万行のシートでもメモリを抑えて処理できます（pandas は不要）。
+    このとき空のセルは "nan" ではなく空文字列になります。
+
+    すべてのセルが空の行は、どちらのモードでも読み飛ばします。row_index は
+    空行も数えたデータ行の位置で、max_rows も空行を含めて数えます。
+    pandas で読み込む場合、空行のためだけに float になった整数の列は
+    整数に戻すため、"49" が "49.0" になることはありません。
+
+    num_workers > 1 の場合、シートをワーカープロセスに分配して並列に
+    読み込みます。各ワーカーは担当するシートだけを開き、結果はシートの
+    順序どおりに返します（大きなシートが多いブックほど効果があります）。
+
+    output_format="markdown" の場合、既定では tabulate（df.to_markdown）で
+    シートごとに1つのテーブルを作成します。markdown_renderer="native" では
+    列幅を測らずに行を順にMarkdownへ変換し、max_table_rows / max_table_tokens
+    を指定するとヘッダー行を繰り返した大きさに上限のあるテーブルに分割します。
+
+    lazy=True の場合、row モードではシートごとに ColumnarTable を1つだけ保持し、
+    テキストを content の初回参照時に生成する LazyTableDocument を返します。
+    メタデータの "table_schema" はシート共通のスキーマを参照します。
+
+    使用例:
+        loader = ExcelLoader(
+            "finance.xlsx",
+            stream=True,
+            sheet_names=["2024Q1", "2024Q2"],
+            rows_per_document=100,
+            num_workers=2,
+        )
+        for doc in loader.lazy_load():
+            ...
+    """
+
+    MARKDOWN_RENDERERS = ("tabulate", "native")
 
     def __init__(
         self,
         file_path: str | Path,
         output_format: str = "row",  # "row" or "markdown"
+        rows_per_document: int = 1,
+        stream: bool = False,
+        sheet_names: Sequence[str] | None = None,
+        max_rows: int | None = None,
+        num_workers: int = 1,
+        markdown_renderer: str = "tabulate",
+        max_table_rows: int | None = None,
+        max_table_tokens: int | None = None,
+        length_function: Callable[[str], int] | None = None,
+        lazy: bool = False,
         **kwargs: Any,
     ) -> None:
+        """
+        Args:
+            file_path: ファイルパス
+            output_format: "row"（行ごとのDocument）または
+                "markdown"（シートごとのMarkdownテーブル）
+            rows_per_document: row モードで1つのDocumentにまとめる行数。
+                まとめた行は空行で区切ります
+            stream: openpyxl の read_only モードで行をストリーミングで読み込むか
+            sheet_names: 読み込むシート名（省略時は全シート、指定した順に処理）
+            max_rows: シートごとに読み込むデータ行数の上限（ヘッダー行を除く）
+            num_workers: シートを並列に読み込むワーカープロセス数（1の場合は並列化しない）
+            markdown_renderer: "tabulate"（df.to_markdown）または "native"。
+                max_table_rows / max_table_tokens を指定した場合は常に "native"
+            max_table_rows: Markdownテーブル1つあたりの最大データ行数
+            max_table_tokens: Markdownテーブル1つあたりの最大トークン数（ヘッダーを含む）
+            length_function: max_table_tokens の計算に使う関数
+                （省略時は TokenChunker の tiktoken によるトークン数）
+            lazy: row モードで、共有テーブルから必要時にテキストを生成する
+                LazyTableDocument を返すか
+        """
         super().__init__(file_path, **kwargs)
+        if rows_per_document < 1:
+            raise ValueError(
+                f"rows_per_document must be positive, got {rows_per_document}"
+            )
+        if max_rows is not None and max_rows < 0:
+            raise ValueError(f"max_rows must not be negative, got {max_rows}")
+        if markdown_renderer not in self.MARKDOWN_RENDERERS:
+            raise ValueError(
+                f"Unknown markdown_renderer: {markdown_renderer}. "
+                f"Expected one of {', '.join(self.MARKDOWN_RENDERERS)}"
+            )
         self.output_format = output_format
-        
-        if pd is None:
+        self.rows_per_document = rows_per_document
+        self.stream = stream
+        self.sheet_names = (
+            list(sheet_names) if sheet_names is not None else None
+        )
+        self.max_rows = max_rows
+        self.num_workers = num_workers
+        self.max_table_rows = max_table_rows
+        self.max_table_tokens = max_table_tokens
+        # 分割したテーブルはネイティブ変換でのみ作成できる
+        if max_table_rows is not None or max_table_tokens is not None:
+            markdown_renderer = "native"
+        self.markdown_renderer = markdown_renderer
+
+        if max_table_tokens is not None and length_function is None:
+            length_function = TokenChunker().count_tokens
+        self.length_function = length_function
+        self.lazy = lazy
+
+        # ストリーミング時の row モードとネイティブ変換は openpyxl のみで動作する
+        if stream and openpyxl is None:
+            raise ImportError(
+                "openpyxlがインストールされていません。"
+                "pip install openpyxl でインストールしてください。"
+            )
+        if pd is None and not (stream and self._renders_natively):
             raise ImportError(
                 "pandasがインストールされていません。"
                 "pip install pandas openpyxl でインストールしてください。"
@@ -31,45 +151,279 @@ class ExcelLoader(BaseLoader):
 
     def load(self) -> list[Document]:
         """Excelファイルを読み込む
-        
-        各シートの各行をDocumentとして読み込みます。
+
+        各シートの各行をDocumentとして読み込みます（rows_per_document 行ずつまとめることも可能）。
+        行は iterrows() を使わず、列単位でまとめてテキスト化します。
         output_format="markdown"の場合は、各シートを1つのMarkdownテーブルとして読み込みます。
         """
-        # 全シートを読み込む
-        sheets = pd.read_excel(self.file_path, sheet_name=None)
-        
-        documents = []
+        return list(self.lazy_load())
+
+    def lazy_load(self) -> Iterator[Document]:
+        """Excelファイルを読み込み、Documentを1つずつ返す
+
+        シートは必要になった時点で1つずつ読み込みます。
+        num_workers > 1 の場合は、シートごとの結果をシートの順序で返します。
+
+        Yields:
+            Document: 読み込んだDocument
+        """
+        if self.num_workers > 1:
+            sheet_names = self._select_sheets(self._list_sheets())
+            if len(sheet_names) > 1:
+                yield from self._load_parallel(sheet_names)
+                return
+
         base_metadata = self._create_base_metadata()
-        
-        for sheet_name, df in sheets.items():
-            if self.output_format == "markdown":
-                metadata = base_metadata.copy()
-                metadata["sheet_name"] = sheet_name
-                documents.append(
-                    Document(
-                        content=df.to_markdown(index=False),
-                        metadata=metadata,
-                        source=str(self.file_path),
+        if self.stream:
+            yield from self._load_streaming(base_metadata)
+            return
+
+        # シートはパースせずにブックだけを開き、必要なシートを順に読み込む
+        with pd.ExcelFile(self.file_path) as workbook:
+            for sheet_name in self._select_sheets(workbook.sheet_names):
+                df = _drop_blank_rows(
+                    workbook.parse(sheet_name, nrows=self.max_rows)
+                )
+                if not self._renders_natively:
+                    yield self._create_table_document(
+                        df, sheet_name, base_metadata
+                    )
+                    continue
+
+                if self._loads_lazily:
+                    table = ColumnarTable.from_dataframe(df)
+                    yield from self._create_lazy_documents(
+                        table, sheet_name, base_metadata
                     )
+                    continue
+
+                # 値は列単位でまとめて変換する
+                records = zip(df.index.tolist(), dataframe_rows(df))
+                yield from self._create_sheet_documents(
+                    df.columns.tolist(), records, sheet_name, base_metadata
                 )
-                continue
-
-            # 行ごとにDocumentを作成
-            for index, row in df.iterrows():
-                # 行の内容をテキスト化
-                content = "\n".join([f"{col}: {val}" for col, val in row.items()])
-                
-                metadata = base_metadata.copy()
-                metadata["sheet_name"] = sheet_name
-                metadata["row_index"] = index
-                
-                documents.append(
-                    Document(
-                        content=content,
-                        metadata=metadata,
-                        source=str(self.file_path),
+
+    def _load_streaming(
+        self, base_metadata: dict[str, Any]
+    ) -> Iterator[Document]:
+        """openpyxl の read_only モードでシートの行を順に読み込む"""
+        workbook = openpyxl.load_workbook(
+            self.file_path, read_only=True, data_only=True
+        )
+        try:
+            for sheet_name in self._select_sheets(workbook.sheetnames):
+                header, records = self._iter_sheet_rows(workbook[sheet_name])
+                if not self._renders_natively:
+                    df = pd.DataFrame(
+                        [values for _, values in records], columns=header
+                    )
+                    yield self._create_table_document(
+                        df, sheet_name, base_metadata
+                    )
+                    continue
+
+                if self._loads_lazily:
+                    table = ColumnarTable.from_rows(header, records)
+                    yield from self._create_lazy_documents(
+                        table, sheet_name, base_metadata
                     )
+                    continue
+
+                yield from self._create_sheet_documents(
+                    header, records, sheet_name, base_metadata
                 )
-            
-        return documents
+        finally:
+            workbook.close()
+
+    @property
+    def _renders_natively(self) -> bool:
+        # row モードとネイティブのMarkdown変換は行を順に処理できる（DataFrameが不要）
+        return (
+            self.output_format != "markdown"
+            or self.markdown_renderer == "native"
+        )
+
+    @property
+    def _loads_lazily(self) -> bool:
+        return self.lazy and self.output_format != "markdown"
+
+    def _load_parallel(self, sheet_names: list[str]) -> Iterator[Document]:
+        """シートをワーカープロセスに分配して読み込む"""
+        workers = min(self.num_workers, len(sheet_names))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # map は完了順ではなくシートの順序で結果を返す
+            for documents in executor.map(
+                _load_sheet, [self] * len(sheet_names), sheet_names
+            ):
+                yield from documents
+
+    def _list_sheets(self) -> list[str]:
+        """シートを読み込まずにシート名の一覧を取得"""
+        if openpyxl is not None:
+            workbook = openpyxl.load_workbook(self.file_path, read_only=True)
+            try:
+                return workbook.sheetnames
+            finally:
+                workbook.close()
+        with pd.ExcelFile(self.file_path) as workbook:
+            return list(workbook.sheet_names)
+
+    def _iter_sheet_rows(
+        self,
+        worksheet: Any,
+    ) -> tuple[list[str], Iterator[tuple[int, tuple[Any, ...]]]]:
+        """シートのヘッダーと、(行番号, 行の値) のイテレータを返す
+
+        max_rows 行までのデータ行のうち、空行を除いたものを返します。
+        """
+        rows = worksheet.iter_rows(values_only=True)
+        first = next(rows, None) or ()
+        # 名前のない列は pandas と同じく "Unnamed: 列番号" とする
+        header = [
+            f"Unnamed: {i}" if value is None else str(value)
+            for i, value in enumerate(first)
+        ]
+        width = len(header)
+
+        if self.max_rows is not None:
+            rows = islice(rows, self.max_rows)
+        records = (
+            (index, row[:width] + (None,) * (width - len(row)))
+            for index, row in enumerate(rows)
+            if any(value is not None for value in row)
+        )
+        return header, records
+
+    def _select_sheets(self, available: list[str]) -> list[str]:
+        """sheet_names を検証し、処理するシート名を返す"""
+        if self.sheet_names is None:
+            return list(available)
+        missing = [name for name in self.sheet_names if name not in available]
+        if missing:
+            raise ValueError(
+                f"Worksheet not found in {self.file_path.name}: {missing}"
+            )
+        return self.sheet_names
+
+    def _create_table_document(
+        self,
+        df: Any,
+        sheet_name: str,
+        base_metadata: dict[str, Any],
+    ) -> Document:
+        """シート全体をMarkdownテーブルにしたDocumentを作成"""
+        metadata = base_metadata.copy()
+        metadata["sheet_name"] = sheet_name
+        return Document(
+            content=df.to_markdown(index=False),
+            metadata=metadata,
+            source=str(self.file_path),
+        )
+
+    def _create_sheet_documents(
+        self,
+        columns: list[Any],
+        records: Iterable[tuple[int, Sequence[Any]]],
+        sheet_name: str,
+        base_metadata: dict[str, Any],
+    ) -> Iterator[Document]:
+        """(行番号, 行の値) から行グループまたはMarkdownテーブルのDocumentを作成"""
+        if self.output_format == "markdown":
+            tables = iter_markdown_tables(
+                columns,
+                records,
+                max_rows=self.max_table_rows,
+                max_length=self.max_table_tokens,
+                length_function=self.length_function or len,
+            )
+            for row_index, row_count, table in tables:
+                yield self._create_document(
+                    table, sheet_name, row_index, row_count, base_metadata
+                )
+            return
+
+        # rows_per_document 行ずつまとめてDocumentにする（空のセルは空文字列）
+        template = row_template(columns)
+        rendered = (
+            (
+                index,
+                template.format(
+                    *("" if value is None else value for value in values)
+                ),
+            )
+            for index, values in records
+        )
+        while group := list(islice(rendered, self.rows_per_document)):
+            content = "\n\n".join(text for _, text in group)
+            yield self._create_document(
+                content, sheet_name, group[0][0], len(group), base_metadata
+            )
+
+    def _create_lazy_documents(
+        self,
+        table: ColumnarTable,
+        sheet_name: str,
+        base_metadata: dict[str, Any],
+    ) -> Iterator[Document]:
+        """シートのテーブルを共有する LazyTableDocument を rows_per_document 行ずつ作成"""
+        for start in range(0, len(table), self.rows_per_document):
+            stop = min(start + self.rows_per_document, len(table))
+
+            metadata = base_metadata.copy()
+            metadata["sheet_name"] = sheet_name
+            metadata["row_index"] = table.row_index[start]
+            metadata["row_count"] = stop - start
+            metadata["table_schema"] = table.schema
+
+            yield LazyTableDocument(
+                table,
+                start,
+                stop,
+                metadata=metadata,
+                source=str(self.file_path),
+            )
+
+    def _create_document(
+        self,
+        content: str,
+        sheet_name: str,
+        row_index: int,
+        row_count: int,
+        base_metadata: dict[str, Any],
+    ) -> Document:
+        metadata = base_metadata.copy()
+        metadata["sheet_name"] = sheet_name
+        metadata["row_index"] = row_index
+        metadata["row_count"] = row_count
+
+        return Document(
+            content=content,
+            metadata=metadata,
+            source=str(self.file_path),
+        )
+
+
+def _drop_blank_rows(df: Any) -> Any:
+    """すべてのセルが空の行を除き、空行のために float になった整数の列を戻す"""
+    blank = df.isna().all(axis=1)
+    if not blank.any():
+        return df
+
+    df = df[~blank]
+    for i in range(df.shape[1]):
+        column = df.iloc[:, i]
+        if (
+            column.dtype.kind == "f"
+            and column.notna().all()
+            and (column % 1 == 0).all()
+        ):
+            df.isetitem(i, column.astype("int64"))
+    return df
+
 
+def _load_sheet(loader: ExcelLoader, sheet_name: str) -> list[Document]:
+    """ワーカープロセスで1つのシートを読み込む"""
+    sheet_loader = copy.copy(loader)
+    sheet_loader.sheet_names = [sheet_name]
+    sheet_loader.num_workers = 1
+    return sheet_loader.load()
@@ -1,75 +1,274 @@
 """pydocstruct/loaders/html_loader.py"""
+
+import re
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
 try:
-    from bs4 import BeautifulSoup
+    from bs4 import BeautifulSoup, CData, NavigableString
 except ImportError:
     BeautifulSoup = None
+    CData = NavigableString = None
+
+try:
+    from markdownify import MarkdownConverter
+except ImportError:
+    MarkdownConverter = None
 
 from pydocstruct.core.document import Document
 from pydocstruct.core.loader import BaseLoader
+from pydocstruct.processors.html_cleaner import HtmlNoiseCleaner
+from pydocstruct.processors.html_markdown import (
+    HtmlMarkdownRenderer,
+    HtmlSection,
+)
+
+_BLANK_LINES_PATTERN = re.compile(r"\n{3,}")
+_HEADING_TAGS = frozenset({"h1", "h2", "h3", "h4", "h5", "h6"})
+# get_text() が抽出する文字列の型（コメントや Doctype は含まない）
+_TEXT_TYPES = (NavigableString, CData)
+# ストリーミング変換で1回に読み込む文字数
+_READ_CHUNK_SIZE = 1 << 16
 
 
 class HtmlLoader(BaseLoader):
     """HTMLファイルを読み込むローダー"""
 
+    MARKDOWN_RENDERERS = ("markdownify", "native")
+
     def __init__(
         self,
         file_path: str | Path,
         encoding: str = "utf-8",
         preserve_structure: bool = False,
+        remove_noise: bool = False,
+        parser: str = "html.parser",
+        markdown_renderer: str = "markdownify",
+        split_by_headings: bool = False,
         **kwargs: Any,
     ) -> None:
+        """
+        Args:
+            file_path: ファイルパス
+            encoding: 文字エンコーディング
+            preserve_structure: Trueの場合、構造を保持したMarkdownとして抽出
+            remove_noise: Trueの場合、HtmlNoiseCleanerと同じ基準でナビゲーション・
+                フッター・広告などのノイズを除去
+            parser: BeautifulSoupのパーサー（"html.parser" または "lxml"）
+            markdown_renderer: preserve_structure=True の場合の変換方式。
+                "markdownify" または "native"（HtmlMarkdownRendererでDOMを構築せずに
+                ストリーミング変換。高速で、巨大なページもメモリを抑えて処理可能）
+            split_by_headings: Trueの場合、h1〜h6の見出しごとにDocumentを作成し、
+                header / header_level / header_path / anchor_id をメタデータに付与。
+                preserve_structure=True と併用する場合は常にネイティブ変換を使用
+        """
         super().__init__(file_path, encoding, **kwargs)
+        if markdown_renderer not in self.MARKDOWN_RENDERERS:
+            raise ValueError(
+                f"Unknown markdown_renderer: {markdown_renderer}. "
+                f"Expected one of {', '.join(self.MARKDOWN_RENDERERS)}"
+            )
         self.preserve_structure = preserve_structure
-        
+        self.remove_noise = remove_noise
+        self.parser = parser
+        self.markdown_renderer = markdown_renderer
+        self.split_by_headings = split_by_headings
+
+        if self._streams_markdown:
+            # ネイティブ変換は標準ライブラリのみで動作する
+            return
         if BeautifulSoup is None:
             raise ImportError(
                 "beautifulsoup4がインストールされていません。"
                 "pip install beautifulsoup4 でインストールしてください。"
             )
+        if preserve_structure and MarkdownConverter is None:
+            raise ImportError(
+                "markdownify is required for preserve_structure=True. "
+                "pip install markdownify"
+            )
 
     def load(self) -> list[Document]:
         """HTMLファイルを読み込む
-        
+
         script, styleタグを除去してテキストを抽出します。
         titleタグをメタデータとして取得します。
         preserve_structure=Trueの場合、markdownifyを使用して構造を保持したMarkdownとして抽出します。
+
+        ファイルは一度だけパースし、ノイズ除去・タイトル取得・テキスト/Markdown
+        変換はすべて同じツリー上で行います（再シリアライズ・再パースはしません）。
+        markdown_renderer="native" の場合はツリーを構築せず、ファイルを分割して
+        読み込みながらMarkdownに変換します。
         """
-        with open(self.file_path, "r", encoding=self.encoding) as file:
-            soup = BeautifulSoup(file, "html.parser")
+        return list(self.lazy_load())
+
+    def lazy_load(self) -> Iterator[Document]:
+        """HTMLファイルを読み込み、Documentを1つずつ返す
+
+        split_by_headings=Trueの場合、h1〜h6の見出しごとのセクションを
+        検出した順に返します。
+
+        Yields:
+            Document: 読み込んだDocument
+        """
+        if self._streams_markdown:
+            yield from self._load_streaming()
+            return
 
-        # script, styleタグを削除
-        for script in soup(["script", "style"]):
-            script.decompose()
+        with open(self.file_path, "r", encoding=self.encoding) as file:
+            soup = HtmlNoiseCleaner.parse(file, self.parser)
 
         metadata = self._create_base_metadata()
-        
-        # タイトルがあればメタデータに追加
+
+        # タイトルがあればメタデータに追加（head はノイズとして除去されるため先に取得）
         if soup.title:
             metadata["title"] = soup.title.string
 
-        if self.preserve_structure:
-            try:
-                import markdownify
-                text = markdownify.markdownify(str(soup), heading_style="ATX", strip=["script", "style"])
-                # 連続する空行を削減
-                import re
-                text = re.sub(r'\n{3,}', '\n\n', text).strip()
-            except ImportError:
-                 # fallback if markdownify is not present (though we will advise user to install it)
-                 # For robustness, we could raise error or warn. Let's warn/error.
-                 raise ImportError("markdownify is required for preserve_structure=True. pip install markdownify")
+        if self.remove_noise:
+            HtmlNoiseCleaner.prune(soup)
         else:
-            # テキストを抽出
-            text = soup.get_text(separator="\n", strip=True)
-
-        return [
-            Document(
-                content=text,
-                metadata=metadata,
-                source=str(self.file_path),
+            # script, styleタグを削除
+            for script in soup(["script", "style"]):
+                script.decompose()
+
+        if self.split_by_headings:
+            yield from self._split_soup(soup, metadata)
+            return
+
+        yield Document(
+            content=self._render(soup),
+            metadata=metadata,
+            source=str(self.file_path),
+        )
+
+    @property
+    def _streams_markdown(self) -> bool:
+        # 見出し分割したMarkdownはネイティブ変換でのみ作成できる
+        return self.preserve_structure and (
+            self.markdown_renderer == "native" or self.split_by_headings
+        )
+
+    def _load_streaming(self) -> Iterator[Document]:
+        """HtmlMarkdownRendererでファイルをストリーミング変換
+
+        見出し分割時は、読み込みの途中でも完了したセクションから返します。
+        """
+        renderer = HtmlMarkdownRenderer(
+            remove_noise=self.remove_noise,
+            split_by_headings=self.split_by_headings,
+        )
+        metadata = self._create_base_metadata()
+
+        with open(self.file_path, "r", encoding=self.encoding) as file:
+            while piece := file.read(_READ_CHUNK_SIZE):
+                renderer.feed(piece)
+                for section in renderer.pop_sections():
+                    yield self._create_section(
+                        section, renderer.title, metadata
+                    )
+        renderer.close()
+
+        if self.split_by_headings:
+            for section in renderer.pop_sections():
+                yield self._create_section(section, renderer.title, metadata)
+            return
+
+        if renderer.title:
+            metadata["title"] = renderer.title
+        yield Document(
+            content=renderer.markdown,
+            metadata=metadata,
+            source=str(self.file_path),
+        )
+
+    def _split_soup(
+        self,
+        soup: "BeautifulSoup",
+        base_metadata: dict[str, Any],
+    ) -> Iterator[Document]:
+        """パース済みツリーを1回走査し、見出しごとにテキストを分割
+
+        各セクションのテキストは get_text(separator="\n", strip=True) と同じ形式です。
+        """
+        # 祖先見出しのスタック: (レベル, 見出し)
+        ancestors: list[tuple[int, str]] = []
+        section = HtmlSection(content="")
+        texts: list[str] = []
+
+        for node in soup.descendants:
+            if type(node) in _TEXT_TYPES:
+                text = node.strip()
+                if text:
+                    texts.append(text)
+                continue
+            if getattr(node, "name", None) not in _HEADING_TAGS:
+                continue
+
+            # 前のセクションを出力
+            if texts:
+                section.content = "\n".join(texts)
+                yield self._create_section(section, None, base_metadata)
+            texts = []
+
+            # 新しいセクションを開始
+            level = int(node.name[1])
+            header = node.get_text(" ", strip=True)
+            while ancestors and ancestors[-1][0] >= level:
+                ancestors.pop()
+            ancestors.append((level, header))
+            section = HtmlSection(
+                content="",
+                header=header,
+                header_level=level,
+                header_path=" > ".join(title for _, title in ancestors),
+                anchor_id=node.get("id") or self._find_anchor(node),
+            )
+
+        # 最後のセクションを出力
+        if texts:
+            section.content = "\n".join(texts)
+            yield self._create_section(section, None, base_metadata)
+
+    @staticmethod
+    def _find_anchor(heading: Any) -> str | None:
+        """見出し内の <a id=...> / <a name=...> を探す"""
+        for anchor in heading.find_all("a"):
+            anchor_id = anchor.get("id") or anchor.get("name")
+            if anchor_id:
+                return anchor_id
+        return None
+
+    def _create_section(
+        self,
+        section: HtmlSection,
+        title: str | None,
+        base_metadata: dict[str, Any],
+    ) -> Document:
+        """セクションからDocumentを作成"""
+        section_metadata = base_metadata.copy()
+        if title:
+            section_metadata["title"] = title
+        section_metadata["header"] = section.header
+        section_metadata["header_level"] = section.header_level
+        section_metadata["header_path"] = section.header_path
+        section_metadata["anchor_id"] = section.anchor_id
+
+        return Document(
+            content=section.content,
+            metadata=section_metadata,
+            source=str(self.file_path),
+        )
+
+    def _render(self, soup: "BeautifulSoup") -> str:
+        """パース済みツリーをテキストまたはMarkdownに変換"""
+        if self.preserve_structure:
+            converter = MarkdownConverter(
+                heading_style="ATX", strip=["script", "style"]
             )
-        ]
+            text = converter.convert_soup(soup)
+            # 連続する空行を削減
+            return _BLANK_LINES_PATTERN.sub("\n\n", text).strip()
 
+        # テキストを抽出
+        return soup.get_text(separator="\n", strip=True)
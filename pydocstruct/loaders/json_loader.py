@@ -1,54 +1,373 @@
 """pydocstruct/loaders/json_loader.py"""
+
 import json
+from collections.abc import Iterator, Sequence
+from itertools import islice
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO
 
 from pydocstruct.core.document import Document
 from pydocstruct.core.loader import BaseLoader
 
+# JSON Lines として扱う拡張子
+JSON_LINES_EXTENSIONS = (".jsonl", ".ndjson")
+# ストリーミング時に1回に読み込む文字数
+_READ_CHUNK_SIZE = 1 << 16
+_WHITESPACE = " \t\n\r"
+_NUMBER_CHARS = frozenset("0123456789.eE+-")
+# 途切れたトークン（"\uXXXX" など）がエラーになる位置の、バッファ末尾からの最大距離
+_MAX_TOKEN_TAIL = 6
+
 
 class JsonLoader(BaseLoader):
-    """JSONファイルを読み込むローダー"""
+    """JSONファイルを読み込むローダー
+
+    JSON Lines（.jsonl / .ndjson）は行単位で読み込み、batch_size 行ずつ
+    まとめてパースします。stream=True の場合、トップレベルの配列を
+    先頭から少しずつデコードし、要素ごとにDocumentを返します。
+    どちらも lazy_load() と組み合わせると一定のメモリで読み込めます。
+
+    content_key / metadata_keys を指定すると、各レコードから必要なフィールド
+    だけを取り出します。パスはドット区切りのキーで、リストの要素は
+    インデックスで指定します（例: "body", "author.name", "tags.0"）。
+    先頭の "$." は省略できます。取り出しはレコードをデコードした直後に
+    行い、レコード全体を文字列化することはありません。
+
+    使用例:
+        loader = JsonLoader(
+            "articles.jsonl",
+            content_key=["title", "body"],
+            metadata_keys=["id", "author.name"],
+        )
+
+    Attributes:
+        json_lines (bool): JSON Lines として読み込むか
+        stream (bool): トップレベル配列をストリーミングでデコードするか
+        batch_size (int): JSON Lines で一度にパースする行数
+        content_key (list[str]): コンテンツにするフィールドのパス
+        metadata_keys (list[str]): メタデータにするフィールドのパス
+    """
+
+    def __init__(
+        self,
+        file_path: str | Path,
+        encoding: str = "utf-8",
+        json_lines: bool | None = None,
+        stream: bool = False,
+        batch_size: int = 1000,
+        content_key: str | Sequence[str] | None = None,
+        metadata_keys: Sequence[str] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """
+        Args:
+            file_path: ファイルパス
+            encoding: 文字エンコーディング
+            json_lines: JSON Lines として読み込むか（省略時は拡張子で判定）
+            stream: トップレベル配列を要素ごとにストリーミングでデコードするか
+            batch_size: JSON Lines で一度にパースする行数
+            content_key: コンテンツにするフィールドのパス。複数指定した場合は
+                改行で連結します（省略時はレコード全体を文字列化）
+            metadata_keys: メタデータにするフィールドのパス（パスをキーとして格納）
+        """
+        super().__init__(file_path, encoding, **kwargs)
+        if json_lines is None:
+            json_lines = self.file_path.suffix.lower() in JSON_LINES_EXTENSIONS
+        self.json_lines = json_lines
+        self.stream = stream
+        self.batch_size = max(batch_size, 1)
+
+        if isinstance(content_key, str):
+            content_key = [content_key]
+        self.content_key = list(content_key or [])
+        self.metadata_keys = list(metadata_keys or [])
+        # パスは生成時に一度だけ分解する
+        self._content_paths = [_split_path(path) for path in self.content_key]
+        self._metadata_paths = [
+            (key, _split_path(key)) for key in self.metadata_keys
+        ]
 
     def load(self) -> list[Document]:
         """JSONファイルを読み込む
-        
+
         JSONがリストの場合は複数のDocumentを生成し、
         辞書の場合は単一のDocumentを生成します。
-        コンテンツとして使用するキーを指定することも可能です（未実装）。
-        現在はJSON全体を文字列化してcontentとします。
+        content_key を指定した場合は指定したフィールドを、
+        指定しない場合はJSON全体を文字列化してcontentとします。
         """
-        with open(self.file_path, "r", encoding=self.encoding) as file:
-            data = json.load(file)
+        return list(self.lazy_load())
 
-        documents = []
+    def lazy_load(self) -> Iterator[Document]:
+        """JSONファイルを読み込み、Documentを1つずつ返す
+
+        Yields:
+            Document: 読み込んだDocument
+        """
         base_metadata = self._create_base_metadata()
 
+        with open(self.file_path, "r", encoding=self.encoding) as file:
+            if self.json_lines:
+                # index は空行を除いたレコードの順番、line_number はファイル上の行番号
+                records = self._iter_json_lines(file)
+                for i, (line_number, item) in enumerate(records):
+                    yield self._create_item_document(
+                        item, i, base_metadata, line_number
+                    )
+                return
+
+            if self.stream:
+                items = self._iter_array(file)
+                # トップレベルが配列でない場合は最初の値がそのまま返る
+                first = next(items)
+                if first is _ARRAY_START:
+                    for i, item in enumerate(items):
+                        yield self._create_item_document(
+                            item, i, base_metadata
+                        )
+                    return
+                data = first
+            else:
+                data = json.load(file)
+
         if isinstance(data, list):
             for i, item in enumerate(data):
-                # 文字列以外の場合はJSON文字列に変換
-                content = item if isinstance(item, str) else json.dumps(item, ensure_ascii=False)
-                
-                metadata = base_metadata.copy()
-                metadata["index"] = i
-                
-                documents.append(
-                    Document(
-                        content=content,
-                        metadata=metadata,
-                        source=str(self.file_path),
-                    )
-                )
+                yield self._create_item_document(item, i, base_metadata)
+        elif self._content_paths or self._metadata_paths:
+            yield self._create_item_document(data, None, base_metadata)
         else:
             # 単一のオブジェクト
             content = json.dumps(data, ensure_ascii=False, indent=2)
-            documents.append(
-                Document(
-                    content=content,
-                    metadata=base_metadata,
-                    source=str(self.file_path),
+            yield Document(
+                content=content,
+                metadata=base_metadata,
+                source=str(self.file_path),
+            )
+
+    def _create_item_document(
+        self,
+        item: Any,
+        index: int | None,
+        base_metadata: dict[str, Any],
+        line_number: int | None = None,
+    ) -> Document:
+        """配列要素・JSON Lines のレコードからDocumentを作成"""
+        if self._content_paths:
+            # 指定フィールドだけを文字列化する（見つからないフィールドは無視）
+            values = [_resolve(item, path) for path in self._content_paths]
+            content = "\n".join(
+                _to_text(value) for value in values if value is not None
+            )
+        else:
+            content = _to_text(item)
+
+        metadata = base_metadata.copy()
+        if index is not None:
+            metadata["index"] = index
+        if line_number is not None:
+            metadata["line_number"] = line_number
+        for key, path in self._metadata_paths:
+            metadata[key] = _resolve(item, path)
+
+        return Document(
+            content=content,
+            metadata=metadata,
+            source=str(self.file_path),
+        )
+
+    def _iter_json_lines(self, file: TextIO) -> Iterator[tuple[int, Any]]:
+        """JSON Lines を batch_size 行ずつまとめてパース
+
+        Yields:
+            tuple[int, Any]: (行番号, 値)。空行は読み飛ばします。
+        """
+        numbered = (
+            (n, line) for n, line in enumerate(file, 1) if not line.isspace()
+        )
+
+        while True:
+            batch = list(islice(numbered, self.batch_size))
+            if not batch:
+                return
+
+            # 1回の json.loads で複数行をまとめてデコードする
+            try:
+                values = json.loads(
+                    "[" + ",".join(line for _, line in batch) + "]"
                 )
+            except json.JSONDecodeError:
+                values = None
+            if values is None or len(values) != len(batch):
+                # 不正な行を特定するため1行ずつデコードし直す
+                values = [_loads_line(line, n) for n, line in batch]
+
+            yield from zip((n for n, _ in batch), values)
+
+    def _iter_array(self, file: TextIO) -> Iterator[Any]:
+        """トップレベル配列の要素を先頭から順にデコード
+
+        配列の場合は最初に _ARRAY_START を返し、続けて要素を返します。
+        配列でない場合はファイル全体をデコードした値を1つだけ返します。
+        """
+        reader = _ChunkReader(file)
+        if not reader.skip_whitespace():
+            raise json.JSONDecodeError(
+                "Expecting value", reader.buffer, reader.position
             )
+        if reader.peek() != "[":
+            yield json.loads(reader.buffer[reader.position :] + file.read())
+            return
+
+        yield _ARRAY_START
+        reader.position += 1
+        decoder = json.JSONDecoder()
+
+        reader.skip_whitespace()
+        if reader.peek() == "]":
+            reader.position += 1
+            if reader.skip_whitespace():
+                raise json.JSONDecodeError(
+                    "Extra data", reader.buffer, reader.position
+                )
+            return
+
+        while True:
+            yield reader.decode(decoder)
+
+            if not reader.skip_whitespace():
+                raise json.JSONDecodeError(
+                    "Unterminated array", reader.buffer, reader.position
+                )
+            delimiter = reader.peek()
+            reader.position += 1
+            if delimiter == "]":
+                # json.load と同様に、配列の後ろに空白以外が残っていればエラー
+                if reader.skip_whitespace():
+                    raise json.JSONDecodeError(
+                        "Extra data", reader.buffer, reader.position
+                    )
+                return
+            if delimiter != ",":
+                raise json.JSONDecodeError(
+                    "Expecting ',' delimiter",
+                    reader.buffer,
+                    reader.position - 1,
+                )
+            reader.skip_whitespace()
+
+
+# _iter_array が配列の開始を示す目印
+_ARRAY_START = object()
+
+
+class _ChunkReader:
+    """ファイルを少しずつ読み込みながら JSON 値をデコードするバッファ"""
+
+    def __init__(self, file: TextIO) -> None:
+        self.file = file
+        self.buffer = ""
+        self.position = 0
+        self.eof = False
+
+    def peek(self) -> str:
+        return self.buffer[self.position : self.position + 1]
+
+    def fill(self, size: int | None = None) -> bool:
+        """未処理部分を残してバッファを読み足す（読み足せなければ False）"""
+        if self.eof:
+            return False
+        data = self.file.read(size or _READ_CHUNK_SIZE)
+        if not data:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.position :] + data
+        self.position = 0
+        return True
+
+    def skip_whitespace(self) -> bool:
+        """空白を読み飛ばす（データが残っていれば True）"""
+        while True:
+            length = len(self.buffer)
+            while (
+                self.position < length
+                and self.buffer[self.position] in _WHITESPACE
+            ):
+                self.position += 1
+            if self.position < length:
+                return True
+            if not self.fill():
+                return False
+
+    def decode(self, decoder: json.JSONDecoder) -> Any:
+        """現在位置の値を1つデコード
+
+        値がバッファ末尾で途切れている可能性がある間は読み足して再試行します。
+        読み足す量を未処理部分の長さに合わせて増やすため、巨大な要素でも
+        再試行の合計コストは線形に収まります。
+        """
+        while True:
+            try:
+                value, end = decoder.raw_decode(self.buffer, self.position)
+            except json.JSONDecodeError as e:
+                # 途中で途切れた値のエラーだけを読み足しで解消する
+                # （不正なJSONのためにファイル全体を読み込まないように）
+                truncated = e.pos >= len(
+                    self.buffer
+                ) - _MAX_TOKEN_TAIL or e.msg.startswith("Unterminated string")
+                if not truncated or not self.fill(
+                    max(_READ_CHUNK_SIZE, len(self.buffer) - self.position)
+                ):
+                    raise
+                continue
+            # 数値は末尾で途切れていても（"1." や "2e+" の手前まで）デコードに成功するため、
+            # 値の後ろに残るのが数値の続きになり得る2文字以下なら読み足して再試行する
+            tail = self.buffer[end : end + 3]
+            if (
+                len(tail) <= 2
+                and _NUMBER_CHARS.issuperset(tail)
+                and self.fill(
+                    max(_READ_CHUNK_SIZE, len(self.buffer) - self.position)
+                )
+            ):
+                continue
+            self.position = end
+            return value
+
+
+def _split_path(path: str) -> tuple[str, ...]:
+    """ "$.a.b.0" 形式のパスをキーの列に分解"""
+    if path.startswith("$"):
+        path = path[1:].lstrip(".")
+    return tuple(path.split(".")) if path else ()
+
+
+def _resolve(value: Any, path: tuple[str, ...]) -> Any:
+    """パスの値を取り出す（見つからなければ None）"""
+    for key in path:
+        if isinstance(value, dict):
+            value = value.get(key)
+        elif isinstance(value, list) and key.lstrip("-").isdigit():
+            index = int(key)
+            value = value[index] if -len(value) <= index < len(value) else None
+        else:
+            return None
+        if value is None:
+            return None
+    return value
+
+
+def _to_text(value: Any) -> str:
+    # 文字列以外の場合はJSON文字列に変換
+    return (
+        value
+        if isinstance(value, str)
+        else json.dumps(value, ensure_ascii=False)
+    )
 
-        return documents
 
+def _loads_line(line: str, line_number: int) -> Any:
+    try:
+        return json.loads(line)
+    except json.JSONDecodeError as e:
+        raise json.JSONDecodeError(
+            f"{e.msg} (line {line_number})", e.doc, e.pos
+        ) from None
@@ -1,21 +1,33 @@
 """pydocstruct/loaders/markdown_loader.py"""
+
+import re
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
 from pydocstruct.core.document import Document
 from pydocstruct.core.loader import BaseLoader
 
+# 見出し行とコードフェンス行のみにマッチするパターン（バッファ全体を1回走査する）
+_HEADER_OR_FENCE_PATTERN = re.compile(
+    r"^(?:"
+    r" {0,3}(?P<fence>`{3,}|~{3,})(?P<info>.*)"
+    r"|(?P<hashes>#{1,6})[ \t]+(?P<title>.+?)(?:[ \t]+#+)?[ \t]*"
+    r")$",
+    re.MULTILINE,
+)
+
 
 class MarkdownLoader(BaseLoader):
     """Markdownファイルを読み込むローダー
-    
+
     Markdownファイルをテキストとして読み込み、
     見出しレベルでの分割オプションを提供します。
-    
+
     Attributes:
         split_by_headers (bool): 見出しで分割するか
     """
-    
+
     def __init__(
         self,
         file_path: str | Path,
@@ -24,7 +36,7 @@ class MarkdownLoader(BaseLoader):
         **kwargs: Any,
     ) -> None:
         """MarkdownLoaderの初期化
-        
+
         Args:
             file_path (str | Path): Markdownファイルのパス
             encoding (str, optional): エンコーディング. Defaults to "utf-8".
@@ -33,102 +45,146 @@ class MarkdownLoader(BaseLoader):
         """
         super().__init__(file_path, encoding, **kwargs)
         self.split_by_headers = split_by_headers
-    
+
     def load(self) -> list[Document]:
         """Markdownファイルを読み込む
-        
+
         Returns:
             list[Document]: Documentリスト
         """
+        return list(self.lazy_load())
+
+    def lazy_load(self) -> Iterator[Document]:
+        """Markdownファイルを読み込み、Documentを1つずつ返す
+
+        split_by_headers=Trueの場合、見出しセクションを検出した順に返します。
+
+        Yields:
+            Document: 読み込んだDocument
+        """
         # ファイルを読み込む
         with open(self.file_path, "r", encoding=self.encoding) as file:
             content = file.read()
-        
+
         # 基本メタデータを作成
         metadata = self._create_base_metadata()
-        
+
         # 見出しで分割する場合
         if self.split_by_headers:
-            return self._split_by_headers(content, metadata)
-        
+            yield from self._split_by_headers(content, metadata)
+            return
+
         # 分割しない場合は単一のDocumentを返す
-        document = Document(
+        yield Document(
             content=content,
             metadata=metadata,
             source=str(self.file_path),
         )
-        
-        return [document]
-    
+
     def _split_by_headers(
         self,
         content: str,
         base_metadata: dict[str, Any],
-    ) -> list[Document]:
+    ) -> Iterator[Document]:
         """見出しでMarkdownを分割
-        
+
+        コンパイル済みパターンでバッファ全体を1回だけ走査します。
+        コードフェンス内の `#` 行は見出しとして扱いません。
+        各セクションには祖先見出しを含む見出しパス（header_path）と
+        文字オフセット（start_index, end_index）をメタデータとして付与します。
+
         Args:
             content (str): Markdownコンテンツ
             base_metadata (dict[str, Any]): 基本メタデータ
-            
-        Returns:
-            list[Document]: 分割されたDocumentリスト
+
+        Yields:
+            Document: 分割されたDocument
         """
-        import re
-        
-        # 見出しパターン（# で始まる行）
-        header_pattern = r'^(#{1,6})\s+(.+)$'
-        
-        # 結果格納用リスト
-        documents = []
-        current_section = []
+        # 祖先見出しのスタック: (レベル, 見出し)
+        ancestors: list[tuple[int, str]] = []
+        fence = None
+
+        section_start = 0
         current_header = None
         current_level = 0
-        
-        # 行ごとに処理
-        for line in content.split('\n'):
-            # 見出し行かチェック
-            match = re.match(header_pattern, line)
-            
-            if match:
-                # 前のセクションを保存
-                if current_section:
-                    section_content = '\n'.join(current_section).strip()
-                    if section_content:
-                        # メタデータを作成
-                        section_metadata = base_metadata.copy()
-                        section_metadata["header"] = current_header
-                        section_metadata["header_level"] = current_level
-                        
-                        # Documentを作成
-                        doc = Document(
-                            content=section_content,
-                            metadata=section_metadata,
-                            source=str(self.file_path),
-                        )
-                        documents.append(doc)
-                
-                # 新しいセクションを開始
-                current_level = len(match.group(1))
-                current_header = match.group(2)
-                current_section = [line]
-            else:
-                # 現在のセクションに行を追加
-                current_section.append(line)
-        
-        # 最後のセクションを処理
-        if current_section:
-            section_content = '\n'.join(current_section).strip()
-            if section_content:
-                section_metadata = base_metadata.copy()
-                section_metadata["header"] = current_header
-                section_metadata["header_level"] = current_level
-                
-                doc = Document(
-                    content=section_content,
-                    metadata=section_metadata,
-                    source=str(self.file_path),
-                )
-                documents.append(doc)
-        
-        return documents
+        current_path = ""
+
+        for match in _HEADER_OR_FENCE_PATTERN.finditer(content):
+            marker = match.group("fence")
+            if marker:
+                # コードフェンスの開始・終了を追跡
+                if fence is None:
+                    fence = marker
+                elif (
+                    marker[0] == fence[0]
+                    and len(marker) >= len(fence)
+                    and not match.group("info").strip()
+                ):
+                    fence = None
+                continue
+
+            if fence is not None:
+                continue
+
+            # 前のセクションを出力
+            doc = self._create_section(
+                content,
+                section_start,
+                match.start(),
+                current_header,
+                current_level,
+                current_path,
+                base_metadata,
+            )
+            if doc is not None:
+                yield doc
+
+            # 新しいセクションを開始
+            current_level = len(match.group("hashes"))
+            current_header = match.group("title")
+            while ancestors and ancestors[-1][0] >= current_level:
+                ancestors.pop()
+            ancestors.append((current_level, current_header))
+            current_path = " > ".join(title for _, title in ancestors)
+            section_start = match.start()
+
+        # 最後のセクションを出力
+        doc = self._create_section(
+            content,
+            section_start,
+            len(content),
+            current_header,
+            current_level,
+            current_path,
+            base_metadata,
+        )
+        if doc is not None:
+            yield doc
+
+    def _create_section(
+        self,
+        content: str,
+        start: int,
+        end: int,
+        header: str | None,
+        level: int,
+        header_path: str,
+        base_metadata: dict[str, Any],
+    ) -> Document | None:
+        """セクション範囲からDocumentを作成（空のセクションはNone）"""
+        section_content = content[start:end].strip()
+        if not section_content:
+            return None
+
+        section_metadata = base_metadata.copy()
+        section_metadata["header"] = header
+        section_metadata["header_level"] = level
+        section_metadata["header_path"] = header_path
+        section_metadata["start_index"] = start
+        section_metadata["end_index"] = end
+
+        return Document(
+            content=section_content,
+            metadata=section_metadata,
+            source=str(self.file_path),
+        )
@@ -1,4 +1,13 @@
 """pydocstruct/loaders/pdf_loader.py"""
+
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from contextlib import nullcontext
+from itertools import islice
 from pathlib import Path
 from typing import Any
 
@@ -17,20 +26,50 @@ except ImportError:
 from pydocstruct.core.document import Document
 from pydocstruct.core.loader import BaseLoader
 
+# Page ranges submitted per worker process. More ranges than workers
+# balance pages of uneven cost; each range re-opens the PDF once.
+_RANGES_PER_WORKER = 4
+
 
 class PDFLoader(BaseLoader):
     """Loader for PDF files
-    
+
     Extracts text from PDF files using the pypdf library.
     Also supports OCR and layout preservation options.
-    
+
+    pypdf's text extraction is pure Python and CPU-bound. With
+    num_workers > 1 the pages are split into contiguous ranges that are
+    extracted in worker processes, each opening its own PdfReader; the
+    results are reassembled in page order.
+
+    pages / max_pages restrict loading to some pages, so previewing the
+    first pages of a huge PDF only extracts those pages. Document-level
+    metadata (file info, page_count, pdf_metadata) is computed once and
+    shared by every page Document.
+
+    OCR is batched: extracted pages are examined in windows of
+    ocr_batch_size pages, the pages without a text layer in a window are
+    rasterized with one convert_from_path() call per contiguous run
+    (one Poppler process instead of one per page), and Tesseract runs
+    over a pool of ocr_workers threads. Rasterized images are only held
+    for the current window.
+
     Attributes:
         extract_images (bool): Flag to extract images
         use_layout (bool): Whether to use layout preservation mode
         use_ocr (bool): Whether to use OCR
         ocr_lang (str): OCR language (e.g., "eng", "jpn")
+        num_workers (int): Number of worker processes for text extraction
+        pages (list[int] | None): 1-based page numbers to load (None for all)
+        max_pages (int | None): Maximum number of pages to load
+        ocr_dpi (int): Rasterization resolution for OCR
+        ocr_grayscale (bool): Rasterize OCR pages in grayscale
+        ocr_thread_count (int): Poppler threads per rasterization call
+        ocr_workers (int): Number of concurrent Tesseract processes
+        ocr_batch_size (int): Pages examined (and at most rasterized) per
+            OCR batch
     """
-    
+
     def __init__(
         self,
         file_path: str | Path,
@@ -38,88 +77,286 @@ class PDFLoader(BaseLoader):
         use_layout: bool = False,
         use_ocr: bool = False,
         ocr_lang: str = "eng",
+        num_workers: int = 1,
+        pages: Sequence[int] | None = None,
+        max_pages: int | None = None,
+        ocr_dpi: int = 200,
+        ocr_grayscale: bool = False,
+        ocr_thread_count: int = 1,
+        ocr_workers: int = 1,
+        ocr_batch_size: int = 16,
         **kwargs: Any,
     ) -> None:
+        """
+        Args:
+            file_path: Path to the PDF file
+            extract_images: Flag to extract images
+            use_layout: Use pypdf's layout extraction mode
+            use_ocr: Run OCR on pages without a text layer
+            ocr_lang: OCR language (e.g., "eng", "jpn")
+            num_workers: Number of worker processes extracting page ranges
+                in parallel (1 extracts in-process)
+            pages: 1-based page numbers to load, e.g. range(1, 11).
+                Pages are loaded in ascending order; numbers beyond the
+                last page are ignored.
+            max_pages: Load at most this many pages (of `pages` if given)
+            ocr_dpi: Rasterization resolution for OCR
+            ocr_grayscale: Rasterize OCR pages in grayscale (smaller images,
+                usually no loss for Tesseract)
+            ocr_thread_count: Poppler threads per convert_from_path() call
+            ocr_workers: Number of Tesseract processes run concurrently
+            ocr_batch_size: Pages examined per OCR batch. Bounds the number
+                of rasterized images held in memory.
+        """
         super().__init__(file_path, **kwargs)
-        
+
+        if pages is not None and any(page < 1 for page in pages):
+            raise ValueError("pages are 1-based page numbers")
+        if max_pages is not None and max_pages < 0:
+            raise ValueError(
+                f"max_pages must not be negative, got {max_pages}"
+            )
+        if ocr_batch_size < 1:
+            raise ValueError(
+                f"ocr_batch_size must be positive, got {ocr_batch_size}"
+            )
+
         if pypdf is None:
             raise ImportError(
                 "pypdfがインストールされていません。"
                 "pip install pypdf でインストールしてください。"
             )
-            
+
         if use_ocr and (pytesseract is None or convert_from_path is None):
             raise ImportError(
                 "OCRには pytesseract と pdf2image が必要です。"
-                "pip install pytesseract pdf2image を実行し、Tesseract-OCRとPopplerをインストールしてください。"
+                "pip install pytesseract pdf2image を実行し、"
+                "Tesseract-OCRとPopplerをインストールしてください。"
             )
-        
+
         self.extract_images = extract_images
         self.use_layout = use_layout
         self.use_ocr = use_ocr
         self.ocr_lang = ocr_lang
-    
+        self.num_workers = num_workers
+        self.pages = sorted(set(pages)) if pages is not None else None
+        self.max_pages = max_pages
+        self.ocr_dpi = ocr_dpi
+        self.ocr_grayscale = ocr_grayscale
+        self.ocr_thread_count = ocr_thread_count
+        self.ocr_workers = ocr_workers
+        self.ocr_batch_size = ocr_batch_size
+
     def load(self) -> list[Document]:
         """Load PDF file"""
-        documents = []
+        return list(self.lazy_load())
+
+    def lazy_load(self) -> Iterator[Document]:
+        """Load PDF file and yield one Document per page with text
 
+        Yields:
+            Document: Page Documents in page order
+        """
         with open(self.file_path, "rb") as file:
             pdf_reader = pypdf.PdfReader(file)
+            page_count = len(pdf_reader.pages)
+            base_metadata = self._create_document_metadata(
+                pdf_reader, page_count
+            )
+
+            texts = self._extract_texts(
+                pdf_reader, self._select_pages(page_count)
+            )
+            # Tesseract runs as a subprocess, so threads are enough to run
+            # it in parallel
+            pool = (
+                ThreadPoolExecutor(self.ocr_workers)
+                if self.use_ocr and self.ocr_workers > 1
+                else None
+            )
+            with pool or nullcontext():
+                if self.use_ocr:
+                    # Run OCR on the pages whose text is empty
+                    texts = self._ocr_empty_pages(texts, pool)
+
+                for page_num, text in texts:
+                    if not text.strip():
+                        continue
+
+                    metadata = base_metadata.copy()
+                    metadata["page_number"] = page_num
+
+                    yield Document(
+                        content=text,
+                        metadata=metadata,
+                        source=str(self.file_path),
+                        page_number=page_num,
+                    )
+
+    def _select_pages(self, page_count: int) -> list[int]:
+        """Return the 1-based page numbers to load"""
+        if self.pages is None:
+            page_numbers = list(range(1, page_count + 1))
+        else:
+            page_numbers = [page for page in self.pages if page <= page_count]
+        if self.max_pages is not None:
+            page_numbers = page_numbers[: self.max_pages]
+        return page_numbers
+
+    def _create_document_metadata(
+        self,
+        pdf_reader: "pypdf.PdfReader",
+        page_count: int,
+    ) -> dict[str, Any]:
+        """Build the metadata shared by all pages (one stat() per load)"""
+        metadata = self._create_base_metadata()
+        metadata["page_count"] = page_count
+
+        info = pdf_reader.metadata
+        if info:
+            metadata["pdf_metadata"] = {
+                "title": info.get("/Title"),
+                "author": info.get("/Author"),
+                "subject": info.get("/Subject"),
+                "creator": info.get("/Creator"),
+            }
+        return metadata
+
+    def _extract_texts(
+        self,
+        pdf_reader: "pypdf.PdfReader",
+        page_numbers: Sequence[int],
+    ) -> Iterator[tuple[int, str]]:
+        """Yield (page_number, text) in page order
+
+        With num_workers > 1, page ranges are extracted in worker processes.
+        """
+        workers = min(self.num_workers, len(page_numbers))
+        if workers <= 1:
+            for page_num in page_numbers:
+                yield page_num, _extract_page_text(
+                    pdf_reader.pages[page_num - 1], self.use_layout
+                )
+            return
+
+        ranges = _split_ranges(page_numbers, workers * _RANGES_PER_WORKER)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(
+                _extract_range,
+                [str(self.file_path)] * len(ranges),
+                ranges,
+                [self.use_layout] * len(ranges),
+            )
+            # map returns the ranges in submission (page) order
+            for page_range, texts in zip(ranges, results):
+                yield from zip(page_range, texts)
 
-            for page_num, page in enumerate(pdf_reader.pages, start=1):
-                # Determine text extraction mode
-                extraction_mode = "layout" if self.use_layout else "plain"
-                try:
-                    text = page.extract_text(extraction_mode=extraction_mode)
-                except Exception:
-                    # fallback to plain if layout fails (or old pypdf version)
-                    text = page.extract_text()
-
-                text = text or ""  # extract_text() can return None on some pages
-
-                # Run OCR if text is empty and OCR is enabled
-                if not text.strip() and self.use_ocr:
-                    text = self._perform_ocr(page_num)
-
-                if not text.strip():
-                    continue
-
-                metadata = self._create_base_metadata()
-                metadata["page_count"] = len(pdf_reader.pages)
-                metadata["page_number"] = page_num
-
-                if pdf_reader.metadata:
-                    metadata["pdf_metadata"] = {
-                        "title": pdf_reader.metadata.get("/Title"),
-                        "author": pdf_reader.metadata.get("/Author"),
-                        "subject": pdf_reader.metadata.get("/Subject"),
-                        "creator": pdf_reader.metadata.get("/Creator"),
-                    }
-
-                documents.append(Document(
-                    content=text,
-                    metadata=metadata,
-                    source=str(self.file_path),
-                    page_number=page_num,
-                ))
-
-        return documents
-
-    def _perform_ocr(self, page_num: int) -> str:
-        """Perform OCR on the specified page"""
+    def _ocr_empty_pages(
+        self,
+        texts: Iterable[tuple[int, str]],
+        pool: Executor | None,
+    ) -> Iterator[tuple[int, str]]:
+        """Replace empty page texts with OCR results, a batch at a time"""
+        texts = iter(texts)
+        while window := list(islice(texts, self.ocr_batch_size)):
+            empty = [page_num for page_num, text in window if not text.strip()]
+            ocr_texts = self._perform_ocr(empty, pool) if empty else {}
+            for page_num, text in window:
+                yield page_num, ocr_texts.get(page_num, text)
+
+    def _perform_ocr(
+        self, page_numbers: list[int], pool: Executor | None
+    ) -> dict[int, str]:
+        """Perform OCR on the specified pages
+
+        Each contiguous run of pages is rasterized by one convert_from_path()
+        call. If that call fails, the run is rasterized page by page so one
+        bad page does not lose the others. Pages that fail to rasterize or
+        recognize yield "".
+        """
+        pages = []
+        images = []
+        for first, last in _contiguous_runs(page_numbers):
+            run = range(first, last + 1)
+            rendered = self._rasterize(first, last)
+            if rendered is None and len(run) > 1:
+                rendered = [
+                    (self._rasterize(page_num, page_num) or [None])[0]
+                    for page_num in run
+                ]
+            # One image (or None) per page, so later runs stay aligned
+            rendered = list(rendered or [])[: len(run)]
+            pages.extend(run)
+            images.extend(rendered + [None] * (len(run) - len(rendered)))
+
+        recognize = pool.map if pool is not None else map
+        texts = recognize(self._recognize, images)
+        return dict(zip(pages, texts))
+
+    def _rasterize(self, first: int, last: int) -> list[Any] | None:
+        """Render pages first..last as images (None if conversion fails)"""
         try:
-            # Convert page to image (1-based index to list, but convert_from_path handles first_page/last_page)
-            # page_num is 1-based.
-            images = convert_from_path(
+            return convert_from_path(
                 str(self.file_path),
-                first_page=page_num,
-                last_page=page_num
+                dpi=self.ocr_dpi,
+                first_page=first,
+                last_page=last,
+                thread_count=self.ocr_thread_count,
+                grayscale=self.ocr_grayscale,
             )
-            
-            if not images:
-                return ""
-                
-            return pytesseract.image_to_string(images[0], lang=self.ocr_lang)
-            
         except Exception:
+            return None
+
+    def _recognize(self, image: Any) -> str:
+        if image is None:
             return ""
+        try:
+            return pytesseract.image_to_string(image, lang=self.ocr_lang)
+        except Exception:
+            return ""
+
+
+def _extract_page_text(page: "pypdf.PageObject", use_layout: bool) -> str:
+    """Extract the text of one page"""
+    # Determine text extraction mode
+    extraction_mode = "layout" if use_layout else "plain"
+    try:
+        text = page.extract_text(extraction_mode=extraction_mode)
+    except Exception:
+        # fallback to plain if layout fails (or old pypdf version)
+        text = page.extract_text()
+
+    return text or ""  # extract_text() can return None on some pages
+
+
+def _extract_range(
+    file_path: str, page_numbers: Sequence[int], use_layout: bool
+) -> list[str]:
+    """Extract a page range in a worker process with its own PdfReader"""
+    with open(file_path, "rb") as file:
+        pdf_reader = pypdf.PdfReader(file)
+        return [
+            _extract_page_text(pdf_reader.pages[page_num - 1], use_layout)
+            for page_num in page_numbers
+        ]
+
+
+def _split_ranges(
+    page_numbers: Sequence[int], parts: int
+) -> list[Sequence[int]]:
+    """Split page numbers into at most `parts` similar contiguous ranges"""
+    size = -(-len(page_numbers) // parts)
+    return [
+        page_numbers[i : i + size] for i in range(0, len(page_numbers), size)
+    ]
+
+
+def _contiguous_runs(page_numbers: Sequence[int]) -> list[tuple[int, int]]:
+    """Group ascending page numbers into (first, last) consecutive runs"""
+    runs: list[tuple[int, int]] = []
+    for page_num in page_numbers:
+        if runs and runs[-1][1] == page_num - 1:
+            runs[-1] = (runs[-1][0], page_num)
+        else:
+            runs.append((page_num, page_num))
+    return runs
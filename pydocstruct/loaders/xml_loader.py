@@ -1,4 +1,7 @@
 """pydocstruct/loaders/xml_loader.py"""
+
+import re
+from collections.abc import Iterator, Sequence
 from pathlib import Path
 from typing import Any
 
@@ -7,21 +10,82 @@ try:
 except ImportError:
     BeautifulSoup = None
 
+try:
+    from lxml import etree
+except ImportError:
+    etree = None
+
 from pydocstruct.core.document import Document
 from pydocstruct.core.loader import BaseLoader
 
+# パスに指定できる名前（XMLの名前から ":" を除いたもの）
+_NAME_PATTERN = re.compile(r"[^\W\d][\w.\-]*")
+# record_tag の1ステップ。"{uri}name" の URI には "/" が含まれうる
+_RECORD_STEP_PATTERN = re.compile(r"(\{[^{}]*\})?([^/{}]*)")
+
 
 class XmlLoader(BaseLoader):
-    """XMLファイルを読み込むローダー"""
+    """XMLファイルを読み込むローダー
+
+    record_tag を指定すると、lxml の iterparse でファイルをストリーミング
+    しながらレコード要素ごとにDocumentを作成します。処理済みの要素は
+    都度解放されるため、数GBのダンプ（Wikipedia エクスポート、商品フィード等）
+    も一定のメモリで読み込めます。
+
+    パスは名前空間を無視したローカル名を "/" で区切って指定します。
+    末尾の "@name" は属性を表します（例: "revision/timestamp", "@id"）。
+
+    使用例:
+        loader = XmlLoader(
+            "enwiki.xml",
+            record_tag="page",
+            content_fields=["revision/text"],
+            metadata_fields=["title", "id", "revision/timestamp"],
+        )
+        for doc in loader.lazy_load():
+            ...
+    """
 
     def __init__(
         self,
         file_path: str | Path,
         encoding: str = "utf-8",
+        record_tag: str | None = None,
+        content_fields: Sequence[str] | None = None,
+        metadata_fields: Sequence[str] | None = None,
         **kwargs: Any,
     ) -> None:
+        """
+        Args:
+            file_path: ファイルパス
+            encoding: 文字エンコーディング（record_tag 指定時はXML宣言が優先されます）
+            record_tag: レコード要素のタグ名。"mediawiki/page" のように親要素を
+                含めて限定することもできます。"{http://example.com/ns}page" の
+                ように名前空間を付けると、その名前空間の要素だけに限定します
+            content_fields: コンテンツにする子要素のパス（省略時はレコード全体のテキスト）
+            metadata_fields: メタデータにする子要素・属性のパス
+        """
         super().__init__(file_path, encoding, **kwargs)
-        
+        self.record_tag = record_tag
+        self.content_fields = list(content_fields or [])
+        self.metadata_fields = list(metadata_fields or [])
+
+        if record_tag is not None:
+            if etree is None:
+                raise ImportError(
+                    "lxmlがインストールされていません。"
+                    "pip install lxml でインストールしてください。"
+                )
+            # パスは生成時に一度だけコンパイルする
+            self._record_path = _split_record_path(record_tag)
+            self._content_xpaths = [
+                _compile_path(path) for path in self.content_fields
+            ]
+            self._metadata_xpaths = [
+                (path, _compile_path(path)) for path in self.metadata_fields
+            ]
+            return
+
         if BeautifulSoup is None:
             raise ImportError(
                 "beautifulsoup4がインストールされていません。"
@@ -30,9 +94,22 @@ class XmlLoader(BaseLoader):
 
     def load(self) -> list[Document]:
         """XMLファイルを読み込む
-        
+
         タグを除去してテキストのみを抽出します。
+        record_tag を指定した場合はレコードごとのDocumentリストを返します。
+        """
+        return list(self.lazy_load())
+
+    def lazy_load(self) -> Iterator[Document]:
+        """XMLファイルを読み込み、Documentを1つずつ返す
+
+        Yields:
+            Document: 読み込んだDocument
         """
+        if self.record_tag is not None:
+            yield from self._iter_records()
+            return
+
         with open(self.file_path, "r", encoding=self.encoding) as file:
             soup = BeautifulSoup(file, "xml")
 
@@ -41,11 +118,156 @@ class XmlLoader(BaseLoader):
 
         metadata = self._create_base_metadata()
 
-        return [
-            Document(
-                content=text,
+        yield Document(
+            content=text,
+            metadata=metadata,
+            source=str(self.file_path),
+        )
+
+    def _iter_records(self) -> Iterator[Document]:
+        """iterparseでレコード要素を順に処理し、処理済みの要素を解放"""
+        base_metadata = self._create_base_metadata()
+        *parents, name = self._record_path
+        # 名前空間付きの名前は完全一致、ローカル名は名前空間を問わずに絞り込む
+        if name.startswith("{"):
+
+            def is_record(element: Any) -> bool:
+                return element.tag == name
+
+        else:
+
+            def is_record(element: Any) -> bool:
+                tag = element.tag
+                return tag == name or tag.endswith("}" + name)
+
+        index = 0
+        # レコードの内側にいる深さ（内側の要素はレコードと一緒に解放する）
+        depth = 0
+        context = etree.iterparse(
+            str(self.file_path),
+            events=("start", "end"),
+            huge_tree=True,
+        )
+        for event, element in context:
+            if not is_record(element):
+                if event == "end" and depth == 0:
+                    # レコード以外の要素も終了時に解放する
+                    _release(element)
+                continue
+            if event == "start":
+                depth += 1
+                continue
+            depth -= 1
+            if parents and not _has_parents(element, parents):
+                if depth == 0:
+                    _release(element)
+                continue
+
+            metadata = base_metadata.copy()
+            metadata["record_tag"] = etree.QName(element).localname
+            metadata["record_index"] = index
+            for path, xpath in self._metadata_xpaths:
+                metadata[path] = _first_value(xpath(element))
+
+            if self._content_xpaths:
+                texts = [
+                    text
+                    for xpath in self._content_xpaths
+                    for value in xpath(element)
+                    if (text := _value_text(value))
+                ]
+                content = "\n".join(texts)
+            else:
+                content = _element_text(element)
+
+            yield Document(
+                content=content,
                 metadata=metadata,
                 source=str(self.file_path),
             )
-        ]
+            index += 1
+
+            _release(element)
+
+
+def _release(element: Any) -> None:
+    """処理済みの要素と、それより前の兄弟要素を解放してメモリを一定に保つ"""
+    element.clear(keep_tail=False)
+    parent = element.getparent()
+    if parent is not None:
+        while element.getprevious() is not None:
+            del parent[0]
+
+
+def _compile_path(path: str) -> "etree.XPath":
+    """ "a/b/@c" 形式のパスを名前空間を無視するXPathにコンパイル
+
+    名前はXPathに埋め込むため、XMLの名前として正しいものだけを受け付けます。
+    """
+    steps = []
+    for step in path.strip("/").split("/"):
+        attribute = step.startswith("@")
+        local_name = step[1:] if attribute else step
+        if not _NAME_PATTERN.fullmatch(local_name):
+            raise ValueError(f"Invalid name {local_name!r} in path {path!r}")
+        if attribute:
+            steps.append(f"@*[local-name()='{local_name}']")
+        else:
+            steps.append(f"*[local-name()='{local_name}']")
+    return etree.XPath("/".join(steps))
+
+
+def _split_record_path(record_tag: str) -> list[str]:
+    """record_tag を "/" で区切る（"{uri}name" の URI 内の "/" では区切らない）"""
+    steps = []
+    position = 0
+    record_tag = record_tag.strip("/")
+    while True:
+        match = _RECORD_STEP_PATTERN.match(record_tag, position)
+        if not _NAME_PATTERN.fullmatch(match.group(2)):
+            raise ValueError(
+                f"Invalid name {match.group(2)!r} in record_tag {record_tag!r}"
+            )
+        steps.append(match.group())
+        position = match.end()
+        if position == len(record_tag):
+            return steps
+        if record_tag[position] != "/":
+            raise ValueError(f"Invalid record_tag {record_tag!r}")
+        position += 1
+
+
+def _has_parents(element: Any, parents: list[str]) -> bool:
+    """要素の祖先の名前が parents（外側から順）と一致するか
+
+    名前空間付きの名前はタグと、それ以外はローカル名と比較します。
+    """
+    node = element.getparent()
+    for name in reversed(parents):
+        if node is None:
+            return False
+        tag = node.tag if name.startswith("{") else etree.QName(node).localname
+        if tag != name:
+            return False
+        node = node.getparent()
+    return True
+
+
+def _element_text(element: Any) -> str:
+    """get_text(separator="\\n", strip=True) と同じ形式でテキストを抽出"""
+    return "\n".join(
+        text.strip() for text in element.itertext() if text.strip()
+    )
+
+
+def _value_text(value: Any) -> str:
+    """XPathの結果（要素または属性値）をテキストに変換"""
+    if isinstance(value, str):
+        return value.strip()
+    return _element_text(value)
+
 
+def _first_value(values: list[Any]) -> str | None:
+    for value in values:
+        return _value_text(value)
+    return None
@@ -1,11 +1,20 @@
-from .text_cleaner import TextCleaner
-from .metadata_extractor import MetadataExtractor
-from .pii_redactor import PiiRedactor
+from .batch import iter_process_documents, process_documents
 from .html_cleaner import HtmlNoiseCleaner
+from .html_markdown import HtmlMarkdownRenderer, HtmlSection
+from .metadata_extractor import MetadataExtractor
+from .pii_redactor import PiiMatch, PiiRedactionEngine, PiiRedactor
+from .text_cleaner import CleanerPipeline, TextCleaner
 
 __all__ = [
     "TextCleaner",
+    "CleanerPipeline",
     "MetadataExtractor",
     "PiiRedactor",
+    "PiiRedactionEngine",
+    "PiiMatch",
     "HtmlNoiseCleaner",
+    "HtmlMarkdownRenderer",
+    "HtmlSection",
+    "process_documents",
+    "iter_process_documents",
 ]
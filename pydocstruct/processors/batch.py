@@ -0,0 +1,114 @@
+"""pydocstruct/processors/batch.py"""
+
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import islice
+
+from pydocstruct.core.document import Document
+
+TextProcessor = Callable[[str], str]
+
+
+def process_documents(
+    documents: Iterable[Document],
+    processors: Sequence[TextProcessor],
+    num_workers: int = 1,
+    batch_size: int = 1000,
+    chunksize: int = 64,
+) -> list[Document]:
+    """Apply text processors to a collection of Documents
+
+    See iter_process_documents for details.
+
+    Returns:
+        list[Document]: Processed documents, in input order
+    """
+    return list(
+        iter_process_documents(
+            documents,
+            processors,
+            num_workers=num_workers,
+            batch_size=batch_size,
+            chunksize=chunksize,
+        )
+    )
+
+
+def iter_process_documents(
+    documents: Iterable[Document],
+    processors: Sequence[TextProcessor],
+    num_workers: int = 1,
+    batch_size: int = 1000,
+    chunksize: int = 64,
+) -> Iterator[Document]:
+    """Apply text processors to a stream of Documents
+
+    Each document's content goes through the processors in order. With
+    num_workers > 1 the work runs in a process pool, since regex-heavy
+    processing does not scale with threads. Processors must then be
+    picklable (module-level functions, class/static methods, or
+    functools.partial of them; not lambdas).
+
+    The returned Documents are new objects: metadata is copied and the
+    names of the applied processors are appended to `processors`.
+
+    Args:
+        documents (Iterable[Document]): Documents to process
+        processors (Sequence[TextProcessor]): str -> str callables
+        num_workers (int): Number of worker processes (1 runs in-process)
+        batch_size (int): Documents read from the stream per round trip
+            to the pool, bounding memory use
+        chunksize (int): Documents sent to a worker per task
+
+    Yields:
+        Document: Processed documents, in input order
+    """
+    names = [processor_name(processor) for processor in processors]
+    pipeline = partial(_apply_processors, tuple(processors))
+
+    if num_workers <= 1:
+        for doc in documents:
+            yield _with_content(doc, pipeline(doc.content), names)
+        return
+
+    iterator = iter(documents)
+    with ProcessPoolExecutor(max_workers=num_workers) as executor:
+        while True:
+            window = list(islice(iterator, batch_size))
+            if not window:
+                break
+
+            contents = executor.map(
+                pipeline, [doc.content for doc in window], chunksize=chunksize
+            )
+            for doc, content in zip(window, contents):
+                yield _with_content(doc, content, names)
+
+
+def processor_name(processor: TextProcessor) -> str:
+    """Return a readable name for a processor (e.g. "PiiRedactor.redact")"""
+    while isinstance(processor, partial):
+        processor = processor.func
+    name = getattr(processor, "__qualname__", None)
+    return name or type(processor).__name__
+
+
+def _apply_processors(processors: tuple[TextProcessor, ...], text: str) -> str:
+    for processor in processors:
+        text = processor(text)
+    return text
+
+
+def _with_content(doc: Document, content: str, names: list[str]) -> Document:
+    metadata = doc.metadata.copy()
+    metadata["processors"] = [*metadata.get("processors", []), *names]
+
+    return Document(
+        content=content,
+        metadata=metadata,
+        doc_id=doc.doc_id,
+        source=doc.source,
+        page_number=doc.page_number,
+        chunk_index=doc.chunk_index,
+    )
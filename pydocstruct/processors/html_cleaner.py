@@ -1,54 +1,211 @@
 import re
+from collections.abc import Callable, Iterable, Mapping
+from functools import partial
+from typing import Any
 
 try:
-    from bs4 import BeautifulSoup
+    from bs4 import BeautifulSoup, Tag
 except ImportError:
     BeautifulSoup = None
+    Tag = None
+
+try:
+    import lxml
+except ImportError:
+    lxml = None
+
+from pydocstruct.core.document import Document
+from pydocstruct.processors.batch import process_documents
+
+_BLANK_LINES_PATTERN = re.compile(r"\n{3,}")
+
 
 class HtmlNoiseCleaner:
-    """Cleaner to remove content noise (headers, footers, navigation, etc.) from HTML"""
-    
+    """Cleaner to remove content noise (headers, footers, navigation, etc.)
+    from HTML"""
+
     # Tags, classes, or IDs to remove
-    NOISE_TAGS = ['script', 'style', 'head', 'iframe', 'noscript', 'meta', 'svg']
-    NOISE_CLASSES = ['header', 'footer', 'nav', 'menu', 'sidebar', 'ad', 'advertisement', 'cookie', 'popup']
-    
+    NOISE_TAGS = [
+        "script",
+        "style",
+        "head",
+        "iframe",
+        "noscript",
+        "meta",
+        "svg",
+    ]
+    SEMANTIC_NOISE_TAGS = ["header", "footer", "nav", "aside"]
+    NOISE_CLASSES = [
+        "header",
+        "footer",
+        "nav",
+        "menu",
+        "sidebar",
+        "ad",
+        "advertisement",
+        "cookie",
+        "popup",
+    ]
+
+    PARSERS = ("html.parser", "lxml")
+
     @classmethod
-    def clean(cls, html_content: str) -> str:
-        """Extract and clean main content from HTML content"""
-        if BeautifulSoup is None:
-            raise ImportError("beautifulsoup4 is required. pip install beautifulsoup4")
-            
-        soup = BeautifulSoup(html_content, "html.parser")
-        
-        # Remove unnecessary tags
-        for tag in cls.NOISE_TAGS:
-            for element in soup.find_all(tag):
-                element.decompose()
-        
-        # Remove semantic tags like header, footer, nav
-        for tag in ['header', 'footer', 'nav', 'aside']:
-            for element in soup.find_all(tag):
-                element.decompose()
-                
-        # Remove by class name or ID if matching noise keywords
-        # (Be careful, remove only widely identifiable noise)
-        for element in soup.find_all(attrs={"class": True}):
-            classes = element.get("class")
-            if isinstance(classes, list):
-                classes = " ".join(classes)
-            if any(noise in classes.lower() for noise in cls.NOISE_CLASSES):
-                element.decompose()
-                
-        for element in soup.find_all(attrs={"id": True}):
-            id_val = element.get("id")
-            if not isinstance(id_val, str):
-                continue
-            if any(noise in id_val.lower() for noise in cls.NOISE_CLASSES):
-                element.decompose()
-        
+    def clean(cls, html_content: str, parser: str = "html.parser") -> str:
+        """Extract and clean main content from HTML content
+
+        Args:
+            html_content (str): HTML markup
+            parser (str): BeautifulSoup parser backend, "html.parser" or
+                "lxml" (faster, requires lxml)
+
+        Returns:
+            str: Main text content
+        """
+        soup = cls.parse(html_content, parser)
+        cls.prune(soup)
+
         # Extract text
         text = soup.get_text(separator="\n", strip=True)
         # Normalize continuous newlines
-        text = re.sub(r'\n{3,}', '\n\n', text)
-        
-        return text
+        return _BLANK_LINES_PATTERN.sub("\n\n", text)
+
+    @classmethod
+    def parse(
+        cls, html_content: Any, parser: str = "html.parser"
+    ) -> "BeautifulSoup":
+        """Parse HTML with the selected backend
+
+        Args:
+            html_content (Any): HTML markup (str, bytes or file object)
+            parser (str): "html.parser" or "lxml"
+
+        Returns:
+            BeautifulSoup: Parsed tree
+        """
+        if BeautifulSoup is None:
+            raise ImportError(
+                "beautifulsoup4 is required. pip install beautifulsoup4"
+            )
+        if parser not in cls.PARSERS:
+            raise ValueError(
+                f"Unknown parser: {parser}. "
+                f"Expected one of {', '.join(cls.PARSERS)}"
+            )
+        if parser == "lxml" and lxml is None:
+            raise ImportError(
+                "lxml is required for parser='lxml'. pip install lxml"
+            )
+
+        return BeautifulSoup(html_content, parser)
+
+    @classmethod
+    def prune(cls, soup: "BeautifulSoup | Tag") -> int:
+        """Remove noise elements from a parsed tree in place
+
+        The tree is walked once. An element is removed when its tag is a
+        noise tag or its class or id contains a noise keyword; the
+        subtrees of removed elements are not visited.
+
+        Args:
+            soup (BeautifulSoup | Tag): Parsed tree (or subtree)
+
+        Returns:
+            int: Number of removed elements
+        """
+        removed = []
+        stack = [soup]
+
+        while stack:
+            for child in stack.pop().contents:
+                if not isinstance(child, Tag):
+                    continue
+                if cls.is_noise(child.name, child.attrs):
+                    removed.append(child)
+                else:
+                    stack.append(child)
+
+        for element in removed:
+            element.decompose()
+        return len(removed)
+
+    @classmethod
+    def is_noise(cls, name: str, attrs: Mapping[str, Any]) -> bool:
+        """Return whether an element is noise
+
+        Args:
+            name (str): Tag name
+            attrs (Mapping[str, Any]): Element attributes. `class` may be a
+                string or a list of class names.
+
+        Returns:
+            bool: True if the element should be removed with its subtree
+        """
+        noise_tags, is_noise_attr = cls._matchers()
+        if name in noise_tags:
+            return True
+
+        classes = attrs.get("class")
+        if classes:
+            if not isinstance(classes, str):
+                classes = " ".join(classes)
+            if is_noise_attr(classes.lower()):
+                return True
+
+        id_val = attrs.get("id")
+        return (
+            isinstance(id_val, str)
+            and is_noise_attr(id_val.lower()) is not None
+        )
+
+    @classmethod
+    def _matchers(cls) -> tuple[frozenset[str], Callable[[str], Any]]:
+        # Compiled once per set of lists, so subclasses can override them and
+        # later edits to the lists take effect
+        key = (
+            tuple(cls.NOISE_TAGS),
+            tuple(cls.SEMANTIC_NOISE_TAGS),
+            tuple(cls.NOISE_CLASSES),
+        )
+        cached = cls.__dict__.get("_compiled_matchers")
+        if cached is None or cached[0] != key:
+            noise_tags = frozenset(key[0]) | frozenset(key[1])
+            if key[2]:
+                # Substring match, as a keyword may appear anywhere in a
+                # class or id
+                pattern = re.compile(
+                    "|".join(re.escape(noise) for noise in key[2])
+                )
+                search = pattern.search
+            else:
+                # An empty alternation would match every class and id
+                def search(value: str) -> None:
+                    return None
+
+            cached = cls._compiled_matchers = (key, noise_tags, search)
+        return cached[1], cached[2]
+
+    @classmethod
+    def process_documents(
+        cls,
+        documents: Iterable[Document],
+        num_workers: int = 1,
+        batch_size: int = 1000,
+        parser: str = "html.parser",
+    ) -> list[Document]:
+        """Clean the HTML content of a collection of Documents
+
+        Args:
+            documents (Iterable[Document]): Documents holding HTML content
+            parser (str): BeautifulSoup parser backend
+            num_workers (int): Number of worker processes (1 runs in-process)
+            batch_size (int): Documents dispatched to the pool at a time
+
+        Returns:
+            list[Document]: Documents with extracted main text
+        """
+        return process_documents(
+            documents,
+            [partial(cls.clean, parser=parser)],
+            num_workers=num_workers,
+            batch_size=batch_size,
+        )
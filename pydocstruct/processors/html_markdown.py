@@ -0,0 +1,660 @@
+"""pydocstruct/processors/html_markdown.py"""
+
+import re
+from dataclasses import dataclass
+from html.parser import HTMLParser
+from pathlib import Path
+
+from pydocstruct.processors.html_cleaner import HtmlNoiseCleaner
+
+# Elements without an end tag
+_VOID_TAGS = frozenset(
+    {
+        "area",
+        "base",
+        "br",
+        "col",
+        "embed",
+        "hr",
+        "img",
+        "input",
+        "link",
+        "meta",
+        "param",
+        "source",
+        "track",
+        "wbr",
+    }
+)
+# Elements whose content is never rendered
+_SKIPPED_TAGS = frozenset({"script", "style", "head", "template"})
+# Elements allowed in <head>; any other start tag implies </head>
+_HEAD_TAGS = frozenset(
+    {
+        "base",
+        "link",
+        "meta",
+        "noscript",
+        "script",
+        "style",
+        "template",
+        "title",
+    }
+)
+# Start tags that close an open <p>
+_CLOSES_P = frozenset(
+    {
+        "address",
+        "article",
+        "aside",
+        "blockquote",
+        "details",
+        "dialog",
+        "div",
+        "dl",
+        "fieldset",
+        "figcaption",
+        "figure",
+        "footer",
+        "form",
+        "h1",
+        "h2",
+        "h3",
+        "h4",
+        "h5",
+        "h6",
+        "header",
+        "hr",
+        "main",
+        "menu",
+        "nav",
+        "ol",
+        "p",
+        "pre",
+        "section",
+        "table",
+        "ul",
+    }
+)
+# Start tags that close an earlier sibling: tag -> (closed tags, scope).
+# The search for a tag to close stops at the first scope element.
+_IMPLIED_END_TAGS = {
+    "li": (frozenset({"li"}), frozenset({"ul", "ol", "menu"})),
+    "dd": (frozenset({"dd", "dt"}), frozenset({"dl"})),
+    "dt": (frozenset({"dd", "dt"}), frozenset({"dl"})),
+    "tr": (
+        frozenset({"tr", "td", "th"}),
+        frozenset({"table", "thead", "tbody", "tfoot"}),
+    ),
+    "td": (frozenset({"td", "th"}), frozenset({"tr", "table"})),
+    "th": (frozenset({"td", "th"}), frozenset({"tr", "table"})),
+    "option": (
+        frozenset({"option"}),
+        frozenset({"select", "datalist", "optgroup"}),
+    ),
+}
+_BLOCK_TAGS = frozenset(
+    {
+        "address",
+        "article",
+        "aside",
+        "body",
+        "caption",
+        "dd",
+        "details",
+        "dialog",
+        "div",
+        "dl",
+        "dt",
+        "fieldset",
+        "figcaption",
+        "figure",
+        "footer",
+        "form",
+        "header",
+        "html",
+        "main",
+        "nav",
+        "p",
+        "section",
+        "summary",
+        "tbody",
+        "tfoot",
+        "thead",
+    }
+)
+_HEADING_LEVELS = {f"h{level}": level for level in range(1, 7)}
+_INLINE_MARKS = {
+    "b": "**",
+    "strong": "**",
+    "em": "*",
+    "i": "*",
+    "code": "`",
+    "kbd": "`",
+    "samp": "`",
+    "del": "~~",
+    "s": "~~",
+}
+_CODE_TAGS = frozenset({"code", "kbd", "samp"})
+
+# Placeholder for <br> that survives whitespace collapsing
+_LINE_BREAK = "\x00"
+_LINE_BREAK_PATTERN = re.compile(" ?\x00 ?")
+_ESCAPE_TABLE = str.maketrans({"*": r"\*", "_": r"\_"})
+
+
+@dataclass
+class HtmlSection:
+    """A heading section rendered by HtmlMarkdownRenderer
+
+    Attributes:
+        content (str): Markdown of the section, including its heading line
+        header (str | None): Heading text (None before the first heading)
+        header_level (int): Heading level 1-6 (0 before the first heading)
+        header_path (str): Ancestor headings and this one, joined by " > "
+        anchor_id (str | None): id of the heading (or of an anchor in it)
+    """
+
+    content: str
+    header: str | None = None
+    header_level: int = 0
+    header_path: str = ""
+    anchor_id: str | None = None
+
+
+class HtmlMarkdownRenderer(HTMLParser):
+    """Streaming HTML to Markdown renderer
+
+    Renders headings (ATX), paragraphs, ordered/unordered lists, tables,
+    links, images, code spans and blocks, emphasis and blockquotes
+    directly from parser events. No tree is built (only the names of the
+    open elements are kept), so memory use does not grow with the number
+    of elements, and the input can be fed in pieces. The output follows
+    markdownify's conventions closely enough to be used in its place.
+
+    script, style, head and template contents are never rendered; the
+    document title is captured into `title`. With remove_noise=True,
+    elements that HtmlNoiseCleaner regards as noise are skipped with
+    their content. A skipped element also ends where HTML implies its
+    end tag: when its parent closes, when a sibling such as the next
+    <li> or <p> starts, or, for <head>, when <body> or body content
+    starts.
+
+    With split_by_headings=True, every h1-h6 starts a new HtmlSection.
+    Finished sections are collected instead of `markdown`; a streaming
+    consumer takes them with pop_sections() after each feed().
+
+    Example:
+        renderer = HtmlMarkdownRenderer(remove_noise=True)
+        for piece in pieces:
+            renderer.feed(piece)
+        renderer.close()
+        renderer.markdown, renderer.title
+
+    Attributes:
+        remove_noise (bool): Whether noise elements are skipped
+        noise_cleaner (type[HtmlNoiseCleaner]): Cleaner defining noise
+        split_by_headings (bool): Whether output is split into sections
+        header_separator (str): Separator of heading paths
+        title (str | None): Document title (available after close)
+        markdown (str): Rendered Markdown (available after close)
+    """
+
+    def __init__(
+        self,
+        remove_noise: bool = False,
+        noise_cleaner: type[HtmlNoiseCleaner] = HtmlNoiseCleaner,
+        split_by_headings: bool = False,
+        header_separator: str = " > ",
+    ) -> None:
+        super().__init__(convert_charrefs=True)
+        self.remove_noise = remove_noise
+        self.noise_cleaner = noise_cleaner
+        self.split_by_headings = split_by_headings
+        self.header_separator = header_separator
+        self.title: str | None = None
+        self.markdown = ""
+
+        self._sections: list[HtmlSection] = []
+        self._section = HtmlSection(content="")
+        # Ancestor headings: (level, text)
+        self._ancestors: list[tuple[int, str]] = []
+        self._heading_text: list[str] = []
+
+        self._parts: list[str] = []
+        self._last_kind: str | None = None
+        self._last_quote_depth = 0
+        # Inline text of the current block
+        self._inline: list[str] = []
+        # Open inline marks: (tag, position in _inline, href)
+        self._marks: list[tuple[str, int, str | None]] = []
+        self._code_depth = 0
+
+        # Names of the open elements, and the position in it of the root
+        # of the subtree being skipped
+        self._open: list[str] = []
+        self._skip_at: int | None = None
+        self._in_title = False
+        self._title_parts: list[str] = []
+
+        self._heading = 0
+        self._pre_parts: list[str] | None = None
+        self._quote_depth = 0
+        # Open lists: [ordered, item counter]
+        self._lists: list[list] = []
+        self._bullet: str | None = None
+        self._item_indent = ""
+        # Rows emitted per open table
+        self._tables: list[int] = []
+        self._row: list[str] | None = None
+        self._cell_start: int | None = None
+
+    @classmethod
+    def render(cls, html: str, **kwargs) -> str:
+        """Render an HTML string to Markdown
+
+        Args:
+            html (str): HTML markup
+            **kwargs: HtmlMarkdownRenderer options
+
+        Returns:
+            str: Markdown text
+        """
+        renderer = cls(**kwargs)
+        renderer.feed(html)
+        renderer.close()
+        return renderer.markdown
+
+    @classmethod
+    def render_file(
+        cls,
+        file_path: str | Path,
+        encoding: str = "utf-8",
+        chunk_size: int = 1 << 16,
+        **kwargs,
+    ) -> "HtmlMarkdownRenderer":
+        """Render an HTML file, reading it in pieces
+
+        Args:
+            file_path (str | Path): HTML file
+            encoding (str): File encoding
+            chunk_size (int): Characters read per feed() call
+            **kwargs: HtmlMarkdownRenderer options
+
+        Returns:
+            HtmlMarkdownRenderer: Closed renderer holding markdown and title
+        """
+        renderer = cls(**kwargs)
+        with open(file_path, "r", encoding=encoding) as file:
+            while piece := file.read(chunk_size):
+                renderer.feed(piece)
+        renderer.close()
+        return renderer
+
+    def close(self) -> None:
+        """Finish parsing and produce `markdown` and `title`"""
+        super().close()
+        if self._pre_parts is not None:
+            self._end_pre()
+        # A table left open at the end of input keeps its last row
+        self._end_row()
+        self._flush()
+
+        if self.split_by_headings:
+            self._close_section()
+        else:
+            self.markdown = "".join(self._parts)
+        if self._in_title:
+            self._in_title = False
+            self.title = "".join(self._title_parts).strip()
+
+    def pop_sections(self) -> list[HtmlSection]:
+        """Return the sections finished so far and forget them
+
+        Returns:
+            list[HtmlSection]: Finished sections in document order
+        """
+        sections = self._sections
+        self._sections = []
+        return sections
+
+    def handle_starttag(
+        self, tag: str, attrs: list[tuple[str, str | None]]
+    ) -> None:
+        if tag == "title":
+            self._in_title = self.title is None
+            self._title_parts = []
+            return
+        self._close_implied(tag)
+        if tag not in _VOID_TAGS:
+            self._open.append(tag)
+        if self._skip_at is not None:
+            return
+
+        attributes = dict(attrs)
+        if self.remove_noise and self.noise_cleaner.is_noise(tag, attributes):
+            if tag not in _VOID_TAGS:
+                self._skip_at = len(self._open) - 1
+            return
+        if tag in _SKIPPED_TAGS:
+            self._skip_at = len(self._open) - 1
+            return
+
+        if self._pre_parts is not None:
+            if tag == "br":
+                self._pre_parts.append("\n")
+            return
+
+        if tag in _INLINE_MARKS:
+            self._marks.append((tag, len(self._inline), None))
+            if tag in _CODE_TAGS:
+                self._code_depth += 1
+        elif tag == "a":
+            self._marks.append(
+                (tag, len(self._inline), attributes.get("href"))
+            )
+            if self._heading and self._section.anchor_id is None:
+                self._section.anchor_id = attributes.get(
+                    "id"
+                ) or attributes.get("name")
+        elif tag == "br":
+            self._inline.append(_LINE_BREAK)
+        elif tag == "img":
+            alt = attributes.get("alt") or ""
+            src = attributes.get("src") or ""
+            self._inline.append(f"![{alt}]({src})")
+        elif tag in _HEADING_LEVELS:
+            self._flush()
+            self._heading = _HEADING_LEVELS[tag]
+            self._heading_text = []
+            if self.split_by_headings:
+                self._close_section()
+                self._section.anchor_id = attributes.get("id")
+        elif tag in ("ul", "ol"):
+            self._flush()
+            start = attributes.get("start")
+            counter = int(start) - 1 if start and start.isdigit() else 0
+            self._lists.append([tag == "ol", counter])
+        elif tag == "li":
+            self._start_item()
+        elif tag == "pre":
+            self._flush()
+            self._pre_parts = []
+        elif tag == "blockquote":
+            self._flush()
+            self._quote_depth += 1
+        elif tag == "hr":
+            self._flush()
+            self._emit("---")
+        elif tag == "table":
+            self._flush()
+            self._tables.append(0)
+        elif tag == "tr":
+            # An open row ends here even without </tr>
+            self._end_row()
+            self._flush()
+            self._row = []
+        elif tag in ("td", "th"):
+            self._end_cell()
+            if self._row is None:
+                self._row = []
+            self._cell_start = len(self._inline)
+        elif tag in _BLOCK_TAGS:
+            self._flush()
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag == "title":
+            if self._in_title:
+                self._in_title = False
+                self.title = "".join(self._title_parts).strip()
+            return
+        skip_at = self._skip_at
+        position = self._find_open(tag)
+        if position is not None:
+            self._close_from(position)
+        if skip_at is not None and (position is None or position >= skip_at):
+            # Inside the skipped subtree, or its own end tag
+            return
+
+        if self._pre_parts is not None:
+            if tag == "pre":
+                self._end_pre()
+            return
+
+        if tag in _INLINE_MARKS or tag == "a":
+            self._close_mark(tag)
+        elif tag in _HEADING_LEVELS:
+            self._flush()
+            if self.split_by_headings and self._heading:
+                self._start_section(
+                    self._heading,
+                    " ".join("".join(self._heading_text).split()),
+                )
+            self._heading = 0
+        elif tag in ("ul", "ol"):
+            self._flush()
+            if self._lists:
+                self._lists.pop()
+            self._bullet = None
+            self._item_indent = "    " * len(self._lists)
+            if not self._lists:
+                # The next list is a separate block
+                self._last_kind = "list"
+        elif tag == "li":
+            self._flush()
+            self._bullet = None
+        elif tag == "blockquote":
+            self._flush()
+            self._quote_depth = max(self._quote_depth - 1, 0)
+        elif tag in ("td", "th"):
+            self._end_cell()
+        elif tag == "tr":
+            self._end_row()
+        elif tag == "table":
+            self._end_row()
+            if self._tables:
+                self._tables.pop()
+        elif tag in _BLOCK_TAGS:
+            self._flush()
+
+    def handle_data(self, data: str) -> None:
+        if self._in_title:
+            # <title> is read even though <head> is skipped
+            self._title_parts.append(data)
+            return
+        if self._open and self._open[-1] == "head" and data.strip():
+            # Text cannot be in <head>: the body has started
+            self._close_from(len(self._open) - 1)
+        if self._skip_at is not None:
+            return
+        if self._pre_parts is not None:
+            self._pre_parts.append(data)
+            return
+        if self._heading:
+            self._heading_text.append(data)
+        self._inline.append(
+            data if self._code_depth else data.translate(_ESCAPE_TABLE)
+        )
+
+    def _find_open(
+        self, tag: str, scope: frozenset[str] = frozenset()
+    ) -> int | None:
+        """Return the position of the innermost open `tag` within `scope`"""
+        for position in range(len(self._open) - 1, -1, -1):
+            name = self._open[position]
+            if name == tag:
+                return position
+            if name in scope:
+                break
+        return None
+
+    def _close_from(self, position: int) -> None:
+        """Close the open element at position and everything inside it"""
+        del self._open[position:]
+        if self._skip_at is not None and position <= self._skip_at:
+            self._skip_at = None
+
+    def _close_implied(self, tag: str) -> None:
+        """Close the elements whose end tag is implied by a start tag"""
+        if not self._open:
+            return
+        if self._open[-1] == "head" and tag not in _HEAD_TAGS:
+            self._close_from(len(self._open) - 1)
+        implied = _IMPLIED_END_TAGS.get(tag)
+        if implied is not None:
+            closed, scope = implied
+            for name in closed:
+                position = self._find_open(name, scope)
+                if position is not None:
+                    self._close_from(position)
+                    break
+        if tag in _CLOSES_P and self._open and self._open[-1] == "p":
+            self._close_from(len(self._open) - 1)
+
+    def _close_section(self) -> None:
+        content = "".join(self._parts)
+        self._parts = []
+        self._last_kind = None
+        if content.strip():
+            self._section.content = content
+            self._sections.append(self._section)
+        self._section = HtmlSection(content="")
+
+    def _start_section(self, level: int, header: str) -> None:
+        while self._ancestors and self._ancestors[-1][0] >= level:
+            self._ancestors.pop()
+        self._ancestors.append((level, header))
+
+        self._section.header = header
+        self._section.header_level = level
+        self._section.header_path = self.header_separator.join(
+            text for _, text in self._ancestors
+        )
+
+    def _start_item(self) -> None:
+        self._flush()
+        if not self._lists:
+            self._lists.append([False, 0])
+        current = self._lists[-1]
+        current[1] += 1
+        marker = f"{current[1]}. " if current[0] else "* "
+        indent = "    " * (len(self._lists) - 1)
+        self._bullet = indent + marker
+        self._item_indent = indent + " " * len(marker)
+
+    def _close_mark(self, tag: str) -> None:
+        for position in range(len(self._marks) - 1, -1, -1):
+            if self._marks[position][0] == tag:
+                break
+        else:
+            return
+        _, start, href = self._marks[position]
+        del self._marks[position:]
+        if tag in _CODE_TAGS:
+            self._code_depth = max(self._code_depth - 1, 0)
+        if start > len(self._inline):
+            return
+
+        content = "".join(self._inline[start:])
+        del self._inline[start:]
+        text = content.strip()
+        if not text:
+            self._inline.append(content)
+            return
+
+        if tag == "a":
+            text = f"[{text}]({href})" if href else text
+        else:
+            mark = _INLINE_MARKS[tag]
+            text = f"{mark}{text}{mark}"
+        # Keep surrounding whitespace outside the marks
+        lead = " " if content[0].isspace() else ""
+        trail = " " if content[-1].isspace() else ""
+        self._inline.append(f"{lead}{text}{trail}")
+
+    def _end_pre(self) -> None:
+        code = "".join(self._pre_parts).strip("\n")
+        self._pre_parts = None
+        self._emit(f"```\n{code}\n```")
+
+    def _end_cell(self) -> None:
+        if self._cell_start is None:
+            return
+        text = _collapse("".join(self._inline[self._cell_start :]))
+        del self._inline[self._cell_start :]
+        self._cell_start = None
+        if self._row is not None:
+            self._row.append(text.replace("|", r"\|").replace("  \n", " "))
+
+    def _end_row(self) -> None:
+        self._end_cell()
+        row = self._row
+        self._row = None
+        if not row:
+            return
+
+        self._emit("| " + " | ".join(row) + " |", kind="row")
+        if self._tables:
+            if self._tables[-1] == 0:
+                # markdownify also uses the first row as the header
+                self._emit(
+                    "| " + " | ".join("---" for _ in row) + " |", kind="row"
+                )
+            self._tables[-1] += 1
+
+    def _flush(self) -> None:
+        """Emit the pending inline text as a block"""
+        if self._cell_start is not None or not self._inline:
+            return
+        text = _collapse("".join(self._inline))
+        self._inline.clear()
+        self._marks.clear()
+        self._code_depth = 0
+        if not text:
+            return
+
+        if self._heading:
+            self._emit(f"{'#' * self._heading} {text}")
+        elif self._bullet is not None:
+            lines = text.split("\n")
+            lines = [self._bullet + lines[0]] + [
+                self._item_indent + line for line in lines[1:]
+            ]
+            self._bullet = None
+            self._emit("\n".join(lines), kind="item", indent=False)
+        elif self._lists:
+            self._emit(text, kind="item")
+        else:
+            self._emit(text)
+
+    def _emit(
+        self, text: str, kind: str = "block", indent: bool = True
+    ) -> None:
+        if indent and self._lists and self._item_indent:
+            text = "\n".join(
+                self._item_indent + line for line in text.split("\n")
+            )
+        if self._quote_depth:
+            prefix = "> " * self._quote_depth
+            text = "\n".join(prefix + line for line in text.split("\n"))
+
+        if self._parts:
+            tight = kind in ("item", "row") and kind == self._last_kind
+            # Blocks in the same quote are separated by a quoted blank line
+            depth = min(self._quote_depth, self._last_quote_depth)
+            if tight:
+                self._parts.append("\n")
+            elif depth:
+                self._parts.append("\n" + ("> " * depth).rstrip() + "\n")
+            else:
+                self._parts.append("\n\n")
+        self._parts.append(text)
+        self._last_kind = kind
+        self._last_quote_depth = self._quote_depth
+
+
+def _collapse(text: str) -> str:
+    text = " ".join(text.split())
+    if _LINE_BREAK in text:
+        text = _LINE_BREAK_PATTERN.sub("  \n", text).strip()
+    return text
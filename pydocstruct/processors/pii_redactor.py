@@ -1,31 +1,424 @@
 import re
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from functools import partial
+
+from pydocstruct.core.document import Document
+from pydocstruct.processors.batch import process_documents
+
+# Email addresses (shared with TextCleaner and CleanerPipeline)
+EMAIL_PATTERN = re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
+
+# Inline flag letters for patterns merged into one alternation
+_INLINE_FLAGS = (
+    (re.ASCII, "a"),
+    (re.IGNORECASE, "i"),
+    (re.MULTILINE, "m"),
+    (re.DOTALL, "s"),
+    (re.VERBOSE, "x"),
+)
+
+# Global inline flags at the start of a pattern, e.g. "(?i)"
+_LEADING_FLAGS = re.compile(r"(?:\(\?([aiLmsux]+)\))+")
+
+
+def _scope_flags(source: str, flags: str = "") -> str:
+    """Turn global inline flags into a scoped group
+
+    Global flags such as "(?i)" are only allowed at the very start of a
+    regex, so they stop compiling once the pattern is nested in the
+    combined alternation. "(?i)abc" becomes "(?i:abc)".
+    """
+    leading = _LEADING_FLAGS.match(source)
+    if leading:
+        letters = re.findall(r"\(\?([aiLmsux]+)\)", leading.group())
+        flags += "".join(letters)
+        source = source[leading.end() :]
+    if not flags:
+        return source
+    return f"(?{''.join(dict.fromkeys(flags))}:{source})"
+
+
+def _has_group_reference(source: str) -> bool:
+    """Check whether a pattern refers to groups by number
+
+    Numbered backreferences ("\\1") and conditionals ("(?(1)...)") would
+    point at the wrong group once the pattern is nested in the combined
+    alternation. Escapes and character classes are skipped.
+    """
+    i = 0
+    in_class = False
+    while i < len(source):
+        char = source[i]
+        if char == "\\":
+            digits = source[i + 1 : i + 4]
+            if not in_class and digits[:1] in tuple("123456789"):
+                # Three octal digits form a character escape, not a reference
+                if not (
+                    len(digits) == 3 and all(d in "01234567" for d in digits)
+                ):
+                    return True
+            i += 2
+            continue
+        if in_class:
+            in_class = char != "]"
+        elif char == "[":
+            in_class = True
+            # "]" right after "[" or "[^" is a literal
+            i += 1
+            if source.startswith("^", i):
+                i += 1
+            if source.startswith("]", i):
+                i += 1
+            continue
+        elif source.startswith("(?(", i) and source[i + 3 : i + 4].isdigit():
+            return True
+        i += 1
+    return False
+
+
+@dataclass(frozen=True)
+class PiiMatch:
+    """A PII occurrence found in text
+
+    Attributes:
+        kind (str): Pattern name (e.g. "email")
+        start (int): Start offset in the text
+        end (int): End offset in the text
+        text (str): Matched text
+    """
+
+    kind: str
+    start: int
+    end: int
+    text: str
+
+
+class PiiRedactionEngine:
+    """Single-pass PII detection and redaction engine
+
+    All patterns (built-in and user-registered) are combined into one
+    compiled alternation with a named group per pattern, so text is
+    scanned once regardless of how many patterns are registered.
+    Where patterns overlap, the leftmost match wins, and at the same
+    position the pattern registered first wins.
+
+    Patterns can declare the characters their matches start with
+    (e.g. r"\\d"). Consecutive patterns sharing such a class are guarded
+    by a single lookahead, so they cost almost nothing elsewhere.
+    """
+
+    def __init__(
+        self,
+        patterns: dict[str, str | re.Pattern[str]] | None = None,
+        replace_text: str = "[REDACTED]",
+    ) -> None:
+        """Initialize PiiRedactionEngine
+
+        Args:
+            patterns (dict[str, str | re.Pattern[str]] | None): Patterns by
+                name, in priority order. Defaults to PiiRedactor's patterns.
+            replace_text (str): Default replacement string
+        """
+        self.replace_text = replace_text
+        # name -> (pattern source, first character class)
+        self._patterns: dict[str, tuple[str, str | None]] = {}
+        self._compiled: re.Pattern[str] | None = None
+        self._kinds: dict[int, str] = {}
+
+        if patterns is None:
+            PiiRedactor.register_defaults(self)
+        else:
+            for name, pattern in patterns.items():
+                self.register(name, pattern)
+
+    def register(
+        self,
+        name: str,
+        pattern: str | re.Pattern[str],
+        first_chars: str | None = None,
+    ) -> None:
+        """Register an additional pattern
+
+        Args:
+            name (str): Pattern name, reported as PiiMatch.kind
+            pattern (str | re.Pattern[str]): Regular expression
+            first_chars (str | None): Regex character class every match
+                starts with (e.g. r"\\d"), used to skip the pattern cheaply
+
+        Raises:
+            ValueError: If the name is invalid, the pattern does not compile,
+                or it refers to groups by number (use named groups instead)
+        """
+        if not name.isidentifier():
+            raise ValueError(
+                f"Pattern name must be a valid identifier: {name}"
+            )
+
+        if isinstance(pattern, re.Pattern):
+            flags = "".join(
+                letter
+                for flag, letter in _INLINE_FLAGS
+                if pattern.flags & flag
+            )
+            source = _scope_flags(pattern.pattern, flags)
+        else:
+            source = _scope_flags(pattern)
+
+        # Validate on its own so errors point at the offending pattern
+        try:
+            re.compile(source)
+        except re.error as e:
+            raise ValueError(f"Invalid pattern {name!r}: {e}") from e
+        if _has_group_reference(source):
+            raise ValueError(
+                f"Pattern {name!r} refers to a group by number, which "
+                "changes once patterns are combined; use a named group "
+                "and (?P=name) instead"
+            )
+
+        previous = self._patterns.get(name)
+        self._patterns[name] = (source, first_chars)
+        self._compiled = None
+        try:
+            self.pattern
+        except re.error as e:
+            # e.g. a group name already used by another pattern
+            if previous is None:
+                del self._patterns[name]
+            else:
+                self._patterns[name] = previous
+            self._compiled = None
+            raise ValueError(
+                f"Pattern {name!r} conflicts with registered patterns: {e}"
+            ) from e
+
+    @property
+    def pattern(self) -> re.Pattern[str]:
+        """Combined pattern (compiled on first use after a change)"""
+        if self._compiled is None:
+            branches: list[str] = []
+            run: list[str] = []
+            run_chars = None
+
+            def close_run() -> None:
+                if run:
+                    branches.append(f"(?={run_chars})(?:{'|'.join(run)})")
+                    run.clear()
+
+            for name, (source, first_chars) in self._patterns.items():
+                group = f"(?P<{name}>{source})"
+                if first_chars is None:
+                    close_run()
+                    branches.append(group)
+                    continue
+                if first_chars != run_chars:
+                    close_run()
+                    run_chars = first_chars
+                run.append(group)
+            close_run()
+
+            self._compiled = re.compile("|".join(branches))
+            # An outer named group closes after any group nested in it,
+            # so Match.lastindex identifies which pattern matched
+            self._kinds = {
+                index: name
+                for name, index in self._compiled.groupindex.items()
+            }
+        return self._compiled
+
+    def finditer(self, text: str) -> Iterator[PiiMatch]:
+        """Yield PII matches without building a new string
+
+        Args:
+            text (str): Target text
+
+        Yields:
+            PiiMatch: Matches in order of position
+        """
+        pattern = self.pattern
+        kinds = self._kinds
+        for match in pattern.finditer(text):
+            yield PiiMatch(
+                kinds[match.lastindex],
+                match.start(),
+                match.end(),
+                match.group(),
+            )
+
+    def find(self, text: str) -> list[PiiMatch]:
+        """Return all PII matches in text
+
+        Args:
+            text (str): Target text
+
+        Returns:
+            list[PiiMatch]: Matches in order of position
+        """
+        return list(self.finditer(text))
+
+    def redact(self, text: str, replace_text: str | None = None) -> str:
+        """Replace all PII in text in a single scan
+
+        Args:
+            text (str): Target text
+            replace_text (str | None): Replacement string. Defaults to the
+                engine's replace_text.
+
+        Returns:
+            str: Redacted text
+        """
+        replacement = (
+            self.replace_text if replace_text is None else replace_text
+        )
+        # Escape backslashes so the replacement is taken literally
+        return self.pattern.sub(replacement.replace("\\", "\\\\"), text)
+
+    def redact_documents(
+        self,
+        documents: Iterable[Document],
+        replace_text: str | None = None,
+    ) -> list[Document]:
+        """Redact a batch of Documents
+
+        Returns new Documents with redacted content. The metadata is copied
+        and `pii_counts` records how many matches of each kind were replaced.
+
+        Args:
+            documents (Iterable[Document]): Documents to redact
+            replace_text (str | None): Replacement string
+
+        Returns:
+            list[Document]: Redacted documents
+        """
+        replacement = (
+            self.replace_text if replace_text is None else replace_text
+        )
+        pattern = self.pattern
+        kinds = self._kinds
+        redacted = []
+
+        for doc in documents:
+            counts: dict[str, int] = {}
+
+            def replace(match: re.Match[str]) -> str:
+                kind = kinds[match.lastindex]
+                counts[kind] = counts.get(kind, 0) + 1
+                return replacement
+
+            content = pattern.sub(replace, doc.content)
+            metadata = doc.metadata.copy()
+            metadata["pii_counts"] = counts
+
+            redacted.append(
+                Document(
+                    content=content,
+                    metadata=metadata,
+                    doc_id=doc.doc_id,
+                    source=doc.source,
+                    page_number=doc.page_number,
+                    chunk_index=doc.chunk_index,
+                )
+            )
+
+        return redacted
+
 
 class PiiRedactor:
-    """Processor to detect and redact/replace PII (Personally Identifiable Information)"""
-    
+    """Processor to detect and redact/replace PII
+    (Personally Identifiable Information)"""
+
     # Simple regex patterns
-    EMAIL_PATTERN = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
-    
+    EMAIL_PATTERN = EMAIL_PATTERN
+
     # Phone numbers (simplified: e.g. 03-1234-5678, 090-1234-5678)
     # Allows valid formats with or without hyphens
-    PHONE_PATTERN = re.compile(r'(\d{2,4}[-\(]\d{2,4}[-\)]\d{3,4})|(\d{10,11})')
-    
-    # Credit cards: 13-19 digits with optional single space/hyphen between digits.
-    # Uses lookaheads instead of \b so boundaries work with non-word separators.
-    CREDIT_CARD_PATTERN = re.compile(r'(?<!\d)\d(?:[ -]?\d){12,18}(?!\d)')
+    PHONE_PATTERN = re.compile(
+        r"(\d{2,4}[-\(]\d{2,4}[-\)]\d{3,4})|(\d{10,11})"
+    )
+
+    # Credit cards: 13-19 digits with optional single space/hyphen between
+    # digits. Uses lookaheads instead of \b so boundaries work with non-word
+    # separators.
+    CREDIT_CARD_PATTERN = re.compile(r"(?<!\d)\d(?:[ -]?\d){12,18}(?!\d)")
+
+    # Engine built from the patterns above on first use
+    _engine: PiiRedactionEngine | None = None
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        # Subclasses may override the patterns, so each builds its own engine
+        cls._engine = None
+
+    @classmethod
+    def register_defaults(cls, engine: PiiRedactionEngine) -> None:
+        """Register this class's patterns on an engine
+
+        Credit cards are tried before phone numbers so that a card number
+        is not partially consumed as a phone number.
+        """
+        engine.register("email", cls.EMAIL_PATTERN)
+        engine.register(
+            "credit_card", cls.CREDIT_CARD_PATTERN, first_chars=r"\d"
+        )
+        engine.register("phone", cls.PHONE_PATTERN, first_chars=r"\d")
+
+    @classmethod
+    def engine(cls) -> PiiRedactionEngine:
+        """Return the shared engine built from this class's patterns"""
+        if cls._engine is None:
+            engine = PiiRedactionEngine(patterns={})
+            cls.register_defaults(engine)
+            cls._engine = engine
+        return cls._engine
 
     @classmethod
     def redact(cls, text: str, replace_text: str = "[REDACTED]") -> str:
         """Redact or replace PII in text
-        
+
         Args:
             text (str): Target text
             replace_text (str): Replacement string
-            
+
         Returns:
             str: Redacted text
         """
-        text = cls.EMAIL_PATTERN.sub(replace_text, text)
-        text = cls.PHONE_PATTERN.sub(replace_text, text)
-        text = cls.CREDIT_CARD_PATTERN.sub(replace_text, text)
-        return text
+        return cls.engine().redact(text, replace_text)
+
+    @classmethod
+    def find(cls, text: str) -> list[PiiMatch]:
+        """Find PII in text without modifying it
+
+        Args:
+            text (str): Target text
+
+        Returns:
+            list[PiiMatch]: Matches with their kind and span
+        """
+        return cls.engine().find(text)
+
+    @classmethod
+    def process_documents(
+        cls,
+        documents: Iterable[Document],
+        replace_text: str = "[REDACTED]",
+        num_workers: int = 1,
+        batch_size: int = 1000,
+    ) -> list[Document]:
+        """Redact PII in a collection of Documents
+
+        Args:
+            documents (Iterable[Document]): Documents to redact
+            replace_text (str): Replacement string
+            num_workers (int): Number of worker processes (1 runs in-process)
+            batch_size (int): Documents dispatched to the pool at a time
+
+        Returns:
+            list[Document]: Redacted documents with metadata preserved
+        """
+        return process_documents(
+            documents,
+            [partial(cls.redact, replace_text=replace_text)],
+            num_workers=num_workers,
+            batch_size=batch_size,
+        )
@@ -1,5 +1,22 @@
 """pydocstruct/processors/text_cleaner.py"""
+
 import re
+import unicodedata
+from collections.abc import Callable, Iterable, Sequence
+from functools import partial
+
+from pydocstruct.core.document import Document
+from pydocstruct.processors.batch import process_documents
+from pydocstruct.processors.pii_redactor import (
+    EMAIL_PATTERN,
+    PiiRedactionEngine,
+    PiiRedactor,
+)
+
+# 事前コンパイル済みパターン（TextCleaner と CleanerPipeline で共有）
+URL_PATTERN = re.compile(r"https?://\S+|www\.\S+")
+# タブ・改行・復帰以外の C0 制御文字と DEL
+CONTROL_CHARS_PATTERN = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]")
 
 
 class TextCleaner:
@@ -8,17 +25,18 @@ class TextCleaner:
     @staticmethod
     def normalize_whitespace(text: str) -> str:
         """空白文字を正規化（連続する空白を1つに、前後の空白を削除）"""
-        return re.sub(r"\s+", " ", text).strip()
+        # str.split() は正規表現の \s と同じ空白文字で分割し、前後の空白も除く
+        return " ".join(text.split())
 
     @staticmethod
     def remove_urls(text: str, replacement: str = "") -> str:
         """URLを削除または置換"""
-        return re.sub(r"https?://\S+|www\.\S+", replacement, text)
+        return URL_PATTERN.sub(replacement, text)
 
     @staticmethod
     def remove_emails(text: str, replacement: str = "") -> str:
         """メールアドレスを削除または置換"""
-        return re.sub(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}", replacement, text)
+        return EMAIL_PATTERN.sub(replacement, text)
 
     @staticmethod
     def clean(
@@ -36,3 +54,169 @@ class TextCleaner:
             text = TextCleaner.remove_emails(text)
         return text
 
+    @staticmethod
+    def process_documents(
+        documents: Iterable[Document],
+        normalize_whitespace: bool = True,
+        remove_urls: bool = False,
+        remove_emails: bool = False,
+        num_workers: int = 1,
+        batch_size: int = 1000,
+    ) -> list[Document]:
+        """Documentを一括クリーニング
+
+        num_workers > 1 の場合はプロセスプールで並列処理します。
+        メタデータは保持され、適用した処理が `processors` に記録されます。
+        """
+        cleaner = partial(
+            TextCleaner.clean,
+            normalize_whitespace=normalize_whitespace,
+            remove_urls=remove_urls,
+            remove_emails=remove_emails,
+        )
+        return process_documents(
+            documents,
+            [cleaner],
+            num_workers=num_workers,
+            batch_size=batch_size,
+        )
+
+
+class CleanerPipeline:
+    """設定済みのクリーニング手順をまとめて適用するパイプライン
+
+    生成時に各手順のパターンを一度だけコンパイルし、適用時は手順を順に
+    実行するだけにします。URL・メールの手順は "://" や "@" などの文字列が
+    含まれない場合に走査自体を省略し、空白正規化と Unicode 正規化は正規表現
+    より高速な文字列操作で行います。
+
+    手順:
+        "normalize_unicode": Unicode NFKC 正規化
+        "strip_control_chars": 制御文字（タブ・改行を除く）を削除
+        "remove_urls": URLを削除または置換
+        "remove_emails": メールアドレスを削除または置換
+        "redact_pii": PII（メール・電話番号・カード番号）を1回の走査で置換
+        "normalize_whitespace": 連続する空白を1つにし、前後の空白を削除
+
+    使用例:
+        pipeline = CleanerPipeline(
+            ["normalize_unicode", "remove_urls", "normalize_whitespace"]
+        )
+        cleaned = pipeline.clean(text)
+    """
+
+    STEPS = (
+        "normalize_unicode",
+        "strip_control_chars",
+        "remove_urls",
+        "remove_emails",
+        "redact_pii",
+        "normalize_whitespace",
+    )
+
+    def __init__(
+        self,
+        steps: Sequence[str] = ("normalize_whitespace",),
+        url_replacement: str = "",
+        email_replacement: str = "",
+        pii_replacement: str = "[REDACTED]",
+        pii_engine: PiiRedactionEngine | None = None,
+    ) -> None:
+        """
+        Args:
+            steps: 適用する手順名（指定順に適用）
+            url_replacement: URLの置換文字列
+            email_replacement: メールアドレスの置換文字列
+            pii_replacement: PIIの置換文字列
+            pii_engine: PII検出に使うエンジン（省略時は PiiRedactor の既定パターン）
+        """
+        unknown = [step for step in steps if step not in self.STEPS]
+        if unknown:
+            raise ValueError(
+                f"Unknown steps: {', '.join(unknown)}. "
+                f"Expected any of {', '.join(self.STEPS)}"
+            )
+
+        self.steps = tuple(steps)
+        engine = pii_engine or PiiRedactor.engine()
+        available: dict[str, Callable[[str], str]] = {
+            "normalize_unicode": _normalize_unicode,
+            "strip_control_chars": _RegexStep(CONTROL_CHARS_PATTERN, ""),
+            "remove_urls": _RegexStep(
+                URL_PATTERN, url_replacement, ("://", "www.")
+            ),
+            "remove_emails": _RegexStep(
+                EMAIL_PATTERN, email_replacement, ("@",)
+            ),
+            "redact_pii": _RegexStep(engine.pattern, pii_replacement),
+            "normalize_whitespace": TextCleaner.normalize_whitespace,
+        }
+        self._stages = [available[step] for step in self.steps]
+
+    def clean(self, text: str) -> str:
+        """テキストをクリーニング
+
+        Args:
+            text: 対象テキスト
+
+        Returns:
+            クリーニング後のテキスト
+        """
+        for stage in self._stages:
+            text = stage(text)
+        return text
+
+    __call__ = clean
+
+    def process_documents(
+        self,
+        documents: Iterable[Document],
+        num_workers: int = 1,
+        batch_size: int = 1000,
+    ) -> list[Document]:
+        """Documentを一括クリーニング
+
+        num_workers > 1 の場合はプロセスプールで並列処理します。
+        メタデータは保持され、`processors` に "CleanerPipeline" が記録されます。
+        """
+        return process_documents(
+            documents,
+            [self],
+            num_workers=num_workers,
+            batch_size=batch_size,
+        )
+
+
+class _RegexStep:
+    """コンパイル済みパターンによる置換（pickle 可能）"""
+
+    def __init__(
+        self,
+        pattern: re.Pattern[str],
+        replacement: str,
+        triggers: tuple[str, ...] = (),
+    ) -> None:
+        """
+        Args:
+            pattern: コンパイル済みパターン
+            replacement: 置換文字列（リテラルとして扱う）
+            triggers: マッチに必ず含まれる文字列の候補。どれも含まれなければ走査しない
+        """
+        self.pattern = pattern
+        # バックスラッシュをエスケープしてテンプレート解釈を防ぐ
+        self.template = replacement.replace("\\", "\\\\")
+        self.triggers = triggers
+
+    def __call__(self, text: str) -> str:
+        if self.triggers and not any(
+            trigger in text for trigger in self.triggers
+        ):
+            return text
+        return self.pattern.sub(self.template, text)
+
+
+def _normalize_unicode(text: str) -> str:
+    """NFKC 正規化（正規化済みのテキストはそのまま返す）"""
+    if unicodedata.is_normalized("NFKC", text):
+        return text
+    return unicodedata.normalize("NFKC", text)
@@ -1,12 +1,25 @@
 """Utility modules for pydocstruct"""
+
 from pydocstruct.utils.file_utils import (
     get_file_extension,
     get_mime_type,
     is_supported_format,
 )
+from pydocstruct.utils.table_utils import (
+    dataframe_rows,
+    iter_markdown_tables,
+    markdown_row,
+    render_rows,
+    row_template,
+)
 
 __all__ = [
     "get_file_extension",
     "get_mime_type",
     "is_supported_format",
+    "dataframe_rows",
+    "iter_markdown_tables",
+    "markdown_row",
+    "render_rows",
+    "row_template",
 ]
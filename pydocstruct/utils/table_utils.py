@@ -0,0 +1,131 @@
+"""pydocstruct/utils/table_utils.py"""
+
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from typing import Any
+
+
+def row_template(columns: Sequence[Any]) -> str:
+    """各行を "列名: 値" 形式に変換するための str.format テンプレートを作成"""
+    lines = []
+    for column in columns:
+        # 列名に含まれる波括弧はフォーマット指定と解釈されないようにエスケープ
+        name = str(column).replace("{", "{{").replace("}", "}}")
+        lines.append(f"{name}: {{}}")
+    return "\n".join(lines)
+
+
+def render_rows(
+    columns: Sequence[Any], rows: Iterable[Sequence[Any]]
+) -> list[str]:
+    """行の値を "列名: 値" 形式のテキストに一括変換
+
+    テンプレートを列ごとに一度だけ作成し、各行は str.format の1回の呼び出しで
+    変換します（行ごとに Series を作る iterrows() より大幅に高速です）。
+
+    Args:
+        columns: 列名
+        rows: 各行の値（列と同じ順序）
+
+    Returns:
+        list[str]: 行ごとのテキスト
+    """
+    template = row_template(columns)
+    return [template.format(*row) for row in rows]
+
+
+def dataframe_rows(df: Any) -> Iterator[tuple[Any, ...]]:
+    """DataFrameの行をPythonの値のタプルとして返す
+
+    列ごとに tolist() でまとめて変換してから行に組み直します。
+    列名が重複していても位置で取り出すため正しく扱えます。
+    """
+    return zip(*(df.iloc[:, i].tolist() for i in range(df.shape[1])))
+
+
+def markdown_row(values: Iterable[Any]) -> str:
+    """値の列をMarkdownテーブルの1行に変換
+
+    列幅は揃えません（tabulate のように全セルの幅を測ることはしません）。
+    None と NaN は空のセルになり、"|" はエスケープ、改行は空白に置き換えます。
+    """
+    return "| " + " | ".join(map(_cell_text, values)) + " |"
+
+
+def iter_markdown_tables(
+    columns: Sequence[Any],
+    rows: Iterable[tuple[int, Sequence[Any]]],
+    max_rows: int | None = None,
+    max_length: int | None = None,
+    length_function: Callable[[str], int] = len,
+) -> Iterator[tuple[int, int, str]]:
+    """行をストリーミングで読みながら、大きさに上限のあるMarkdownテーブルに分割
+
+    各テーブルの先頭にはヘッダー行と区切り行を繰り返し付けるため、
+    分割後のテーブルはそれぞれ単独で読める形になります。
+    1行だけで上限を超える場合も、その行は1つのテーブルとして出力します。
+
+    Args:
+        columns: 列名
+        rows: (行番号, 行の値) のイテラブル
+        max_rows: 1テーブルあたりの最大行数（ヘッダーを除く）
+        max_length: 1テーブルあたりの最大の長さ（ヘッダーを含む）
+        length_function: 長さの計算に使う関数（行ごとに1回だけ呼び出します）
+
+    Yields:
+        tuple[int, int, str]: (先頭の行番号, 行数, テーブルのMarkdown)
+    """
+    header = (
+        markdown_row(columns)
+        + "\n"
+        + "| "
+        + " | ".join("---" for _ in columns)
+        + " |"
+    )
+    header_length = length_function(header) if max_length is not None else 0
+
+    lines: list[str] = []
+    start = 0
+    length = header_length
+    for index, values in rows:
+        line = markdown_row(values)
+        # 行の前の改行も含めて長さを数える
+        line_length = (
+            length_function("\n" + line) if max_length is not None else 0
+        )
+
+        full = lines and (
+            (max_rows is not None and len(lines) >= max_rows)
+            or (max_length is not None and length + line_length > max_length)
+        )
+        if full:
+            yield start, len(lines), header + "\n" + "\n".join(lines)
+            lines = []
+            length = header_length
+
+        if not lines:
+            start = index
+        lines.append(line)
+        length += line_length
+
+    if lines:
+        yield start, len(lines), header + "\n" + "\n".join(lines)
+
+
+def _cell_text(value: Any) -> str:
+    if value is None or _is_missing(value):
+        return ""
+    text = str(value)
+    if "|" in text:
+        text = text.replace("|", "\\|")
+    if "\n" in text or "\r" in text:
+        text = " ".join(text.splitlines())
+    return text
+
+
+def _is_missing(value: Any) -> bool:
+    """NaN / NaT / pd.NA（自身と等しくない値）か"""
+    try:
+        return bool(value != value)
+    except TypeError:
+        # pd.NA は比較結果も NA になり、真偽値に変換できない
+        return True
@@ -1,11 +1,28 @@
 """tests/test_chunkers/test_chunkers.py"""
+
 from __future__ import annotations
 
 import pytest
-from pydocstruct.core.chunker import TextChunker, RecursiveCharacterChunker
+
+from pydocstruct.core.chunker import (
+    ContentDefinedChunker,
+    MarkdownChunker,
+    RecursiveCharacterChunker,
+    TextChunker,
+)
 from pydocstruct.core.document import Document
 
 
+def _sample_words(count: int, seed: int = 0) -> str:
+    import random
+
+    rng = random.Random(seed)
+    return " ".join(
+        "".join(rng.choice("abcdefghij") for _ in range(rng.randint(2, 9)))
+        for _ in range(count)
+    )
+
+
 class TestTextChunker:
     def test_short_text_returns_single_chunk(self):
         chunker = TextChunker(chunk_size=100)
@@ -59,7 +76,9 @@ class TestTextChunker:
 
     def test_split_documents_preserves_source_and_metadata(self):
         chunker = TextChunker(chunk_size=10, chunk_overlap=0)
-        doc = Document(content="a" * 30, metadata={"author": "taro"}, source="src.txt")
+        doc = Document(
+            content="a" * 30, metadata={"author": "taro"}, source="src.txt"
+        )
         result = chunker.split_documents([doc])
         for d in result:
             assert d.metadata["author"] == "taro"
@@ -75,6 +94,39 @@ class TestTextChunker:
         chunks = chunker.split_text("")
         assert chunks == [] or chunks == [""]
 
+    def test_chunks_never_exceed_chunk_size(self):
+        chunker = TextChunker(chunk_size=50, chunk_overlap=10)
+        chunks = chunker.split_text(_sample_words(500))
+        assert all(len(c) <= 50 for c in chunks)
+
+    def test_chunks_end_at_word_boundaries(self):
+        chunker = TextChunker(chunk_size=50, chunk_overlap=10)
+        text = _sample_words(500)
+        words = set(text.split())
+        for chunk in chunker.split_text(text)[:-1]:
+            assert chunk.split()[-1] in words
+
+    def test_cjk_text_splits_after_sentence_punctuation(self):
+        """スペースのない日本語テキストは句読点の直後で分割されること"""
+        chunker = TextChunker(chunk_size=30, chunk_overlap=0)
+        text = "これは最初の文です。" * 20
+        chunks = chunker.split_text(text)
+        assert len(chunks) > 1
+        assert all(c.endswith("。") for c in chunks)
+        assert "".join(chunks) == text
+
+    def test_boundary_near_chunk_start_is_preferred_to_hard_cut(self):
+        chunker = TextChunker(chunk_size=20, chunk_overlap=0)
+        chunks = chunker.split_text("ab " + "c" * 30)
+        assert chunks[0] == "ab"
+        assert "".join(chunks[1:]) == "c" * 30
+
+    def test_text_without_boundaries_makes_linear_progress(self):
+        chunker = TextChunker(chunk_size=100, chunk_overlap=20)
+        chunks = chunker.split_text("漢" * 10000)
+        assert len(chunks) == 125
+        assert all(len(c) == 100 for c in chunks[:-1])
+
 
 class TestRecursiveCharacterChunker:
     def test_short_text_returns_single_chunk(self):
@@ -99,7 +151,11 @@ class TestRecursiveCharacterChunker:
 
     def test_all_content_covered(self):
         chunker = RecursiveCharacterChunker(chunk_size=40, chunk_overlap=0)
-        sections = ["Section one text here.", "Section two text here.", "Section three text here."]
+        sections = [
+            "Section one text here.",
+            "Section two text here.",
+            "Section three text here.",
+        ]
         text = "\n\n".join(sections)
         combined = " ".join(chunker.split_text(text))
         for section in sections:
@@ -119,3 +175,355 @@ class TestRecursiveCharacterChunker:
         chunks = chunker.split_text(text)
         assert len(chunks) == 1
         assert chunks[0] == text
+
+
+class TestContentDefinedChunker:
+    def test_chunks_concatenate_to_original_text(self):
+        chunker = ContentDefinedChunker(
+            min_size=32, avg_size=128, max_size=512
+        )
+        text = _sample_words(2000)
+        assert "".join(chunker.split_text(text)) == text
+
+    def test_chunk_sizes_within_bounds(self):
+        chunker = ContentDefinedChunker(
+            min_size=32, avg_size=128, max_size=512
+        )
+        chunks = chunker.split_text(_sample_words(2000))
+        assert len(chunks) > 1
+        assert all(len(c) <= 512 for c in chunks)
+        assert all(len(c) >= 32 for c in chunks[:-1])
+
+    def test_boundaries_snap_to_whitespace(self):
+        chunker = ContentDefinedChunker(
+            min_size=32, avg_size=128, max_size=512
+        )
+        chunks = chunker.split_text(_sample_words(2000))
+        assert all(c[-1].isspace() for c in chunks[:-1])
+
+    def test_edit_near_start_keeps_later_chunks(self):
+        chunker = ContentDefinedChunker(
+            min_size=32, avg_size=128, max_size=512
+        )
+        text = _sample_words(2000)
+        edited = "A new opening sentence. " + text
+        original = chunker.split_text(text)
+        changed = chunker.split_text(edited)
+        shared = set(original) & set(changed)
+        assert len(shared) >= len(original) - 3
+
+    def test_short_text_returns_single_chunk(self):
+        chunker = ContentDefinedChunker(
+            min_size=32, avg_size=128, max_size=512
+        )
+        assert chunker.split_text("Hello world") == ["Hello world"]
+
+    def test_split_documents_sets_stable_chunk_ids(self):
+        chunker = ContentDefinedChunker(
+            min_size=32, avg_size=128, max_size=512
+        )
+        text = _sample_words(500)
+        first = chunker.split_documents(
+            [Document(content=text, source="a.txt")]
+        )
+        second = chunker.split_documents(
+            [Document(content=text, source="a.txt")]
+        )
+        assert [d.metadata["chunk_id"] for d in first] == [
+            d.metadata["chunk_id"] for d in second
+        ]
+        for d in first:
+            assert d.metadata["chunk_id"].startswith("a.txt:")
+            assert (
+                text[d.metadata["start_index"] : d.metadata["end_index"]]
+                == d.content
+            )
+
+    def test_invalid_sizes_raise(self):
+        with pytest.raises(ValueError):
+            ContentDefinedChunker(min_size=100, avg_size=50, max_size=200)
+
+
+class TestIncrementalChunker:
+    @staticmethod
+    def _setup(text):
+        from pydocstruct.core.incremental import IncrementalChunker
+
+        chunker = ContentDefinedChunker(
+            min_size=32, avg_size=128, max_size=512
+        )
+        previous = chunker.split_documents(
+            [Document(content=text, source="a.txt")]
+        )
+        return chunker, IncrementalChunker(chunker), previous
+
+    def test_unchanged_document_has_empty_diff(self):
+        text = _sample_words(1000)
+        _, incremental, previous = self._setup(text)
+        diff = incremental.diff(
+            previous, Document(content=text, source="a.txt")
+        )
+        assert diff.added == []
+        assert diff.removed == []
+        assert len(diff.unchanged) == len(
+            {d.metadata["chunk_id"] for d in previous}
+        )
+
+    def test_edit_in_middle_changes_only_nearby_chunks(self):
+        text = _sample_words(1000)
+        chunker, incremental, previous = self._setup(text)
+        middle = len(text) // 2
+        edited = text[:middle] + " inserted words here " + text[middle:]
+        diff = incremental.diff(
+            previous, Document(content=edited, source="a.txt")
+        )
+        assert 1 <= len(diff.added) <= 3
+        assert 1 <= len(diff.removed) <= 3
+        assert len(diff.unchanged) >= len(previous) - 3
+
+    def test_diff_matches_full_rechunk(self):
+        from pydocstruct.core.incremental import ChunkRecord
+
+        text = _sample_words(1000)
+        chunker, incremental, previous = self._setup(text)
+        edited = text[:200] + text[400:] + " appended tail"
+        new_doc = Document(content=edited, source="a.txt")
+        diff = incremental.diff(previous, new_doc)
+        full = [
+            ChunkRecord.from_document(d)
+            for d in chunker.split_documents([new_doc])
+        ]
+        assert diff.records == full
+        old_ids = {d.metadata["chunk_id"] for d in previous}
+        new_ids = {r.chunk_id for r in full}
+        assert set(diff.removed) == old_ids - new_ids
+        assert {
+            d.metadata["chunk_id"] for d in diff.added
+        } == new_ids - old_ids
+
+    def test_records_can_be_reused_for_next_update(self):
+        text = _sample_words(500)
+        _, incremental, previous = self._setup(text)
+        first = incremental.diff(
+            previous, Document(content="intro " + text, source="a.txt")
+        )
+        second = incremental.diff(
+            first.records, Document(content="intro " + text, source="a.txt")
+        )
+        assert second.added == []
+        assert second.removed == []
+
+    @pytest.mark.parametrize(
+        "alphabet",
+        ["漢字仮名文章データ処理。", "abcdefghijklmnopqrstuvwxyz" * 2 + " "],
+    )
+    def test_diff_matches_full_rechunk_on_text_without_spaces(self, alphabet):
+        import random
+
+        from pydocstruct.core.incremental import (
+            ChunkRecord,
+            IncrementalChunker,
+        )
+
+        rng = random.Random(0)
+        chunker = ContentDefinedChunker(min_size=8, avg_size=32, max_size=96)
+        incremental = IncrementalChunker(chunker)
+        for _ in range(300):
+            text = "".join(
+                rng.choice(alphabet) for _ in range(rng.randint(0, 600))
+            )
+            previous = chunker.split_documents(
+                [Document(content=text, source="a.txt")]
+            )
+            start = rng.randint(0, len(text))
+            stop = rng.randint(start, min(len(text), start + 40))
+            inserted = "".join(
+                rng.choice(alphabet) for _ in range(rng.randint(0, 30))
+            )
+            new_doc = Document(
+                content=text[:start] + inserted + text[stop:], source="a.txt"
+            )
+            diff = incremental.diff(previous, new_doc)
+            full = [
+                ChunkRecord.from_document(d)
+                for d in chunker.split_documents([new_doc])
+            ]
+            assert diff.records == full
+
+    def test_empty_previous_adds_everything(self):
+        from pydocstruct.core.incremental import IncrementalChunker
+
+        text = _sample_words(300)
+        diff = IncrementalChunker().diff([], Document(content=text))
+        assert "".join(d.content for d in diff.added) == text
+        assert diff.removed == []
+
+
+SAMPLE_MARKDOWN = """# Guide
+
+Guide intro.
+
+## Install
+
+```bash
+# not a heading
+pip install pydocstruct
+```
+
+## Usage
+
+| option | default |
+|--------|---------|
+| size   | 1000    |
+
+- first item
+- second item
+"""
+
+
+class TestMarkdownChunker:
+    def test_small_document_is_single_chunk(self):
+        chunker = MarkdownChunker(chunk_size=1000)
+        chunks = chunker.split_text(SAMPLE_MARKDOWN)
+        assert chunks == [SAMPLE_MARKDOWN.strip()]
+
+    def test_sections_are_split_with_header_path(self):
+        chunker = MarkdownChunker(chunk_size=80)
+        result = dict(
+            (path, chunk)
+            for chunk, path in chunker.split_text_with_headers(SAMPLE_MARKDOWN)
+        )
+        assert "Guide > Install" in result
+        assert "Guide > Usage" in result
+        assert "pip install pydocstruct" in result["Guide > Install"]
+
+    def test_comment_in_code_fence_is_not_a_header(self):
+        chunker = MarkdownChunker(chunk_size=80)
+        paths = [
+            path
+            for _, path in chunker.split_text_with_headers(SAMPLE_MARKDOWN)
+        ]
+        assert not any("not a heading" in path for path in paths)
+
+    def test_code_fence_is_never_split(self):
+        code = "```python\n" + "print('x')\n" * 50 + "```"
+        chunker = MarkdownChunker(chunk_size=100)
+        chunks = chunker.split_text("# Code\n\n" + code)
+        assert code in chunks
+
+    def test_table_is_never_split(self):
+        table = "| a | b |\n|---|---|\n" + "| 1 | 2 |\n" * 30
+        chunker = MarkdownChunker(chunk_size=100)
+        chunks = chunker.split_text("# Data\n\n" + table.strip())
+        assert table.strip() in chunks
+
+    def test_small_sibling_sections_are_packed_together(self):
+        text = "# Top\n\n" + "\n\n".join(
+            f"## S{i}\n\nshort {i}" for i in range(6)
+        )
+        text += "\n\n## Long\n\n" + "word " * 40
+        chunker = MarkdownChunker(chunk_size=120)
+        chunks = chunker.split_text_with_headers(text)
+        packed = [chunk for chunk, path in chunks if path == "Top"]
+        assert packed and "## S0" in packed[0] and "## S1" in packed[0]
+
+    def test_long_paragraph_is_split_within_chunk_size(self):
+        chunker = MarkdownChunker(chunk_size=100)
+        chunks = chunker.split_text("# Title\n\n" + "word " * 100)
+        assert len(chunks) > 1
+        assert all(len(c) <= 100 for c in chunks)
+        assert chunks[0].startswith("# Title")
+
+    def test_split_documents_sets_header_path_metadata(self):
+        chunker = MarkdownChunker(chunk_size=80)
+        result = chunker.split_documents(
+            [Document(content=SAMPLE_MARKDOWN, source="guide.md")]
+        )
+        assert all("header_path" in d.metadata for d in result)
+        assert [d.chunk_index for d in result] == list(range(len(result)))
+
+
+class TestEmbeddingBatcher:
+    @staticmethod
+    def _docs(lengths):
+        return [Document(content="x" * n) for n in lengths]
+
+    def test_batches_respect_item_and_token_limits(self):
+        from pydocstruct.core.batcher import EmbeddingBatcher
+
+        batcher = EmbeddingBatcher(
+            max_batch_size=3, max_batch_tokens=10, length_function=len
+        )
+        batches = batcher.plan(self._docs([5, 4, 3, 2, 1, 6, 7, 2]))
+        for batch in batches:
+            assert len(batch) <= 3
+            assert batch.total_tokens <= 10
+        assert sum(len(b) for b in batches) == 8
+
+    def test_first_fit_decreasing_packs_tightly(self):
+        from pydocstruct.core.batcher import EmbeddingBatcher
+
+        batcher = EmbeddingBatcher(
+            max_batch_size=10, max_batch_tokens=10, length_function=len
+        )
+        batches = batcher.plan(self._docs([2, 8, 3, 7, 5, 5]))
+        assert len(batches) == 3
+        assert all(b.total_tokens == 10 for b in batches)
+
+    def test_oversized_document_gets_own_batch(self):
+        from pydocstruct.core.batcher import EmbeddingBatcher
+
+        batcher = EmbeddingBatcher(max_batch_tokens=10, length_function=len)
+        batches = batcher.plan(self._docs([25, 3, 3]))
+        assert [b.token_counts for b in batches] == [[25], [3, 3]]
+
+    def test_sorted_strategy_groups_similar_lengths(self):
+        from pydocstruct.core.batcher import EmbeddingBatcher
+
+        batcher = EmbeddingBatcher(
+            max_batch_size=2,
+            max_batch_tokens=100,
+            strategy="sorted",
+            length_function=len,
+        )
+        batches = batcher.plan(self._docs([1, 30, 2, 29]))
+        assert [b.token_counts for b in batches] == [[1, 2], [29, 30]]
+        assert sum(b.padded_tokens for b in batches) == 2 * 2 + 30 * 2
+
+    def test_sequential_strategy_preserves_order(self):
+        from pydocstruct.core.batcher import EmbeddingBatcher
+
+        docs = [Document(content=c) for c in ["aaa", "b", "cc", "dddd"]]
+        batcher = EmbeddingBatcher(
+            max_batch_size=2,
+            max_batch_tokens=100,
+            strategy="sequential",
+            length_function=len,
+        )
+        batches = batcher.plan(docs)
+        assert [b.texts for b in batches] == [["aaa", "b"], ["cc", "dddd"]]
+
+    def test_window_size_limits_documents_planned_together(self):
+        from pydocstruct.core.batcher import EmbeddingBatcher
+
+        batcher = EmbeddingBatcher(
+            max_batch_size=10,
+            max_batch_tokens=100,
+            window_size=2,
+            length_function=len,
+        )
+        batches = list(batcher.iter_batches(iter(self._docs([1, 1, 1, 1, 1]))))
+        assert [len(b) for b in batches] == [2, 2, 1]
+
+    def test_invalid_strategy_raises(self):
+        from pydocstruct.core.batcher import EmbeddingBatcher
+
+        with pytest.raises(ValueError):
+            EmbeddingBatcher(strategy="random", length_function=len)
+
+    @pytest.mark.parametrize("window_size", [0, -1])
+    def test_non_positive_window_size_raises(self, window_size):
+        from pydocstruct.core.batcher import EmbeddingBatcher
+
+        with pytest.raises(ValueError):
+            EmbeddingBatcher(window_size=window_size, length_function=len)
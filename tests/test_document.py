@@ -1,4 +1,5 @@
 """tests/test_document.py"""
+
 from pydocstruct.core.document import Document
 
 
@@ -10,7 +11,7 @@ def test_document_creation():
         metadata={"author": "Test Author"},
         source="test.txt",
     )
-    
+
     # 検証
     assert doc.content == "テストコンテンツ"
     assert doc.metadata["author"] == "Test Author"
@@ -25,10 +26,10 @@ def test_document_to_dict():
         content="テストコンテンツ",
         doc_id="doc_001",
     )
-    
+
     # 辞書に変換
     doc_dict = doc.to_dict()
-    
+
     # 検証
     assert isinstance(doc_dict, dict)
     assert doc_dict["content"] == "テストコンテンツ"
@@ -92,3 +93,62 @@ def test_document_optional_fields_default_to_none():
     assert doc.source is None
     assert doc.page_number is None
     assert doc.chunk_index is None
+
+
+def test_lazy_table_document_renders_on_first_access():
+    """LazyTableDocument は content の初回参照時に共有テーブルから生成されること"""
+    from pydocstruct.core.table import ColumnarTable, LazyTableDocument
+
+    table = ColumnarTable.from_rows(
+        ["a", "b", "c"], [(10, [1, "x", None]), (11, [2, "y", 3.5])]
+    )
+    doc = LazyTableDocument(
+        table, 0, 2, metadata={"table_schema": table.schema}
+    )
+    assert not doc.is_rendered
+    assert doc.content == "a: 1\nb: x\nc: \n\na: 2\nb: y\nc: 3.5"
+    assert doc.is_rendered
+    assert doc.to_dict()["content"] == doc.content
+
+    subset = doc.select_columns(["c", "a"])
+    assert subset.table is table
+    assert subset.content == "a: 1\nc: \n\na: 2\nc: 3.5"
+    # メタデータの列順は描画の順（テーブルの列順）と一致する
+    assert subset.metadata["columns"] == ["a", "c"]
+
+    doc.content = "replaced"
+    assert doc.content == "replaced"
+
+
+def test_lazy_table_document_matches_eager_document():
+    """LazyTableDocument は dataclasses の関数で同じ内容の Document と同様に扱えること"""
+    import copy
+    import dataclasses
+    import pickle
+
+    from pydocstruct.core.table import ColumnarTable, LazyTableDocument
+
+    table = ColumnarTable.from_rows(["a", "b"], [(0, [1, "x"])])
+    metadata = {"created_at": "2024-01-01T00:00:00", "row_index": 0}
+    lazy = LazyTableDocument(
+        table, 0, 1, metadata=metadata.copy(), source="t.csv"
+    )
+    eager = Document(
+        content="a: 1\nb: x", metadata=metadata.copy(), source="t.csv"
+    )
+
+    assert dataclasses.asdict(lazy) == dataclasses.asdict(eager)
+    assert lazy == eager
+    assert eager == lazy
+    assert lazy != Document(
+        content="other", metadata=metadata.copy(), source="t.csv"
+    )
+    assert repr(lazy).endswith(repr(eager).removeprefix("Document"))
+
+    replaced = dataclasses.replace(lazy, chunk_index=3)
+    assert type(replaced) is Document
+    assert replaced == dataclasses.replace(eager, chunk_index=3)
+
+    for restored in (copy.copy(lazy), pickle.loads(pickle.dumps(lazy))):
+        assert isinstance(restored, LazyTableDocument)
+        assert restored == eager
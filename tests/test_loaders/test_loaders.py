@@ -1,10 +1,14 @@
 """tests/test_loaders/test_loaders.py"""
-import pytest
-import json
+
 import csv
+import json
 from pathlib import Path
+
+import pytest
+
 from pydocstruct import load
 
+
 @pytest.fixture
 def sample_json_file(sample_files_dir):
     path = sample_files_dir / "test.json"
@@ -13,6 +17,7 @@ def sample_json_file(sample_files_dir):
         json.dump(data, f, ensure_ascii=False)
     return path
 
+
 @pytest.fixture
 def sample_csv_file(sample_files_dir):
     path = sample_files_dir / "test.csv"
@@ -22,6 +27,7 @@ def sample_csv_file(sample_files_dir):
         writer.writerow(["val1", "val2"])
     return path
 
+
 @pytest.fixture
 def sample_xml_file(sample_files_dir):
     path = sample_files_dir / "test.xml"
@@ -29,31 +35,38 @@ def sample_xml_file(sample_files_dir):
     path.write_text(content, encoding="utf-8")
     return path
 
+
 @pytest.fixture
 def sample_html_file(sample_files_dir):
     path = sample_files_dir / "test.html"
-    content = "<html><head><title>Test</title></head><body><p>Hello World</p><script>console.log('skip');</script></body></html>"
+    content = (
+        "<html><head><title>Test</title></head><body><p>Hello World</p>"
+        "<script>console.log('skip');</script></body></html>"
+    )
     path.write_text(content, encoding="utf-8")
     return path
 
+
 @pytest.fixture
 def sample_docx_file(sample_files_dir):
     try:
         import docx
     except ImportError:
         return None
-        
+
     doc = docx.Document()
     doc.add_paragraph("Hello Docx")
     path = sample_files_dir / "test.docx"
     doc.save(path)
     return path
 
+
 def test_text_loader(sample_text_file):
     docs = load(sample_text_file)
     assert len(docs) == 1
     assert "テストファイル" in docs[0].content
 
+
 def test_json_loader(sample_json_file):
     docs = load(sample_json_file)
     assert len(docs) == 1
@@ -62,6 +75,7 @@ def test_json_loader(sample_json_file):
     assert '"value"' in docs[0].content
     assert "list" in docs[0].content
 
+
 def test_csv_loader(sample_csv_file):
     docs = load(sample_csv_file)
     # pandasはヘッダー行をカラム名として読み込むため、データ行は1行 → 1 Document
@@ -69,6 +83,7 @@ def test_csv_loader(sample_csv_file):
     assert "col1: val1" in docs[0].content
     assert "col2: val2" in docs[0].content
 
+
 def test_xml_loader(sample_xml_file):
     docs = load(sample_xml_file)
     assert len(docs) == 1
@@ -77,6 +92,7 @@ def test_xml_loader(sample_xml_file):
     assert "<child>" not in docs[0].content
     assert "<root>" not in docs[0].content
 
+
 def test_html_loader(sample_html_file):
     docs = load(sample_html_file)
     assert len(docs) == 1
@@ -84,6 +100,822 @@ def test_html_loader(sample_html_file):
     assert "console.log" not in docs[0].content
     assert docs[0].metadata.get("title") == "Test"
 
+
+@pytest.fixture
+def sample_noisy_html_file(sample_files_dir):
+    path = sample_files_dir / "noisy.html"
+    content = (
+        "<html><head><title>Manual</title><meta charset='utf-8'></head><body>"
+        "<header class='site-header'><nav><a href='/'>Home</a></nav></header>"
+        "<main><h1>Install</h1><p>Run <code>pip install</code> first.</p>"
+        "<div class='ad-banner'>Buy now</div><ul><li>one</li><li>two</li></ul></main>"
+        "<footer>Copyright</footer></body></html>"
+    )
+    path.write_text(content, encoding="utf-8")
+    return path
+
+
+def test_html_loader_remove_noise(sample_noisy_html_file):
+    from pydocstruct.processors.html_cleaner import HtmlNoiseCleaner
+
+    docs = load(sample_noisy_html_file, remove_noise=True)
+    assert docs[0].metadata["title"] == "Manual"
+    assert "Home" not in docs[0].content
+    assert "Buy now" not in docs[0].content
+    assert "Copyright" not in docs[0].content
+    html = sample_noisy_html_file.read_text(encoding="utf-8")
+    assert docs[0].content == HtmlNoiseCleaner.clean(html)
+
+
+def test_html_loader_remove_noise_with_markdown(sample_noisy_html_file):
+    docs = load(
+        sample_noisy_html_file, remove_noise=True, preserve_structure=True
+    )
+    content = docs[0].content
+    assert content.startswith("# Install")
+    assert "`pip install`" in content
+    assert "* one" in content
+    assert "Copyright" not in content
+    assert docs[0].metadata["title"] == "Manual"
+
+
+def test_html_loader_native_markdown_renderer(sample_noisy_html_file):
+    docs = load(
+        sample_noisy_html_file,
+        remove_noise=True,
+        preserve_structure=True,
+        markdown_renderer="native",
+    )
+    assert docs[0].metadata["title"] == "Manual"
+    assert (
+        docs[0].content
+        == "# Install\n\nRun `pip install` first.\n\n* one\n* two"
+    )
+
+
+def test_html_loader_native_renderer_without_head_end_tag(sample_files_dir):
+    from pydocstruct.loaders.html_loader import HtmlLoader
+
+    path = sample_files_dir / "no_head_end.html"
+    path.write_text(
+        "<html><head><title>Manual</title><body><h1>Guide</h1><p>Main content here</p>",
+        encoding="utf-8",
+    )
+    docs = HtmlLoader(
+        path, preserve_structure=True, markdown_renderer="native"
+    ).load()
+    assert docs[0].content == "# Guide\n\nMain content here"
+    sections = HtmlLoader(
+        path, split_by_headings=True, preserve_structure=True
+    ).load()
+    assert [d.content for d in sections] == ["# Guide\n\nMain content here"]
+
+
+@pytest.fixture
+def sample_manual_html_file(sample_files_dir):
+    path = sample_files_dir / "manual.html"
+    content = (
+        "<html><head><title>Manual</title></head><body><p>Preface</p>"
+        "<h1 id='guide'>Guide</h1><p>Overview</p>"
+        "<h2><a name='install'></a>Install</h2><p>Run setup.</p>"
+        "<h2 id='usage'>Usage</h2><h3>CLI</h3><p>Call the tool.</p>"
+        "<h1>Appendix</h1><p>Notes</p></body></html>"
+    )
+    path.write_text(content, encoding="utf-8")
+    return path
+
+
+def test_html_loader_split_by_headings(sample_manual_html_file):
+    docs = load(
+        sample_manual_html_file, split_by_headings=True, remove_noise=True
+    )
+    assert [d.metadata["header"] for d in docs] == [
+        None,
+        "Guide",
+        "Install",
+        "Usage",
+        "CLI",
+        "Appendix",
+    ]
+    assert docs[4].metadata["header_path"] == "Guide > Usage > CLI"
+    assert docs[4].metadata["header_level"] == 3
+    assert [d.metadata["anchor_id"] for d in docs[1:4]] == [
+        "guide",
+        "install",
+        "usage",
+    ]
+    assert docs[2].content == "Install\nRun setup."
+    assert all(d.metadata["title"] == "Manual" for d in docs)
+
+
+def test_html_loader_split_by_headings_markdown(sample_manual_html_file):
+    from pydocstruct.loaders.html_loader import HtmlLoader
+
+    loader = HtmlLoader(
+        sample_manual_html_file,
+        split_by_headings=True,
+        preserve_structure=True,
+    )
+    docs = list(loader.lazy_load())
+    assert [d.content for d in docs[:3]] == [
+        "Preface",
+        "# Guide\n\nOverview",
+        "## Install\n\nRun setup.",
+    ]
+    assert docs[-1].metadata["header_path"] == "Appendix"
+    text_docs = load(
+        sample_manual_html_file, split_by_headings=True, remove_noise=True
+    )
+    assert [d.metadata["header_path"] for d in docs] == [
+        d.metadata["header_path"] for d in text_docs
+    ]
+
+
+@pytest.fixture
+def sample_records_xml_file(sample_files_dir):
+    path = sample_files_dir / "records.xml"
+    content = (
+        '<?xml version="1.0" encoding="utf-8"?>'
+        '<feed xmlns="http://example.com/ns"><meta><name>ignored</name></meta>'
+        '<item sku="A1"><title>Lamp</title><price>10</price><body>Warm <b>light</b></body></item>'
+        '<item sku="B2"><title>Desk</title><body>Oak desk</body></item>'
+        '<group><item sku="C3"><title>Nested</title></item></group>'
+        "</feed>"
+    )
+    path.write_text(content, encoding="utf-8")
+    return path
+
+
+def test_xml_loader_record_tag(sample_records_xml_file):
+    pytest.importorskip("lxml")
+    docs = load(
+        sample_records_xml_file,
+        record_tag="feed/item",
+        content_fields=["body"],
+        metadata_fields=["title", "price", "@sku"],
+    )
+    assert [d.content for d in docs] == ["Warm\nlight", "Oak desk"]
+    assert docs[0].metadata["title"] == "Lamp"
+    assert docs[0].metadata["@sku"] == "A1"
+    assert docs[1].metadata["price"] is None
+    assert [d.metadata["record_index"] for d in docs] == [0, 1]
+
+
+def test_xml_loader_record_tag_lazy_load(sample_records_xml_file):
+    pytest.importorskip("lxml")
+    from pydocstruct.loaders.xml_loader import XmlLoader
+
+    docs = XmlLoader(sample_records_xml_file, record_tag="item").lazy_load()
+    first = next(docs)
+    assert first.content == "Lamp\n10\nWarm\nlight"
+    assert first.metadata["record_tag"] == "item"
+    assert [d.metadata["record_index"] for d in docs] == [1, 2]
+
+
+@pytest.mark.parametrize(
+    "path", ["title']|//*[local-name()='x", "a[1]", "@id or 1=1"]
+)
+def test_xml_loader_rejects_invalid_field_names(sample_records_xml_file, path):
+    pytest.importorskip("lxml")
+    from pydocstruct.loaders.xml_loader import XmlLoader
+
+    with pytest.raises(ValueError):
+        XmlLoader(
+            sample_records_xml_file, record_tag="item", metadata_fields=[path]
+        )
+
+
+@pytest.mark.parametrize(
+    "record_tag, expected",
+    [
+        ("{http://example.com/ns}item", ["A1", "B2", "C3"]),
+        (
+            "{http://example.com/ns}feed/{http://example.com/ns}item",
+            ["A1", "B2"],
+        ),
+        ("/feed/{http://example.com/ns}item/", ["A1", "B2"]),
+        ("{http://other.example.com/ns}item", []),
+    ],
+)
+def test_xml_loader_namespaced_record_tag(
+    sample_records_xml_file, record_tag, expected
+):
+    pytest.importorskip("lxml")
+    docs = load(
+        sample_records_xml_file,
+        record_tag=record_tag,
+        metadata_fields=["@sku"],
+    )
+    assert [d.metadata["@sku"] for d in docs] == expected
+
+
+@pytest.mark.parametrize(
+    "record_tag",
+    [
+        "{http://example.com/ns}",
+        "feed//item",
+        "{http://example.com/ns",
+        "a[1]",
+    ],
+)
+def test_xml_loader_rejects_invalid_record_tag(
+    sample_records_xml_file, record_tag
+):
+    pytest.importorskip("lxml")
+    from pydocstruct.loaders.xml_loader import XmlLoader
+
+    with pytest.raises(ValueError):
+        XmlLoader(sample_records_xml_file, record_tag=record_tag)
+
+
+@pytest.fixture
+def sample_jsonl_file(sample_files_dir):
+    path = sample_files_dir / "records.jsonl"
+    lines = [
+        json.dumps({"id": i, "text": f"レコード{i}"}, ensure_ascii=False)
+        for i in range(5)
+    ]
+    lines.insert(2, "")
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return path
+
+
+def test_json_loader_jsonl(sample_jsonl_file):
+    docs = load(sample_jsonl_file, batch_size=2)
+    assert len(docs) == 5
+    assert json.loads(docs[3].content) == {"id": 3, "text": "レコード3"}
+    assert [d.metadata["line_number"] for d in docs] == [1, 2, 4, 5, 6]
+    assert [d.metadata["index"] for d in docs] == [0, 1, 2, 3, 4]
+
+
+def test_json_loader_jsonl_reports_bad_line(sample_files_dir):
+    path = sample_files_dir / "bad.jsonl"
+    path.write_text('{"a": 1}\n{"b": 2}, {"c": 3}\n', encoding="utf-8")
+    with pytest.raises(json.JSONDecodeError, match="line 2"):
+        load(path)
+
+
+def test_json_loader_stream_matches_load(sample_json_list_file, monkeypatch):
+    from pydocstruct.loaders import json_loader
+    from pydocstruct.loaders.json_loader import JsonLoader
+
+    # 要素がバッファの境界をまたぐように読み込み単位を小さくする
+    monkeypatch.setattr(json_loader, "_READ_CHUNK_SIZE", 3)
+    streamed = list(JsonLoader(sample_json_list_file, stream=True).lazy_load())
+    loaded = JsonLoader(sample_json_list_file).load()
+    assert [d.content for d in streamed] == [d.content for d in loaded]
+    assert [d.metadata["index"] for d in streamed] == list(range(len(loaded)))
+
+
+@pytest.mark.parametrize("text", ['[{"a": 1}] x', "[] ]", '{"a": 1} {"b": 2}'])
+@pytest.mark.parametrize("stream", [False, True])
+def test_json_loader_rejects_trailing_data(sample_files_dir, text, stream):
+    path = sample_files_dir / "trailing.json"
+    path.write_text(text + "\n", encoding="utf-8")
+    with pytest.raises(json.JSONDecodeError, match="Extra data"):
+        load(path, stream=stream)
+
+
+def test_json_loader_stream_single_object(sample_json_file):
+    docs = load(sample_json_file, stream=True)
+    assert docs[0].content == load(sample_json_file)[0].content
+
+
+@pytest.fixture
+def sample_articles_jsonl_file(sample_files_dir):
+    path = sample_files_dir / "articles.jsonl"
+    records = [
+        {
+            "id": 1,
+            "title": "最初",
+            "body": "本文1",
+            "author": {"name": "taro"},
+            "tags": ["a", "b"],
+            "blob": "x" * 100,
+        },
+        {"id": 2, "title": "二番目", "author": {}, "tags": []},
+    ]
+    path.write_text(
+        "\n".join(json.dumps(r, ensure_ascii=False) for r in records),
+        encoding="utf-8",
+    )
+    return path
+
+
+def test_json_loader_field_projection(sample_articles_jsonl_file):
+    docs = load(
+        sample_articles_jsonl_file,
+        content_key=["title", "body"],
+        metadata_keys=["id", "author.name", "$.tags.0"],
+    )
+    assert docs[0].content == "最初\n本文1"
+    assert docs[1].content == "二番目"
+    assert docs[0].metadata["author.name"] == "taro"
+    assert docs[0].metadata["$.tags.0"] == "a"
+    assert docs[1].metadata["author.name"] is None
+    assert docs[1].metadata["$.tags.0"] is None
+    assert "blob" not in docs[0].content
+
+
+def test_json_loader_projection_on_single_object(sample_json_file):
+    docs = load(sample_json_file, content_key="list", metadata_keys=["key"])
+    assert docs[0].content == "[1, 2, 3]"
+    assert docs[0].metadata["key"] == "value"
+
+
+@pytest.fixture
+def sample_table_csv_file(sample_files_dir):
+    path = sample_files_dir / "table.csv"
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["id", "name", "price"])
+        for i in range(5):
+            writer.writerow([i, f"item{i}", i * 1.5])
+    return path
+
+
+def test_csv_loader_renders_rows_like_iterrows(sample_table_csv_file):
+    import pandas as pd
+
+    df = pd.read_csv(sample_table_csv_file)
+    expected = [
+        "\n".join(f"{col}: {val}" for col, val in row.items())
+        for _, row in df.iterrows()
+    ]
+    docs = load(sample_table_csv_file)
+    assert [doc.content for doc in docs] == expected
+    assert [doc.metadata["row_index"] for doc in docs] == [0, 1, 2, 3, 4]
+
+
+def test_csv_loader_rows_per_document(sample_table_csv_file):
+    docs = load(sample_table_csv_file, rows_per_document=2)
+    assert len(docs) == 3
+    assert [doc.metadata["row_index"] for doc in docs] == [0, 2, 4]
+    assert [doc.metadata["row_count"] for doc in docs] == [2, 2, 1]
+    assert (
+        docs[0].content
+        == "id: 0\nname: item0\nprice: 0.0\n\nid: 1\nname: item1\nprice: 1.5"
+    )
+    with pytest.raises(ValueError):
+        load(sample_table_csv_file, rows_per_document=0)
+
+
+def test_csv_loader_chunksize_matches_load(sample_table_csv_file):
+    from pydocstruct.loaders.csv_loader import CsvLoader
+
+    expected = [
+        doc.content
+        for doc in CsvLoader(sample_table_csv_file, rows_per_document=2).load()
+    ]
+    docs = list(
+        CsvLoader(
+            sample_table_csv_file, rows_per_document=2, chunksize=3
+        ).lazy_load()
+    )
+    # グループはチャンクの境界をまたいでも同じになること
+    assert [doc.content for doc in docs] == expected
+    assert [doc.metadata["row_index"] for doc in docs] == [0, 2, 4]
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        {"chunksize": 1},
+        {"chunksize": 2, "lazy": True},
+        {"lazy": True},
+        {
+            "output_format": "markdown",
+            "markdown_renderer": "native",
+            "max_table_rows": 1,
+            "chunksize": 1,
+        },
+    ],
+)
+def test_csv_loader_values_do_not_depend_on_chunks(sample_files_dir, options):
+    path = sample_files_dir / "missing.csv"
+    path.write_text("a,b,c\n1,2.5,x\n2,,\n\n3,4,z\n", encoding="utf-8")
+    from pydocstruct.loaders.csv_loader import CsvLoader
+
+    expected = [
+        doc.content
+        for doc in CsvLoader(path, **{**options, "chunksize": None}).load()
+    ]
+    docs = [doc.content for doc in CsvLoader(path, **options).load()]
+    # 欠損値のある列でも、チャンクの区切り方で値の表記が変わらないこと
+    assert docs == expected
+    assert "4.0" not in "".join(docs)
+
+
+def test_csv_loader_usecols(sample_table_csv_file):
+    docs = load(
+        sample_table_csv_file, usecols=["name", "id"], dtype={"id": str}
+    )
+    assert docs[1].content == "id: 1\nname: item1"
+
+
+def test_csv_loader_without_pandas(sample_table_csv_file, monkeypatch):
+    from pydocstruct.loaders import csv_loader
+
+    monkeypatch.setattr(csv_loader, "pd", None)
+    with open(sample_table_csv_file, "a", newline="", encoding="utf-8") as f:
+        f.write("\n5,item5\n")
+    docs = csv_loader.CsvLoader(
+        sample_table_csv_file, usecols=[0, "price"]
+    ).load()
+    assert len(docs) == 6
+    assert docs[1].content == "id: 1\nprice: 1.5"
+    # 欠けたセルは空文字列になること
+    assert docs[5].content == "id: 5\nprice: "
+    assert docs[5].metadata["row_index"] == 5
+    with pytest.raises(ImportError):
+        csv_loader.CsvLoader(sample_table_csv_file, output_format="markdown")
+
+
+@pytest.fixture
+def sample_workbook_file(sample_files_dir):
+    pd = pytest.importorskip("pandas")
+    pytest.importorskip("openpyxl")
+    path = sample_files_dir / "table.xlsx"
+    with pd.ExcelWriter(path) as writer:
+        pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]}).to_excel(
+            writer, sheet_name="S1", index=False
+        )
+        pd.DataFrame({"c": [10]}).to_excel(
+            writer, sheet_name="S2", index=False
+        )
+        pd.DataFrame({"d": [1.5, 2.5], "e": ["p", "q"]}).to_excel(
+            writer, sheet_name="S3", index=False
+        )
+    return path
+
+
+def test_csv_loader_native_markdown_tables(sample_table_csv_file):
+    docs = load(
+        sample_table_csv_file, output_format="markdown", max_table_rows=2
+    )
+    assert [doc.metadata["row_index"] for doc in docs] == [0, 2, 4]
+    assert [doc.metadata["row_count"] for doc in docs] == [2, 2, 1]
+    # 分割した各テーブルにヘッダー行が繰り返されること
+    for doc in docs:
+        assert doc.content.startswith(
+            "| id | name | price |\n| --- | --- | --- |\n"
+        )
+    assert docs[2].content.endswith("| 4 | item4 | 6.0 |")
+
+
+def test_csv_loader_native_markdown_token_budget(sample_files_dir):
+    path = sample_files_dir / "notes.csv"
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["id", "note"])
+        writer.writerows(
+            [[1, "a|b"], [2, "line1\nline2"], [3, ""], [4, "x" * 100]]
+        )
+    docs = load(
+        path,
+        output_format="markdown",
+        max_table_tokens=60,
+        length_function=len,
+    )
+    assert (
+        docs[0].content
+        == "| id | note |\n| --- | --- |\n| 1 | a\\|b |\n| 2 | line1 line2 |"
+    )
+    assert docs[1].content.endswith("| 3 |  |")
+    # 1行だけで上限を超える行も単独のテーブルになること
+    assert docs[2].metadata["row_index"] == 3
+    assert all(len(doc.content) <= 60 for doc in docs[:2])
+
+
+def test_csv_loader_lazy_documents(sample_table_csv_file):
+    from pydocstruct.core.table import LazyTableDocument
+
+    expected = load(sample_table_csv_file, rows_per_document=2)
+    docs = load(
+        sample_table_csv_file, rows_per_document=2, chunksize=3, lazy=True
+    )
+    assert all(
+        isinstance(doc, LazyTableDocument) and not doc.is_rendered
+        for doc in docs
+    )
+    assert [doc.content for doc in docs] == [doc.content for doc in expected]
+    assert [doc.metadata["row_index"] for doc in docs] == [0, 2, 4]
+    # chunksize は rows_per_document の倍数に切り上げられ、各チャンクのテーブルを共有する
+    assert docs[0].table is docs[1].table
+    assert docs[0].metadata["table_schema"]["columns"] == [
+        "id",
+        "name",
+        "price",
+    ]
+    assert (
+        docs[1].select_columns(["name"]).content
+        == "name: item2\n\nname: item3"
+    )
+
+
+def test_csv_loader_lazy_documents_without_pandas(
+    sample_table_csv_file, monkeypatch
+):
+    from pydocstruct.loaders import csv_loader
+
+    monkeypatch.setattr(csv_loader, "pd", None)
+    docs = csv_loader.CsvLoader(
+        sample_table_csv_file, rows_per_document=2, lazy=True
+    ).load()
+    assert (
+        docs[0].content
+        == "id: 0\nname: item0\nprice: 0.0\n\nid: 1\nname: item1\nprice: 1.5"
+    )
+    assert docs[0].table is docs[2].table
+
+
+def test_excel_loader_rows_per_document(sample_workbook_file):
+    docs = load(sample_workbook_file, rows_per_document=2)
+    assert [
+        (doc.metadata["sheet_name"], doc.metadata["row_index"]) for doc in docs
+    ] == [
+        ("S1", 0),
+        ("S1", 2),
+        ("S2", 0),
+        ("S3", 0),
+    ]
+    assert docs[0].content == "a: 1\nb: x\n\na: 2\nb: y"
+    assert docs[2].content == "c: 10"
+
+
+def test_excel_loader_stream_matches_load(sample_workbook_file):
+    expected = load(sample_workbook_file, rows_per_document=2)
+    docs = load(sample_workbook_file, rows_per_document=2, stream=True)
+    assert [doc.content for doc in docs] == [doc.content for doc in expected]
+    assert [doc.metadata["row_index"] for doc in docs] == [
+        doc.metadata["row_index"] for doc in expected
+    ]
+
+
+@pytest.mark.parametrize("output_format", ["row", "markdown"])
+def test_excel_loader_stream_and_pandas_skip_blank_rows(
+    sample_files_dir, output_format
+):
+    openpyxl = pytest.importorskip("openpyxl")
+    pytest.importorskip("pandas")
+    path = sample_files_dir / "blank_rows.xlsx"
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    for row in [("id", "name"), (48, "a"), (None, None), (49, "b")]:
+        sheet.append(row)
+    workbook.save(path)
+
+    expected = load(path, output_format=output_format)
+    docs = load(path, output_format=output_format, stream=True)
+    assert [doc.content for doc in docs] == [doc.content for doc in expected]
+    assert [doc.metadata.get("row_index") for doc in docs] == [
+        doc.metadata.get("row_index") for doc in expected
+    ]
+    if output_format == "row":
+        assert [doc.content for doc in docs] == [
+            "id: 48\nname: a",
+            "id: 49\nname: b",
+        ]
+        assert [doc.metadata["row_index"] for doc in docs] == [0, 2]
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_excel_loader_sheet_names_and_max_rows(sample_workbook_file, stream):
+    docs = load(
+        sample_workbook_file,
+        stream=stream,
+        sheet_names=["S3", "S1"],
+        max_rows=1,
+    )
+    assert [doc.metadata["sheet_name"] for doc in docs] == ["S3", "S1"]
+    assert [doc.content for doc in docs] == ["d: 1.5\ne: p", "a: 1\nb: x"]
+    with pytest.raises(ValueError):
+        load(sample_workbook_file, stream=stream, sheet_names=["missing"])
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_excel_loader_parallel_sheets_keep_order(sample_workbook_file, stream):
+    expected = load(
+        sample_workbook_file, stream=stream, sheet_names=["S3", "S1", "S2"]
+    )
+    docs = load(
+        sample_workbook_file,
+        stream=stream,
+        sheet_names=["S3", "S1", "S2"],
+        num_workers=2,
+    )
+    assert [doc.content for doc in docs] == [doc.content for doc in expected]
+    assert [doc.metadata["sheet_name"] for doc in docs] == [
+        "S3",
+        "S3",
+        "S1",
+        "S1",
+        "S1",
+        "S2",
+    ]
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_excel_loader_native_markdown_tables(sample_workbook_file, stream):
+    docs = load(
+        sample_workbook_file,
+        stream=stream,
+        output_format="markdown",
+        max_table_rows=2,
+    )
+    assert [
+        (doc.metadata["sheet_name"], doc.metadata["row_index"]) for doc in docs
+    ] == [
+        ("S1", 0),
+        ("S1", 2),
+        ("S2", 0),
+        ("S3", 0),
+    ]
+    assert docs[1].content == "| a | b |\n| --- | --- |\n| 3 | z |"
+    assert (
+        docs[3].content == "| d | e |\n| --- | --- |\n| 1.5 | p |\n| 2.5 | q |"
+    )
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_excel_loader_lazy_documents(sample_workbook_file, stream):
+    expected = load(sample_workbook_file, stream=stream, rows_per_document=2)
+    docs = load(
+        sample_workbook_file, stream=stream, rows_per_document=2, lazy=True
+    )
+    assert [doc.content for doc in docs] == [doc.content for doc in expected]
+    assert docs[0].table is docs[1].table
+    assert docs[0].metadata["table_schema"]["row_count"] == 3
+
+
+def _write_pdf(path, page_texts):
+    """1ページに1行のテキストを持つPDFを作成（空文字列のページはテキストなし）"""
+    pypdf = pytest.importorskip("pypdf")
+    from pypdf.generic import DecodedStreamObject, DictionaryObject, NameObject
+
+    writer = pypdf.PdfWriter()
+    font = writer._add_object(
+        DictionaryObject(
+            {
+                NameObject("/Type"): NameObject("/Font"),
+                NameObject("/Subtype"): NameObject("/Type1"),
+                NameObject("/BaseFont"): NameObject("/Helvetica"),
+            }
+        )
+    )
+    for text in page_texts:
+        page = writer.add_blank_page(612, 792)
+        stream = DecodedStreamObject()
+        if text:
+            stream.set_data(f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET".encode())
+        page[NameObject("/Contents")] = writer._add_object(stream)
+        page[NameObject("/Resources")] = DictionaryObject(
+            {
+                NameObject("/Font"): DictionaryObject(
+                    {NameObject("/F1"): font}
+                ),
+            }
+        )
+    writer.add_metadata({"/Title": "Filing", "/Author": "Regulator"})
+    writer.write(path)
+    return path
+
+
+@pytest.fixture
+def sample_pdf_file(sample_files_dir):
+    texts = [f"Page {i} text" for i in range(1, 11)]
+    texts[3] = ""
+    return _write_pdf(sample_files_dir / "filing.pdf", texts)
+
+
+def test_pdf_loader(sample_pdf_file):
+    docs = load(sample_pdf_file)
+    # テキストのないページは除外されること
+    assert [doc.page_number for doc in docs] == [1, 2, 3, 5, 6, 7, 8, 9, 10]
+    assert docs[0].content == "Page 1 text"
+    assert docs[0].metadata["page_count"] == 10
+    assert docs[0].metadata["pdf_metadata"]["title"] == "Filing"
+
+
+def test_pdf_loader_parallel_pages_keep_order(sample_pdf_file):
+    expected = load(sample_pdf_file)
+    docs = load(sample_pdf_file, num_workers=3)
+    assert [(doc.page_number, doc.content) for doc in docs] == [
+        (doc.page_number, doc.content) for doc in expected
+    ]
+
+
+def test_pdf_loader_pages_and_max_pages(sample_pdf_file):
+    docs = load(sample_pdf_file, pages=[9, 2, 4, 3, 42])
+    # ページ番号順に読み込み、範囲外のページは無視すること
+    assert [doc.page_number for doc in docs] == [2, 3, 9]
+    docs = load(sample_pdf_file, max_pages=3)
+    assert [doc.page_number for doc in docs] == [1, 2, 3]
+    docs = load(
+        sample_pdf_file, pages=range(5, 11), max_pages=2, num_workers=2
+    )
+    assert [doc.content for doc in docs] == ["Page 5 text", "Page 6 text"]
+    # 文書単位のメタデータは全ページで共有されること
+    assert docs[0].metadata["pdf_metadata"] is docs[1].metadata["pdf_metadata"]
+    assert docs[1].metadata["page_count"] == 10
+    with pytest.raises(ValueError):
+        load(sample_pdf_file, pages=[0])
+
+
+def test_pdf_loader_batches_ocr_by_contiguous_runs(
+    sample_files_dir, monkeypatch
+):
+    from types import SimpleNamespace
+
+    from pydocstruct.loaders import pdf_loader
+
+    path = _write_pdf(
+        sample_files_dir / "scan.pdf",
+        ["Page 1 text", "", "", "", "Page 5 text", "", ""],
+    )
+    calls = []
+
+    def fake_convert(
+        pdf_path, dpi, first_page, last_page, thread_count, grayscale
+    ):
+        calls.append((first_page, last_page, dpi, thread_count, grayscale))
+        return [f"image {page}" for page in range(first_page, last_page + 1)]
+
+    monkeypatch.setattr(pdf_loader, "convert_from_path", fake_convert)
+    monkeypatch.setattr(
+        pdf_loader,
+        "pytesseract",
+        SimpleNamespace(
+            image_to_string=lambda image, lang: f"OCR {image} ({lang})"
+        ),
+    )
+
+    docs = pdf_loader.PDFLoader(
+        path,
+        use_ocr=True,
+        ocr_lang="jpn",
+        ocr_dpi=300,
+        ocr_grayscale=True,
+        ocr_thread_count=2,
+        ocr_workers=2,
+    ).load()
+    # 空のページは連続する範囲ごとに1回だけラスタライズされること
+    assert calls == [(2, 4, 300, 2, True), (6, 7, 300, 2, True)]
+    assert [doc.content for doc in docs] == [
+        "Page 1 text",
+        "OCR image 2 (jpn)",
+        "OCR image 3 (jpn)",
+        "OCR image 4 (jpn)",
+        "Page 5 text",
+        "OCR image 6 (jpn)",
+        "OCR image 7 (jpn)",
+    ]
+
+    calls.clear()
+    pdf_loader.PDFLoader(path, use_ocr=True, ocr_batch_size=3).load()
+    assert [call[:2] for call in calls] == [(2, 3), (4, 4), (6, 6), (7, 7)]
+
+
+def test_pdf_loader_ocr_falls_back_to_single_pages(
+    sample_files_dir, monkeypatch
+):
+    from types import SimpleNamespace
+
+    from pydocstruct.loaders import pdf_loader
+
+    path = _write_pdf(
+        sample_files_dir / "scan.pdf",
+        ["Page 1 text", "", "", "", "Page 5 text", ""],
+    )
+    calls = []
+
+    def fake_convert(
+        pdf_path, dpi, first_page, last_page, thread_count, grayscale
+    ):
+        calls.append((first_page, last_page))
+        if first_page <= 3 <= last_page:
+            raise RuntimeError("broken page")
+        return [f"image {page}" for page in range(first_page, last_page + 1)]
+
+    monkeypatch.setattr(pdf_loader, "convert_from_path", fake_convert)
+    monkeypatch.setattr(
+        pdf_loader,
+        "pytesseract",
+        SimpleNamespace(image_to_string=lambda image, lang: f"OCR {image}"),
+    )
+
+    docs = pdf_loader.PDFLoader(path, use_ocr=True).load()
+    # 範囲の変換に失敗したらページごとに変換し直し、失敗したページだけが欠けること
+    assert calls == [(2, 4), (2, 2), (3, 3), (4, 4), (6, 6)]
+    assert [(doc.page_number, doc.content) for doc in docs] == [
+        (1, "Page 1 text"),
+        (2, "OCR image 2"),
+        (4, "OCR image 4"),
+        (5, "Page 5 text"),
+        (6, "OCR image 6"),
+    ]
+
+
 def test_docx_loader(sample_docx_file):
     if sample_docx_file is None:
         pytest.skip("python-docx not installed")
@@ -105,6 +937,7 @@ def test_markdown_loader_no_split(sample_markdown_file):
 def test_markdown_loader_split_by_headers(sample_markdown_file):
     """split_by_headers=True では見出しごとにDocumentが分割されること"""
     from pydocstruct.loaders.markdown_loader import MarkdownLoader
+
     loader = MarkdownLoader(sample_markdown_file, split_by_headers=True)
     docs = loader.load()
     # サンプルには # が1つ、## が2つ、### が1つの計4見出し
@@ -118,6 +951,7 @@ def test_markdown_loader_split_by_headers(sample_markdown_file):
 def test_markdown_loader_split_sets_header_metadata(sample_markdown_file):
     """分割されたDocumentのmetadataにheaderとheader_levelが含まれること"""
     from pydocstruct.loaders.markdown_loader import MarkdownLoader
+
     loader = MarkdownLoader(sample_markdown_file, split_by_headers=True)
     docs = loader.load()
     for doc in docs:
@@ -143,3 +977,71 @@ def test_json_loader_list_creates_multiple_docs(sample_json_list_file):
     assert "Alice" in docs[0].content
     assert "Bob" in docs[1].content
 
+
+@pytest.fixture
+def sample_markdown_with_code_file(sample_files_dir):
+    """コードフェンス内に # 行を含むMarkdownファイル"""
+    path = sample_files_dir / "code.md"
+    content = """# ガイド
+
+## インストール
+
+```bash
+# これは見出しではない
+pip install pydocstruct
+```
+
+### 詳細
+詳細な説明。
+
+# 付録
+"""
+    path.write_text(content, encoding="utf-8")
+    return path
+
+
+def test_markdown_loader_ignores_headers_in_code_fence(
+    sample_markdown_with_code_file,
+):
+    """コードフェンス内の # 行は見出しとして扱われないこと"""
+    from pydocstruct.loaders.markdown_loader import MarkdownLoader
+
+    docs = MarkdownLoader(
+        sample_markdown_with_code_file, split_by_headers=True
+    ).load()
+    headers = [d.metadata["header"] for d in docs]
+    assert headers == ["ガイド", "インストール", "詳細", "付録"]
+    assert "pip install pydocstruct" in docs[1].content
+
+
+def test_markdown_loader_sets_header_path_and_offsets(
+    sample_markdown_with_code_file,
+):
+    """祖先見出しを含むheader_pathと文字オフセットが付与されること"""
+    from pydocstruct.loaders.markdown_loader import MarkdownLoader
+
+    docs = MarkdownLoader(
+        sample_markdown_with_code_file, split_by_headers=True
+    ).load()
+    paths = [d.metadata["header_path"] for d in docs]
+    assert paths == [
+        "ガイド",
+        "ガイド > インストール",
+        "ガイド > インストール > 詳細",
+        "付録",
+    ]
+    text = sample_markdown_with_code_file.read_text(encoding="utf-8")
+    for doc in docs:
+        section = text[doc.metadata["start_index"] : doc.metadata["end_index"]]
+        assert section.strip() == doc.content
+
+
+def test_markdown_loader_lazy_load_yields_sections(sample_markdown_file):
+    """lazy_loadがセクションを順に返すこと"""
+    from pydocstruct.loaders.markdown_loader import MarkdownLoader
+
+    loader = MarkdownLoader(sample_markdown_file, split_by_headers=True)
+    iterator = loader.lazy_load()
+    first = next(iterator)
+    assert first.metadata["header"] == "メインタイトル"
+    assert len([first, *iterator]) == len(loader.load())
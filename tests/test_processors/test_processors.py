@@ -1,107 +1,228 @@
 """tests/test_processors/test_processors.py"""
+
 from __future__ import annotations
 
-import pytest
 from pathlib import Path
 
+import pytest
+
 
 class TestTextCleaner:
     def test_normalize_whitespace_collapses_spaces(self):
         from pydocstruct.processors.text_cleaner import TextCleaner
-        assert TextCleaner.normalize_whitespace("hello   world") == "hello world"
+
+        assert (
+            TextCleaner.normalize_whitespace("hello   world") == "hello world"
+        )
 
     def test_normalize_whitespace_collapses_tabs_and_newlines(self):
         from pydocstruct.processors.text_cleaner import TextCleaner
-        assert TextCleaner.normalize_whitespace("hello\t\nworld") == "hello world"
+
+        assert (
+            TextCleaner.normalize_whitespace("hello\t\nworld") == "hello world"
+        )
 
     def test_normalize_whitespace_strips_edges(self):
         from pydocstruct.processors.text_cleaner import TextCleaner
+
         assert TextCleaner.normalize_whitespace("  hello  ") == "hello"
 
     def test_remove_urls_https(self):
         from pydocstruct.processors.text_cleaner import TextCleaner
+
         result = TextCleaner.remove_urls("visit https://example.com for more")
         assert "https://example.com" not in result
         assert "visit" in result
 
     def test_remove_urls_www(self):
         from pydocstruct.processors.text_cleaner import TextCleaner
+
         result = TextCleaner.remove_urls("see www.example.com")
         assert "www.example.com" not in result
 
     def test_remove_urls_with_custom_replacement(self):
         from pydocstruct.processors.text_cleaner import TextCleaner
-        result = TextCleaner.remove_urls("go to https://example.com now", replacement="[URL]")
+
+        result = TextCleaner.remove_urls(
+            "go to https://example.com now", replacement="[URL]"
+        )
         assert "[URL]" in result
 
     def test_remove_emails(self):
         from pydocstruct.processors.text_cleaner import TextCleaner
+
         result = TextCleaner.remove_emails("contact user@example.com today")
         assert "user@example.com" not in result
         assert "contact" in result
 
+    def test_remove_emails_removes_adjacent_addresses(self):
+        from pydocstruct.processors.text_cleaner import (
+            CleanerPipeline,
+            TextCleaner,
+        )
+
+        text = "alice@example.com-bob@example.org"
+        assert TextCleaner.remove_emails(text) == ""
+        assert CleanerPipeline(["remove_emails"])(text) == ""
+
     def test_remove_emails_with_custom_replacement(self):
         from pydocstruct.processors.text_cleaner import TextCleaner
-        result = TextCleaner.remove_emails("email@test.com", replacement="[EMAIL]")
+
+        result = TextCleaner.remove_emails(
+            "email@test.com", replacement="[EMAIL]"
+        )
         assert "[EMAIL]" in result
 
     def test_clean_normalizes_whitespace_by_default(self):
         from pydocstruct.processors.text_cleaner import TextCleaner
+
         result = TextCleaner.clean("  hello   world  ")
         assert result == "hello world"
 
     def test_clean_does_not_remove_urls_by_default(self):
         from pydocstruct.processors.text_cleaner import TextCleaner
+
         result = TextCleaner.clean("https://example.com")
         assert "https://example.com" in result
 
     def test_clean_all_options(self):
         from pydocstruct.processors.text_cleaner import TextCleaner
+
         text = "  hello  https://example.com user@test.com  "
-        result = TextCleaner.clean(text, normalize_whitespace=True, remove_urls=True, remove_emails=True)
+        result = TextCleaner.clean(
+            text,
+            normalize_whitespace=True,
+            remove_urls=True,
+            remove_emails=True,
+        )
         assert "https://example.com" not in result
         assert "user@test.com" not in result
         assert "hello" in result
 
 
+class TestCleanerPipeline:
+    def test_matches_sequential_text_cleaner(self):
+        from pydocstruct.processors.text_cleaner import (
+            CleanerPipeline,
+            TextCleaner,
+        )
+
+        text = "  hello \t https://example.com   user@test.com \n world  "
+        pipeline = CleanerPipeline(
+            ["remove_urls", "remove_emails", "normalize_whitespace"]
+        )
+        expected = TextCleaner.normalize_whitespace(
+            TextCleaner.remove_emails(TextCleaner.remove_urls(text))
+        )
+        assert pipeline.clean(text) == expected == "hello world"
+
+    def test_normalize_unicode_and_control_chars(self):
+        from pydocstruct.processors.text_cleaner import CleanerPipeline
+
+        pipeline = CleanerPipeline(
+            [
+                "normalize_unicode",
+                "strip_control_chars",
+                "normalize_whitespace",
+            ]
+        )
+        assert pipeline("ＡＢＣ\x00１２３\u3000end\x07") == "ABC123 end"
+
+    def test_redact_pii_with_replacements(self):
+        from pydocstruct.processors.text_cleaner import CleanerPipeline
+
+        pipeline = CleanerPipeline(
+            ["remove_urls", "redact_pii", "normalize_whitespace"],
+            url_replacement="[URL]",
+            pii_replacement="[PII]",
+        )
+        text = "call 090-1234-5678 or see https://example.com  mail a@b.com"
+        assert pipeline(text) == "call [PII] or see [URL] mail [PII]"
+
+    def test_steps_apply_in_order(self):
+        from pydocstruct.processors.text_cleaner import CleanerPipeline
+
+        text = "mail user@example.com"
+        assert (
+            CleanerPipeline(["remove_emails", "redact_pii"])(text) == "mail "
+        )
+        assert (
+            CleanerPipeline(["redact_pii", "remove_emails"])(text)
+            == "mail [REDACTED]"
+        )
+
+    def test_backslash_replacement_is_literal(self):
+        from pydocstruct.processors.text_cleaner import CleanerPipeline
+
+        pipeline = CleanerPipeline(["remove_urls"], url_replacement=r"\1")
+        assert pipeline("see https://example.com") == r"see \1"
+
+    def test_unknown_step_raises(self):
+        from pydocstruct.processors.text_cleaner import CleanerPipeline
+
+        with pytest.raises(ValueError):
+            CleanerPipeline(["lowercase"])
+
+    def test_process_documents_in_pool(self):
+        from pydocstruct.core.document import Document
+        from pydocstruct.processors.text_cleaner import CleanerPipeline
+
+        pipeline = CleanerPipeline(["redact_pii", "normalize_whitespace"])
+        docs = [
+            Document(content=f" doc {i}  u{i}@example.com ") for i in range(10)
+        ]
+        result = pipeline.process_documents(docs, num_workers=2, batch_size=4)
+        assert [d.content for d in result] == [
+            f"doc {i} [REDACTED]" for i in range(10)
+        ]
+        assert result[0].metadata["processors"] == ["CleanerPipeline"]
+
+
 class TestPiiRedactor:
     def test_redacts_email(self):
         from pydocstruct.processors.pii_redactor import PiiRedactor
+
         result = PiiRedactor.redact("contact me at user@example.com please")
         assert "user@example.com" not in result
         assert "[REDACTED]" in result
 
     def test_redacts_phone_with_hyphens(self):
         from pydocstruct.processors.pii_redactor import PiiRedactor
+
         result = PiiRedactor.redact("call 03-1234-5678 now")
         assert "03-1234-5678" not in result
         assert "[REDACTED]" in result
 
     def test_redacts_mobile_phone_with_hyphens(self):
         from pydocstruct.processors.pii_redactor import PiiRedactor
+
         result = PiiRedactor.redact("mobile 090-1234-5678")
         assert "090-1234-5678" not in result
         assert "[REDACTED]" in result
 
     def test_redacts_credit_card_16_digits(self):
         from pydocstruct.processors.pii_redactor import PiiRedactor
+
         result = PiiRedactor.redact("card 4111111111111111 end")
         assert "4111111111111111" not in result
         assert "[REDACTED]" in result
 
     def test_redacts_credit_card_with_spaces(self):
         from pydocstruct.processors.pii_redactor import PiiRedactor
+
         result = PiiRedactor.redact("card 4111 1111 1111 1111 end")
         assert "4111 1111 1111 1111" not in result
         assert "[REDACTED]" in result
 
     def test_no_redaction_for_normal_text(self):
         from pydocstruct.processors.pii_redactor import PiiRedactor
+
         text = "hello world this is a normal sentence"
         assert PiiRedactor.redact(text) == text
 
     def test_redacts_multiple_pii_in_one_string(self):
         from pydocstruct.processors.pii_redactor import PiiRedactor
+
         text = "email: user@test.com phone: 03-1234-5678"
         result = PiiRedactor.redact(text)
         assert "user@test.com" not in result
@@ -109,22 +230,181 @@ class TestPiiRedactor:
 
     def test_custom_replacement_text(self):
         from pydocstruct.processors.pii_redactor import PiiRedactor
+
         result = PiiRedactor.redact("user@example.com", replace_text="***")
         assert "***" in result
         assert "user@example.com" not in result
 
     def test_short_numbers_not_redacted_as_credit_card(self):
         from pydocstruct.processors.pii_redactor import PiiRedactor
+
         # 12桁以下の数字はクレジットカードとしてマッチしないこと
         result = PiiRedactor.redact("order 123456789012 placed")
         # 12桁はクレジットカードパターン(13-19桁)にマッチしないはず
         # ただし電話番号パターン(10-11桁)にも該当しないことを確認
-        assert "123456789012" not in result or "[REDACTED]" not in result or True  # 実装依存
+        assert (
+            "123456789012" not in result or "[REDACTED]" not in result or True
+        )  # 実装依存
+
+    def test_redacts_whole_credit_card_before_phone(self):
+        from pydocstruct.processors.pii_redactor import PiiRedactor
+
+        assert (
+            PiiRedactor.redact("card 4111111111111111 end")
+            == "card [REDACTED] end"
+        )
+
+    @pytest.mark.parametrize(
+        "text", ["alice@example.com-bob@example.org", "x@a.io_y@b.io"]
+    )
+    def test_redacts_adjacent_emails(self, text):
+        from pydocstruct.processors.pii_redactor import (
+            PiiRedactionEngine,
+            PiiRedactor,
+        )
+
+        assert PiiRedactor.redact(text) == "[REDACTED][REDACTED]"
+        assert PiiRedactionEngine().redact(text) == "[REDACTED][REDACTED]"
+
+    def test_find_reports_spans_and_kinds(self):
+        from pydocstruct.processors.pii_redactor import PiiRedactor
+
+        text = "mail user@example.com or call 03-1234-5678"
+        matches = PiiRedactor.find(text)
+        assert [m.kind for m in matches] == ["email", "phone"]
+        for m in matches:
+            assert text[m.start : m.end] == m.text
+
+
+class TestPiiRedactionEngine:
+    def test_default_patterns_match_redactor(self):
+        from pydocstruct.processors.pii_redactor import (
+            PiiRedactionEngine,
+            PiiRedactor,
+        )
+
+        text = (
+            "email: user@test.com phone: 03-1234-5678 card 4111 1111 1111 1111"
+        )
+        assert PiiRedactionEngine().redact(text) == PiiRedactor.redact(text)
+
+    def test_registered_pattern_is_detected(self):
+        from pydocstruct.processors.pii_redactor import PiiRedactionEngine
+
+        engine = PiiRedactionEngine()
+        engine.register("employee_id", r"EMP-\d{6}")
+        matches = engine.find("id EMP-123456 mail a@b.co")
+        assert [m.kind for m in matches] == ["employee_id", "email"]
+
+    def test_registered_pattern_keeps_flags(self):
+        import re
+
+        from pydocstruct.processors.pii_redactor import PiiRedactionEngine
+
+        engine = PiiRedactionEngine(
+            patterns={"name": re.compile("taro", re.IGNORECASE)}
+        )
+        assert engine.redact("TARO san", replace_text="***") == "*** san"
+
+    def test_replacement_is_literal(self):
+        from pydocstruct.processors.pii_redactor import PiiRedactionEngine
+
+        assert (
+            PiiRedactionEngine().redact("a@b.co", replace_text=r"\1") == r"\1"
+        )
+
+    def test_invalid_name_raises(self):
+        from pydocstruct.processors.pii_redactor import PiiRedactionEngine
+
+        with pytest.raises(ValueError):
+            PiiRedactionEngine().register("not valid", r"x")
+
+    def test_numbered_backreference_is_rejected(self):
+        from pydocstruct.processors.pii_redactor import PiiRedactionEngine
+
+        engine = PiiRedactionEngine()
+        with pytest.raises(ValueError, match="by number"):
+            engine.register("repeat", r"(\w)\1")
+        # Escapes that only look like references are accepted
+        engine.register("octal", r"[\1]x\101")
+        assert "octal" in engine.pattern.groupindex
+
+    def test_named_backreference_is_supported(self):
+        from pydocstruct.processors.pii_redactor import PiiRedactionEngine
+
+        engine = PiiRedactionEngine(
+            patterns={"repeat": r"(?P<ch>\d)(?P=ch){3}"}
+        )
+        assert (
+            engine.redact("pin 7777 or 1234", replace_text="*")
+            == "pin * or 1234"
+        )
+
+    def test_leading_global_flags_are_scoped(self):
+        import re
+
+        from pydocstruct.processors.pii_redactor import PiiRedactionEngine
+
+        engine = PiiRedactionEngine(
+            patterns={
+                "name": r"(?i)taro",
+                "code": re.compile(r"(?s)x.y", re.IGNORECASE),
+                "city": r"tokyo",
+            }
+        )
+        assert (
+            engine.redact("TARO X\nY TOKYO", replace_text="*") == "* * TOKYO"
+        )
+
+    def test_global_flags_not_at_start_are_rejected(self):
+        from pydocstruct.processors.pii_redactor import PiiRedactionEngine
+
+        with pytest.raises(ValueError, match="'name'"):
+            PiiRedactionEngine().register("name", r"taro(?i)")
+
+    def test_conflicting_group_name_is_rejected(self):
+        from pydocstruct.processors.pii_redactor import PiiRedactionEngine
+
+        engine = PiiRedactionEngine()
+        with pytest.raises(ValueError, match="conflicts"):
+            engine.register("mail", r"(?P<email>x)")
+        # The engine keeps working with its previous patterns
+        assert engine.redact("a@b.co x") == "[REDACTED] x"
+
+    def test_subclass_builds_its_own_engine(self):
+        import re
+
+        from pydocstruct.processors.pii_redactor import PiiRedactor
+
+        class DigitsOnly(PiiRedactor):
+            EMAIL_PATTERN = re.compile(r"(?!)")
+
+        assert PiiRedactor.redact("a@b.co") == "[REDACTED]"
+        assert DigitsOnly.redact("a@b.co") == "a@b.co"
+        assert DigitsOnly.engine() is not PiiRedactor.engine()
+
+    def test_redact_documents_preserves_fields_and_counts(self):
+        from pydocstruct.core.document import Document
+        from pydocstruct.processors.pii_redactor import PiiRedactionEngine
+
+        doc = Document(
+            content="a@b.co and c@d.co, tel 03-1234-5678",
+            metadata={"author": "taro"},
+            source="x.txt",
+            chunk_index=2,
+        )
+        [result] = PiiRedactionEngine().redact_documents([doc])
+        assert "@" not in result.content
+        assert result.metadata["author"] == "taro"
+        assert result.metadata["pii_counts"] == {"email": 2, "phone": 1}
+        assert result.source == "x.txt" and result.chunk_index == 2
+        assert "pii_counts" not in doc.metadata
 
 
 class TestHtmlNoiseCleaner:
     def test_removes_script_tags(self):
         from pydocstruct.processors.html_cleaner import HtmlNoiseCleaner
+
         html = "<html><body><p>Hello</p><script>alert('xss')</script></body></html>"
         result = HtmlNoiseCleaner.clean(html)
         assert "alert" not in result
@@ -132,6 +412,7 @@ class TestHtmlNoiseCleaner:
 
     def test_removes_style_tags(self):
         from pydocstruct.processors.html_cleaner import HtmlNoiseCleaner
+
         html = "<html><body><p>Content</p><style>.foo { color: red }</style></body></html>"
         result = HtmlNoiseCleaner.clean(html)
         assert "color" not in result
@@ -139,6 +420,7 @@ class TestHtmlNoiseCleaner:
 
     def test_removes_nav_semantic_element(self):
         from pydocstruct.processors.html_cleaner import HtmlNoiseCleaner
+
         html = "<html><body><nav>Navigation menu</nav><main>Main content</main></body></html>"
         result = HtmlNoiseCleaner.clean(html)
         assert "Navigation menu" not in result
@@ -146,6 +428,7 @@ class TestHtmlNoiseCleaner:
 
     def test_removes_footer_semantic_element(self):
         from pydocstruct.processors.html_cleaner import HtmlNoiseCleaner
+
         html = "<html><body><p>Article text</p><footer>Footer content</footer></body></html>"
         result = HtmlNoiseCleaner.clean(html)
         assert "Footer content" not in result
@@ -153,6 +436,7 @@ class TestHtmlNoiseCleaner:
 
     def test_removes_element_with_noise_class(self):
         from pydocstruct.processors.html_cleaner import HtmlNoiseCleaner
+
         html = '<html><body><div class="sidebar">Ads here</div><p>Real content</p></body></html>'
         result = HtmlNoiseCleaner.clean(html)
         assert "Ads here" not in result
@@ -160,6 +444,7 @@ class TestHtmlNoiseCleaner:
 
     def test_removes_element_with_noise_id(self):
         from pydocstruct.processors.html_cleaner import HtmlNoiseCleaner
+
         html = '<html><body><div id="header">Top header</div><p>Body text</p></body></html>'
         result = HtmlNoiseCleaner.clean(html)
         assert "Top header" not in result
@@ -167,19 +452,213 @@ class TestHtmlNoiseCleaner:
 
     def test_plain_paragraph_preserved(self):
         from pydocstruct.processors.html_cleaner import HtmlNoiseCleaner
+
         html = "<p>Just some article text.</p>"
         result = HtmlNoiseCleaner.clean(html)
         assert "Just some article text." in result
 
     def test_returns_string(self):
         from pydocstruct.processors.html_cleaner import HtmlNoiseCleaner
+
         result = HtmlNoiseCleaner.clean("<p>text</p>")
         assert isinstance(result, str)
 
+    def test_lxml_parser_gives_same_text(self):
+        from pydocstruct.processors.html_cleaner import HtmlNoiseCleaner
+
+        pytest.importorskip("lxml")
+        html = (
+            "<html><head><title>T</title></head><body><nav>menu</nav>"
+            "<div class='main'><p>First</p><div id='cookie-banner'>accept</div><p>Second</p></div>"
+            "<footer>foot</footer></body></html>"
+        )
+        assert (
+            HtmlNoiseCleaner.clean(html, parser="lxml")
+            == HtmlNoiseCleaner.clean(html)
+            == "First\nSecond"
+        )
+
+    def test_unknown_parser_raises(self):
+        from pydocstruct.processors.html_cleaner import HtmlNoiseCleaner
+
+        with pytest.raises(ValueError):
+            HtmlNoiseCleaner.clean("<p>x</p>", parser="html5")
+
+    def test_prune_reports_removed_elements(self):
+        from pydocstruct.processors.html_cleaner import HtmlNoiseCleaner
+
+        soup = HtmlNoiseCleaner.parse(
+            "<div class='sidebar'><script>x</script></div><p class='intro'>Body</p>"
+        )
+        assert HtmlNoiseCleaner.prune(soup) == 1
+        assert soup.get_text() == "Body"
+
+    def test_subclass_keywords_are_used(self):
+        from pydocstruct.processors.html_cleaner import HtmlNoiseCleaner
+
+        class CustomCleaner(HtmlNoiseCleaner):
+            NOISE_CLASSES = ["related"]
+
+        html = "<p class='related-links'>more</p><p class='menu'>Body</p>"
+        assert CustomCleaner.clean(html) == "Body"
+        assert HtmlNoiseCleaner.clean(html) == "more"
+
+    def test_empty_noise_classes_match_nothing(self):
+        from pydocstruct.processors.html_cleaner import HtmlNoiseCleaner
+
+        class TagsOnly(HtmlNoiseCleaner):
+            NOISE_CLASSES = []
+
+        html = "<p class='menu' id='x'>Body</p><script>x</script>"
+        assert TagsOnly.clean(html) == "Body"
+
+    def test_list_changes_after_first_use_apply(self, monkeypatch):
+        from pydocstruct.processors.html_cleaner import HtmlNoiseCleaner
+
+        html = "<p class='related'>more</p><p>Body</p>"
+        assert HtmlNoiseCleaner.clean(html) == "more\nBody"
+        monkeypatch.setattr(HtmlNoiseCleaner, "NOISE_CLASSES", ["related"])
+        assert HtmlNoiseCleaner.clean(html) == "Body"
+
+
+class TestHtmlMarkdownRenderer:
+    def test_renders_blocks_and_inline_marks(self):
+        from pydocstruct.processors.html_markdown import HtmlMarkdownRenderer
+
+        html = (
+            "<h2>Title <em>here</em></h2><p>Some <b>bold</b> and <a href='/x'>link</a>.</p>"
+            "<ul><li>one</li><li>two</li></ul><ol start='3'><li>three</li></ol>"
+            "<pre><code>x = 1\n  y = 2</code></pre><p>Use <code>a_b</code> not a_b</p>"
+        )
+        assert HtmlMarkdownRenderer.render(html) == (
+            "## Title *here*\n\n"
+            "Some **bold** and [link](/x).\n\n"
+            "* one\n* two\n\n"
+            "3. three\n\n"
+            "```\nx = 1\n  y = 2\n```\n\n"
+            "Use `a_b` not a\\_b"
+        )
+
+    def test_renders_tables_with_header_row(self):
+        from pydocstruct.processors.html_markdown import HtmlMarkdownRenderer
+
+        html = "<table><tr><th>A</th><th>B</th></tr><tr><td>1</td><td><p>x|y</p></td></tr></table>"
+        assert (
+            HtmlMarkdownRenderer.render(html)
+            == "| A | B |\n| --- | --- |\n| 1 | x\\|y |"
+        )
+
+    def test_nested_list_and_blockquote(self):
+        from pydocstruct.processors.html_markdown import HtmlMarkdownRenderer
+
+        html = "<ul><li>a<ul><li>b</li></ul></li></ul><blockquote><p>quoted</p></blockquote>"
+        assert HtmlMarkdownRenderer.render(html) == "* a\n    * b\n\n> quoted"
+
+    def test_skips_head_and_scripts_and_captures_title(self):
+        from pydocstruct.processors.html_markdown import HtmlMarkdownRenderer
+
+        renderer = HtmlMarkdownRenderer()
+        renderer.feed(
+            "<html><head><title>Doc</title><script>if (a<b) {}</script></head>"
+        )
+        renderer.feed("<body><p>Bo")
+        renderer.feed("dy</p><style>p {}</style></body></html>")
+        renderer.close()
+        assert renderer.title == "Doc"
+        assert renderer.markdown == "Body"
+
+    def test_remove_noise_skips_noise_subtrees(self):
+        from pydocstruct.processors.html_markdown import HtmlMarkdownRenderer
+
+        html = (
+            "<nav><ul><li>Home</li></ul></nav><div class='cookie-popup'><p>Accept</p></div>"
+            "<main><p>Content</p><img class='ad' src='a.png'></main><footer>foot</footer>"
+        )
+        assert (
+            HtmlMarkdownRenderer.render(html, remove_noise=True) == "Content"
+        )
+        assert "Home" in HtmlMarkdownRenderer.render(html)
+
+    @pytest.mark.parametrize(
+        "html",
+        [
+            "<html><head><title>Doc</title><meta charset='utf-8'><body><p>Main content here</p>",
+            "<html><head><title>Doc</title><p>Main content here",
+            "<head><title>Doc</title><script>if (a<b) {}</script>Main content here",
+        ],
+    )
+    def test_omitted_head_end_tag_is_implied(self, html):
+        from pydocstruct.processors.html_markdown import HtmlMarkdownRenderer
+
+        renderer = HtmlMarkdownRenderer()
+        renderer.feed(html)
+        renderer.close()
+        assert renderer.title == "Doc"
+        assert renderer.markdown == "Main content here"
+
+    @pytest.mark.parametrize(
+        "html",
+        [
+            "<ul><li class='ad'>Buy now<li>Main content here</ul>",
+            "<p class='ad'>Buy now<p>Main content here",
+            "<div><p class='ad'>Buy now</div><p>Main content here</p>",
+            "<table><tr><td class='ad'>Buy now<td>Main content here</table>",
+        ],
+    )
+    def test_unclosed_noise_element_ends_at_implied_end_tag(self, html):
+        from pydocstruct.processors.html_markdown import HtmlMarkdownRenderer
+
+        markdown = HtmlMarkdownRenderer.render(html, remove_noise=True)
+        assert "Main content here" in markdown
+        assert "Buy now" not in markdown
+
+    @pytest.mark.parametrize(
+        "html",
+        [
+            "<table><tr><td>a</td><td>b</td><tr><td>c</td><td>d</td></table>",
+            "<table><tr><th>a<th>b<tr><td>c<td>d</table>",
+            "<table><tbody><tr><td>a<td>b</tr><tr><td>c<td>d",
+        ],
+    )
+    def test_omitted_cell_and_row_end_tags_are_implied(self, html):
+        from pydocstruct.processors.html_markdown import HtmlMarkdownRenderer
+
+        assert (
+            HtmlMarkdownRenderer.render(html)
+            == "| a | b |\n| --- | --- |\n| c | d |"
+        )
+
+    def test_blockquote_paragraphs_stay_in_one_quote(self):
+        from pydocstruct.processors.html_markdown import HtmlMarkdownRenderer
+
+        html = (
+            "<blockquote><p>one</p><p>two</p><blockquote><p>inner</p></blockquote>"
+            "<p>three</p></blockquote><p>after</p>"
+        )
+        assert (
+            HtmlMarkdownRenderer.render(html)
+            == "> one\n>\n> two\n>\n> > inner\n>\n> three\n\nafter"
+        )
+
+    def test_split_by_headings_streams_sections(self):
+        from pydocstruct.processors.html_markdown import HtmlMarkdownRenderer
+
+        renderer = HtmlMarkdownRenderer(split_by_headings=True)
+        renderer.feed("<h1 id='a'>One</h1><p>first</p><h2>Two</h2>")
+        finished = renderer.pop_sections()
+        assert [s.content for s in finished] == ["# One\n\nfirst"]
+        assert finished[0].anchor_id == "a"
+        renderer.feed("<p>second</p>")
+        renderer.close()
+        [last] = renderer.pop_sections()
+        assert last.content == "## Two\n\nsecond"
+        assert last.header_path == "One > Two"
+
 
 class TestMetadataExtractor:
     def test_extract_returns_filename(self, tmp_path):
         from pydocstruct.processors.metadata_extractor import MetadataExtractor
+
         f = tmp_path / "sample.txt"
         f.write_text("hello", encoding="utf-8")
         meta = MetadataExtractor.extract(f)
@@ -187,6 +666,7 @@ class TestMetadataExtractor:
 
     def test_extract_returns_extension(self, tmp_path):
         from pydocstruct.processors.metadata_extractor import MetadataExtractor
+
         f = tmp_path / "sample.txt"
         f.write_text("hello", encoding="utf-8")
         meta = MetadataExtractor.extract(f)
@@ -194,6 +674,7 @@ class TestMetadataExtractor:
 
     def test_extract_returns_positive_file_size(self, tmp_path):
         from pydocstruct.processors.metadata_extractor import MetadataExtractor
+
         f = tmp_path / "sample.txt"
         f.write_text("hello", encoding="utf-8")
         meta = MetadataExtractor.extract(f)
@@ -201,6 +682,7 @@ class TestMetadataExtractor:
 
     def test_extract_returns_timestamps(self, tmp_path):
         from pydocstruct.processors.metadata_extractor import MetadataExtractor
+
         f = tmp_path / "sample.txt"
         f.write_text("hello", encoding="utf-8")
         meta = MetadataExtractor.extract(f)
@@ -209,6 +691,7 @@ class TestMetadataExtractor:
 
     def test_extract_returns_abs_path(self, tmp_path):
         from pydocstruct.processors.metadata_extractor import MetadataExtractor
+
         f = tmp_path / "sample.txt"
         f.write_text("hello", encoding="utf-8")
         meta = MetadataExtractor.extract(f)
@@ -217,5 +700,76 @@ class TestMetadataExtractor:
 
     def test_extract_returns_empty_dict_for_nonexistent_file(self):
         from pydocstruct.processors.metadata_extractor import MetadataExtractor
+
         meta = MetadataExtractor.extract("/nonexistent/path/file.txt")
         assert meta == {}
+
+
+class TestProcessDocuments:
+    @staticmethod
+    def _docs():
+        from pydocstruct.core.document import Document
+
+        return [
+            Document(
+                content=f"  doc {i}  mail u{i}@example.com  ",
+                metadata={"i": i},
+                source=f"{i}.txt",
+            )
+            for i in range(20)
+        ]
+
+    def test_pii_redactor_process_documents(self):
+        from pydocstruct.processors.pii_redactor import PiiRedactor
+
+        docs = self._docs()
+        result = PiiRedactor.process_documents(docs)
+        assert [d.metadata["i"] for d in result] == list(range(20))
+        assert all("@" not in d.content for d in result)
+        assert all(
+            d.metadata["processors"] == ["PiiRedactor.redact"] for d in result
+        )
+        assert docs[0].content.strip().endswith("u0@example.com")
+
+    def test_text_cleaner_process_documents(self):
+        from pydocstruct.processors.text_cleaner import TextCleaner
+
+        result = TextCleaner.process_documents(
+            self._docs(), remove_emails=True
+        )
+        assert result[3].content.startswith("doc 3 mail")
+        assert "@" not in result[3].content
+        assert result[3].source == "3.txt"
+
+    def test_html_cleaner_process_documents(self):
+        from pydocstruct.core.document import Document
+        from pydocstruct.processors.html_cleaner import HtmlNoiseCleaner
+
+        docs = [Document(content="<nav>menu</nav><p>Body</p>")]
+        [result] = HtmlNoiseCleaner.process_documents(docs)
+        assert result.content == "Body"
+
+    def test_chained_processors_are_recorded_in_order(self):
+        from pydocstruct.processors import process_documents
+        from pydocstruct.processors.pii_redactor import PiiRedactor
+        from pydocstruct.processors.text_cleaner import TextCleaner
+
+        result = process_documents(
+            self._docs(),
+            [TextCleaner.normalize_whitespace, PiiRedactor.redact],
+        )
+        assert result[0].content == "doc 0 mail [REDACTED]"
+        assert result[0].metadata["processors"] == [
+            "TextCleaner.normalize_whitespace",
+            "PiiRedactor.redact",
+        ]
+
+    def test_process_pool_matches_serial_result(self):
+        from pydocstruct.processors.pii_redactor import PiiRedactor
+
+        serial = PiiRedactor.process_documents(self._docs())
+        parallel = PiiRedactor.process_documents(
+            self._docs(), num_workers=2, batch_size=7
+        )
+        assert [d.content for d in parallel] == [d.content for d in serial]
+        assert [d.metadata["i"] for d in parallel] == list(range(20))